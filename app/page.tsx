@@ -5,13 +5,13 @@ import MetricCard from '@/components/MetricCard';
 import Header from '@/components/Header';
 import AbsurdityScore from '@/components/AbsurdityScore';
 import MetricDetail from '@/components/MetricDetail';
-import { getAllMetricsWithLabels, getLatestUpdateDate } from '@/lib/metricDetailData';
+import { getAllMetricSummariesWithLabels, getLatestUpdateDate } from '@/lib/metricBundles';
 
 const truncate = (s: string, n = 50) => s.length > n ? s.slice(0, n) + '..' : s;
 
 export default function Home() {
   const [selectedMetric, setSelectedMetric] = useState<string | null>(null);
-  const metricsWithLabels = getAllMetricsWithLabels();
+  const metricsWithLabels = getAllMetricSummariesWithLabels();
   const updateDate = getLatestUpdateDate();
 
   return (
@@ -26,7 +26,7 @@ export default function Home() {
 
       {selectedMetric && metricsWithLabels[selectedMetric] && (
         <MetricDetail
-          data={metricsWithLabels[selectedMetric]}
+          slug={metricsWithLabels[selectedMetric].slug}
           onClose={() => setSelectedMetric(null)}
         />
       )}
@@ -77,7 +77,7 @@ export default function Home() {
                   source3: metric.dataSources[2] ? truncate(metric.dataSources[2]) : ""
                 }}
                 onClick={() => setSelectedMetric(name)}
-                entryCount={metric.levelDistribution.total}
+                entryCount={metric.entryCount}
                 lastUpdated={metric.lastUpdated}
               />
             </div>
@@ -1,6 +1,7 @@
 import type { Metadata } from 'next';
 import Link from 'next/link';
 import { metricDetails, getLatestUpdateDate } from '@/lib/metricDetailData';
+import { pipelineStatus } from '@/lib/pipelineStatus';
 import { SITE_URL } from '@/lib/siteConfig';
 
 export const metadata: Metadata = {
@@ -16,7 +17,8 @@ export const metadata: Metadata = {
   },
 };
 
-function getDaysSince(dateStr: string): number {
+function getDaysSince(dateStr: string | null): number {
+  if (!dateStr) return -1;
   const date = new Date(dateStr);
   if (isNaN(date.getTime())) return -1;
   const now = new Date();
@@ -39,6 +41,11 @@ function getFreshnessLabel(days: number): string {
   return `${days} DAYS AGO (OUTDATED)`;
 }
 
+function formatDuration(seconds: number): string {
+  if (seconds < 60) return `${Math.round(seconds)}S`;
+  return `${Math.floor(seconds / 60)}M ${Math.round(seconds % 60)}S`;
+}
+
 export default function Status() {
   const updateDate = getLatestUpdateDate();
   const metrics = Object.entries(metricDetails);
@@ -48,6 +55,11 @@ export default function Status() {
     0
   );
 
+  const collectorPlatforms = Object.entries(pipelineStatus.platforms)
+    .sort((a, b) => a[0].localeCompare(b[0]));
+  const failingRuns = Object.values(pipelineStatus.collectors)
+    .filter(run => run.status !== 'ok');
+
   // Calculate platform health across all metrics
   const platformStats: Record<string, { collected: number; target: number }> = {};
   for (const [, metric] of metrics) {
@@ -132,6 +144,42 @@ export default function Status() {
           </div>
         </div>
 
+        {/* Collector Runs (from the pipeline run catalog) */}
+        <div className="bg-white border-4 border-black p-8 mb-8">
+          <h2 className="text-3xl font-black text-black mb-6 uppercase">Collector Runs</h2>
+          {collectorPlatforms.length === 0 ? (
+            <p className="font-bold text-black mono text-sm">NO COLLECTOR RUNS RECORDED YET</p>
+          ) : (
+            <div className="space-y-4">
+              {collectorPlatforms.map(([platform, stats]) => {
+                const days = getDaysSince(stats.last_success);
+                return (
+                  <div key={platform} className="border-4 border-black p-4">
+                    <div className="flex flex-col md:flex-row md:justify-between gap-2">
+                      <span className="font-black text-black mono">{platform.toUpperCase()}</span>
+                      <span className={`font-black mono text-sm ${getFreshnessClass(days)}`}>
+                        LAST SUCCESS: {getFreshnessLabel(days)}
+                      </span>
+                    </div>
+                    <div className="text-sm font-bold mono text-black mt-2">
+                      FILES: {stats.files} | ROWS: {stats.rows.toLocaleString()} | API CALLS: {stats.api_calls.toLocaleString()} | DURATION: {formatDuration(stats.duration_s)} | FAILURES: {stats.failures}/{stats.collectors}
+                    </div>
+                  </div>
+                );
+              })}
+              {failingRuns.length > 0 && (
+                <div className="flex flex-wrap gap-3">
+                  {failingRuns.map(run => (
+                    <span key={run.collector} className="border-2 border-red-600 text-red-700 px-3 py-1 font-black mono text-xs">
+                      {run.collector}: {run.status.toUpperCase()}{run.error ? ` (${run.error})` : ''}
+                    </span>
+                  ))}
+                </div>
+              )}
+            </div>
+          )}
+        </div>
+
         {/* Per-Metric Status */}
         <div className="mb-8">
           <h2 className="text-3xl font-black text-white mb-6 uppercase border-b-4 border-white pb-2">
@@ -1,7 +1,7 @@
 'use client';
 
 import { useEffect, useState } from 'react';
-import { calculateOverallScore, getOverallLabel, getLatestUpdateDate } from '@/lib/metricDetailData';
+import { calculateOverallScore, getOverallLabel, getLatestUpdateDate } from '@/lib/metricBundles';
 
 export default function AbsurdityScore() {
   const absurdityScore = calculateOverallScore();
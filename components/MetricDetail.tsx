@@ -1,16 +1,30 @@
 'use client';
 
-import { useEffect, useRef, useCallback } from 'react';
+import { useEffect, useRef, useCallback, useState } from 'react';
 import type { MetricDetailData } from '@/lib/metricDetailData';
+import { loadMetricDetail } from '@/lib/metricBundles';
 
 interface MetricDetailProps {
-  data: MetricDetailData;
+  slug: string;
   onClose: () => void;
 }
 
-export default function MetricDetail({ data, onClose }: MetricDetailProps) {
+export default function MetricDetail({ slug, onClose }: MetricDetailProps) {
   const modalRef = useRef<HTMLDivElement>(null);
   const closeButtonRef = useRef<HTMLButtonElement>(null);
+  const [data, setData] = useState<MetricDetailData | null>(null);
+  const [loadFailed, setLoadFailed] = useState(false);
+
+  // Detail bundles are fetched on demand so the landing page only ships summaries
+  useEffect(() => {
+    let cancelled = false;
+    setData(null);
+    setLoadFailed(false);
+    loadMetricDetail(slug)
+      .then((detail) => { if (!cancelled) setData(detail); })
+      .catch(() => { if (!cancelled) setLoadFailed(true); });
+    return () => { cancelled = true; };
+  }, [slug]);
 
   // Focus trap: keep Tab cycling within the modal
   const handleKeyDown = useCallback((e: KeyboardEvent) => {
@@ -41,13 +55,17 @@ export default function MetricDetail({ data, onClose }: MetricDetailProps) {
     }
   }, [onClose]);
 
-  // Set up keyboard handling and initial focus
+  // Set up keyboard handling
   useEffect(() => {
     window.addEventListener('keydown', handleKeyDown);
-    closeButtonRef.current?.focus();
     return () => window.removeEventListener('keydown', handleKeyDown);
   }, [handleKeyDown]);
 
+  // Initial focus (again once the details have loaded and re-rendered)
+  useEffect(() => {
+    closeButtonRef.current?.focus();
+  }, [data]);
+
   // Prevent body scroll when modal is open
   useEffect(() => {
     document.body.style.overflow = 'hidden';
@@ -56,6 +74,33 @@ export default function MetricDetail({ data, onClose }: MetricDetailProps) {
     };
   }, []);
 
+  if (!data) {
+    return (
+      <div
+        className="fixed inset-0 bg-black/95 z-50 overflow-y-auto"
+        role="dialog"
+        aria-modal="true"
+        aria-label="Metric details"
+        aria-busy={!loadFailed}
+        onClick={onClose}
+      >
+        <div ref={modalRef} className="container mx-auto px-6 py-12 max-w-5xl">
+          <button
+            ref={closeButtonRef}
+            onClick={onClose}
+            className="fixed top-8 right-8 text-white hover:text-red-600 transition-colors text-4xl font-black z-50"
+            aria-label="Close metric details"
+          >
+            ×
+          </button>
+          <p className="text-white font-black mono text-center mt-24">
+            {loadFailed ? 'COULD NOT LOAD METRIC DETAILS' : 'LOADING...'}
+          </p>
+        </div>
+      </div>
+    );
+  }
+
   const level1Percent = (data.levelDistribution.level1 / data.levelDistribution.total * 100).toFixed(1);
   const level2Percent = (data.levelDistribution.level2 / data.levelDistribution.total * 100).toFixed(1);
   const level3Percent = (data.levelDistribution.level3 / data.levelDistribution.total * 100).toFixed(1);
@@ -185,6 +230,12 @@ export default function MetricDetail({ data, onClose }: MetricDetailProps) {
             <div className="font-black text-black mono text-sm">
               TOTAL DATA POINTS: {data.levelDistribution.total}
             </div>
+            {data.commentSignal && (
+              <div className="font-bold text-black mono text-sm mt-2">
+                YOUTUBE COMMENTS (NOT IN SCORE): {data.commentSignal.comments} sampled,{' '}
+                {data.commentSignal.crisisRatio.toFixed(1)}% crisis ratio, {data.commentSignal.level3} at level 3
+              </div>
+            )}
           </div>
         </div>
 
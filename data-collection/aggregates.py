@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Materialized per-metric aggregates of collected data.
+
+Every collected CSV is reduced once, when it lands, to a handful of rows keyed
+by (metric, platform, week, level) holding:
+
+    count           number of entries at that level
+    engagement      summed raw engagement (views, score, points, likes)
+    log_engagement  summed log10(engagement + 1), the scoring weight
+
+Scorers and dashboards read these few hundred aggregate rows instead of
+re-reading tens of thousands of raw rows. Aggregates live in one JSON file per
+metric under collected-data/aggregates/, plus a manifest of ingested files so
+updates are incremental: only files not seen before are read. The same pass
+refreshes the sample candidate pool (sample_pool.py). A file that is deleted,
+or rewritten below MIN_ROWS, is taken back out: its week falls back to the
+next newest file of that week, and the sample pool to the newest remaining
+file, as if it had never been ingested.
+
+Within a week the newest file with at least MIN_ROWS rows wins, the same rule
+data_utils.get_latest_file applies, so the latest week of a platform matches
+what the raw-file scorers used to pick.
+
+YouTube and TikTok videos use their newest view count from the engagement log
+(engagement_history.py) when it was observed after the snapshot. Their
+entries list the file's video IDs, and the manifest records the log's file
+sizes: a refresh that finds the log grown reads only the appended rows and
+re-summarizes just the entries holding one of those videos.
+
+Usage:
+    python aggregates.py              # ingest any new files
+    python aggregates.py --rebuild    # drop aggregates and sample pool, re-ingest everything
+"""
+
+import csv
+import glob
+import json
+import math
+import os
+import re
+import shutil
+import sys
+
+import pipeline_status
+import sample_pool
+from data_utils import file_digest, get_engagement_value, get_snapshot_time, read_json, write_json
+from engagement_history import latest_observations, log_sizes, observed_since
+from partition_index import read_partition
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(SCRIPT_DIR, 'collected-data')
+AGGREGATES_DIR = os.path.join(DATA_DIR, 'aggregates')
+MANIFEST_FILE = os.path.join(AGGREGATES_DIR, '_manifest.json')
+
+MIN_ROWS = 5
+
+PLATFORMS = ('youtube', 'reddit', 'tiktok', 'hackernews', 'cfpb', 'bluesky', 'youtube_comments')
+
+# Platforms behind the social score. Sampled comments are aggregated but
+# reported as their own signal: many comments share one video, so scoring
+# each as an item would let one popular video count N times.
+SCORED_PLATFORMS = ('youtube', 'reddit', 'tiktok', 'hackernews', 'cfpb', 'bluesky')
+
+# Platforms whose videos refresh_youtube_engagement.py re-fetches
+REFRESHED_PLATFORMS = ('youtube', 'tiktok')
+
+# tiktok_youtube_<ts>.csv holds every metric; the rest are <slug>_<platform>_<ts>.csv
+TIKTOK_FILE_RE = re.compile(r'^tiktok_youtube_\d{8}_\d{6}\.csv$')
+METRIC_FILE_RE = re.compile(
+    r'^(?P<slug>[a-z_]+?)_(?P<platform>youtube|reddit|hackernews|cfpb|bluesky|youtube_comments)_\d{8}_\d{6}\.csv$'
+)
+
+with open(os.path.join(SCRIPT_DIR, 'config.json'), 'r') as f:
+    METRIC_SLUGS = [m['slug'] for m in json.load(f)['metrics']]
+
+
+def _week_of(filename):
+    """ISO week label (e.g. 2026-W18) for a snapshot filename."""
+    year, week, _ = get_snapshot_time(filename).isocalendar()
+    return f'{year}-W{week:02d}'
+
+
+def _metric_path(slug):
+    return os.path.join(AGGREGATES_DIR, f'{slug}.json')
+
+
+def load_metric(slug):
+    """Load one metric's aggregates: {'platforms': {platform: {week: entry}}}."""
+    return read_json(_metric_path(slug), {'metric': slug, 'platforms': {}})
+
+
+def classify_file(filename):
+    """Return the platform of a collected file name, or None if not aggregated."""
+    if TIKTOK_FILE_RE.match(filename):
+        return 'tiktok'
+    match = METRIC_FILE_RE.match(filename)
+    if match and match.group('slug') in METRIC_SLUGS:
+        return match.group('platform')
+    return None
+
+
+# Engagement log, read once per process (see _refreshed_views)
+_observations = None
+
+
+def _refreshed_views(filename, platform):
+    """Views from the engagement log observed after a snapshot: {video_id: views}."""
+    global _observations
+    if platform not in REFRESHED_PLATFORMS:
+        return {}
+    if _observations is None:
+        _observations = latest_observations()
+    taken = get_snapshot_time(filename)
+    return {video_id: views for video_id, (observed_at, views) in _observations.items()
+            if observed_at > taken}
+
+
+def _summarize_rows(rows, refreshed=None):
+    """Reduce rows to per-level count / engagement / log-engagement sums.
+
+    `refreshed` maps video IDs to newer view counts that replace the row's.
+    """
+    levels = {}
+    for row in rows:
+        category = row.get('category', '') or ''
+        engagement = get_engagement_value(row)
+        if refreshed and row.get('video_id') in refreshed:
+            engagement = max(refreshed[row['video_id']], 1)
+        level = levels.setdefault(category, {'count': 0, 'engagement': 0, 'log_engagement': 0.0})
+        level['count'] += 1
+        level['engagement'] += engagement
+        level['log_engagement'] += math.log10(engagement + 1)
+    for level in levels.values():
+        level['log_engagement'] = round(level['log_engagement'], 6)
+    return levels
+
+
+def _video_ids(rows):
+    """Sorted video IDs of a file's rows, so a log refresh can find the entries it touches."""
+    return sorted({row['video_id'] for row in rows if row.get('video_id')})
+
+
+def _store_entry(slug, platform, filename, rows):
+    """Place a file's summary in its metric/platform/week slot if it is the newest."""
+    aggregate = load_metric(slug)
+    weeks = aggregate['platforms'].setdefault(platform, {})
+    week = _week_of(filename)
+    current = weeks.get(week)
+    # An equal name is the same file rewritten in place (Reddit dedup), so replace it
+    if current and current['file'] > filename:
+        return
+    weeks[week] = {'file': filename, 'rows': len(rows),
+                   'levels': _summarize_rows(rows, _refreshed_views(filename, platform))}
+    if platform in REFRESHED_PLATFORMS:
+        weeks[week]['video_ids'] = _video_ids(rows)
+    write_json(_metric_path(slug), aggregate)
+
+
+def apply_engagement(video_ids=None):
+    """Re-summarize YouTube and TikTok entries with the engagement log. Returns entries changed.
+
+    With `video_ids`, only entries holding one of those videos are re-read;
+    entries without a video_ids list (written before it existed) always are.
+    """
+    global _observations
+    _observations = None
+    changed = 0
+    for slug in METRIC_SLUGS:
+        aggregate = load_metric(slug)
+        updated = False
+        for platform in REFRESHED_PLATFORMS:
+            for entry in aggregate['platforms'].get(platform, {}).values():
+                if video_ids is not None and 'video_ids' in entry \
+                        and video_ids.isdisjoint(entry['video_ids']):
+                    continue
+                if not os.path.exists(os.path.join(DATA_DIR, entry['file'])):
+                    continue
+                rows = _metric_rows(entry['file'], slug, platform)
+                levels = _summarize_rows(rows, _refreshed_views(entry['file'], platform))
+                if levels != entry['levels']:
+                    entry['levels'] = levels
+                    updated = True
+                    changed += 1
+                if 'video_ids' not in entry:
+                    entry['video_ids'] = _video_ids(rows)
+                    updated = True
+        if updated:
+            write_json(_metric_path(slug), aggregate)
+    return changed
+
+
+def _file_slugs(filename, platform):
+    """Metrics a collected file holds rows for."""
+    if platform == 'tiktok':
+        return METRIC_SLUGS
+    return [METRIC_FILE_RE.match(filename).group('slug')]
+
+
+def _metric_rows(filename, slug, platform):
+    """Read a collected file's rows for one metric."""
+    path = os.path.join(DATA_DIR, filename)
+    if platform == 'tiktok':
+        # The combined file holds every metric; read only this one's byte ranges
+        return read_partition(path, slug)
+    with open(path, 'r', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def _eligible_files(slug, platform, manifest):
+    """Ingested files with at least MIN_ROWS rows for a metric/platform, newest first."""
+    names = [name for name, seen in manifest['files'].items()
+             if seen.get('rows', 0) >= MIN_ROWS and classify_file(name) == platform
+             and slug in _file_slugs(name, platform)]
+    return sorted(names, reverse=True)
+
+
+def _release_file(filename, platform, manifest):
+    """Take a file out of the aggregates and sample pool, refilling from the manifest.
+
+    Call after the manifest no longer counts the file (deleted, or rewritten
+    below MIN_ROWS).
+    """
+    week = _week_of(filename)
+    for slug in _file_slugs(filename, platform):
+        remaining = _eligible_files(slug, platform, manifest)
+
+        aggregate = load_metric(slug)
+        weeks = aggregate['platforms'].get(platform, {})
+        if weeks.get(week, {}).get('file') == filename:
+            del weeks[week]
+            if not weeks:
+                del aggregate['platforms'][platform]
+            write_json(_metric_path(slug), aggregate)
+            same_week = [name for name in remaining if _week_of(name) == week]
+            if same_week:
+                _store_entry(slug, platform, same_week[0],
+                             _metric_rows(same_week[0], slug, platform))
+
+        if sample_pool.drop_file(slug, platform, filename) and remaining:
+            sample_pool.store_candidates(slug, platform, remaining[0],
+                                         _metric_rows(remaining[0], slug, platform))
+
+
+def ingest_file(path, manifest=None):
+    """Fold one collected file into the aggregates. Returns True if it was read.
+
+    Call this right after a collector writes a file. Files already in the
+    manifest with the same content hash are skipped. A hash rather than size
+    or mtime: an in-place rewrite (Reddit dedup) can keep the size, and a
+    fresh checkout resets mtimes.
+    """
+    filename = os.path.basename(path)
+    platform = classify_file(filename)
+    if platform is None:
+        return False
+
+    save_manifest = manifest is None
+    if manifest is None:
+        manifest = read_json(MANIFEST_FILE, {'files': {}})
+
+    signature = {'size': os.path.getsize(path), 'sha256': file_digest(path)}
+    seen = manifest['files'].get(filename)
+    if seen and seen.get('sha256') == signature['sha256']:
+        return False
+
+    with open(path, 'r', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    signature['rows'] = len(rows)
+    # Credit the file to the collector run that wrote it, if one is being tracked
+    pipeline_status.record_file(filename, len(rows))
+
+    # Files below MIN_ROWS are failed collections; record them so they are
+    # not re-read, but never let them displace real data
+    if len(rows) >= MIN_ROWS:
+        if platform == 'tiktok':
+            by_metric = {slug: [] for slug in METRIC_SLUGS}
+            for row in rows:
+                if row.get('metric', '') in by_metric:
+                    by_metric[row['metric']].append(row)
+            for slug, metric_rows in by_metric.items():
+                _store_entry(slug, platform, filename, metric_rows)
+                sample_pool.store_candidates(slug, platform, filename, metric_rows)
+        else:
+            slug = METRIC_FILE_RE.match(filename).group('slug')
+            _store_entry(slug, platform, filename, rows)
+            sample_pool.store_candidates(slug, platform, filename, rows)
+
+    manifest['files'][filename] = signature
+    if len(rows) < MIN_ROWS and seen:
+        # A rewrite left too few rows; its old summary must not stay in place
+        _release_file(filename, platform, manifest)
+    if save_manifest:
+        write_json(MANIFEST_FILE, manifest)
+    return True
+
+
+def safe_ingest_file(path):
+    """ingest_file for collectors: aggregation problems never fail a collection."""
+    try:
+        ingest_file(path)
+    except Exception as e:
+        print(f"  Warning: could not update aggregates for {os.path.basename(path)}: {e}")
+
+
+def refresh(verbose=False):
+    """Drop deleted files, ingest new ones and apply a grown engagement log. Returns the count read."""
+    global _observations
+    # The engagement log may have grown since this process last read it
+    _observations = None
+    manifest = read_json(MANIFEST_FILE, {'files': {}})
+
+    # Forget every deleted file first, so none is picked to refill another's week
+    deleted = [name for name in manifest['files']
+               if not os.path.exists(os.path.join(DATA_DIR, name))]
+    for name in deleted:
+        del manifest['files'][name]
+    for name in deleted:
+        platform = classify_file(name)
+        if platform is not None:
+            _release_file(name, platform, manifest)
+        if verbose:
+            print(f"  Dropped {name} (deleted)")
+    if deleted:
+        print(f"Dropped {len(deleted)} deleted files from aggregates")
+
+    ingested = 0
+    for path in sorted(glob.glob(os.path.join(DATA_DIR, '*.csv'))):
+        if ingest_file(path, manifest):
+            ingested += 1
+            if verbose:
+                print(f"  Ingested {os.path.basename(path)}")
+
+    sizes = log_sizes()
+    engagement_changed = sizes != manifest.get('engagement', {})
+    if engagement_changed:
+        updated = apply_engagement(observed_since(manifest.get('engagement', {})))
+        manifest['engagement'] = sizes
+        if verbose or updated:
+            print(f"Applied refreshed engagement to {updated} YouTube/TikTok entries")
+
+    if ingested or deleted or engagement_changed:
+        write_json(MANIFEST_FILE, manifest)
+    return ingested
+
+
+def latest_entry(aggregate, platform):
+    """Most recent week's entry for a platform, or None if never collected."""
+    weeks = aggregate['platforms'].get(platform)
+    if not weeks:
+        return None
+    return weeks[max(weeks)]
+
+
+def level_counts(levels):
+    """Collapse category-level sums into L1/L2/L3 entry counts."""
+    counts = {'L1': 0, 'L2': 0, 'L3': 0}
+    for category, level in levels.items():
+        if 'LEVEL_1' in category:
+            counts['L1'] += level['count']
+        elif 'LEVEL_2' in category:
+            counts['L2'] += level['count']
+        elif 'LEVEL_3' in category:
+            counts['L3'] += level['count']
+    return counts
+
+
+def main():
+    if '--rebuild' in sys.argv:
+        for directory in (AGGREGATES_DIR, sample_pool.POOL_DIR):
+            if os.path.isdir(directory):
+                shutil.rmtree(directory)
+
+    print("=" * 70)
+    print("UPDATING MATERIALIZED AGGREGATES")
+    print("=" * 70)
+    ingested = refresh(verbose=True)
+    print(f"\nIngested {ingested} new files")
+
+    for slug in METRIC_SLUGS:
+        aggregate = load_metric(slug)
+        parts = []
+        for platform in PLATFORMS:
+            entry = latest_entry(aggregate, platform)
+            if entry:
+                parts.append(f"{platform}:{entry['rows']}")
+        print(f"  {slug:25} {', '.join(parts) or 'no data'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -14,6 +14,8 @@ import time
 import csv
 import sys
 from datetime import datetime
+from aggregates import safe_ingest_file
+from pipeline_status import count_api_call, track_run
 from content_filters import filter_content
 
 
@@ -256,6 +258,7 @@ def authenticate():
         return None
 
     try:
+        count_api_call('bluesky.auth')
         response = requests.post(
             BLUESKY_SESSION_URL,
             json={"identifier": handle, "password": password},
@@ -285,6 +288,7 @@ def search_bluesky(query, token, limit=100):
     headers = {"Authorization": f"Bearer {token}"}
 
     try:
+        count_api_call('bluesky.search')
         response = requests.get(
             BLUESKY_SEARCH_URL, params=params, headers=headers, timeout=15
         )
@@ -294,6 +298,7 @@ def search_bluesky(query, token, limit=100):
         elif response.status_code == 429:
             print("    Rate limited, waiting 10s...")
             time.sleep(10)
+            count_api_call('bluesky.search')
             response = requests.get(
                 BLUESKY_SEARCH_URL, params=params, headers=headers, timeout=15
             )
@@ -411,6 +416,7 @@ def write_csv(metric_slug, posts):
         writer.writeheader()
         writer.writerows(posts)
 
+    safe_ingest_file(filename)
     return filename
 
 
@@ -481,4 +487,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    with track_run("bluesky-collector", "bluesky"):
+        main()
@@ -1,15 +1,18 @@
 #!/usr/bin/env python3
 """
 Calculate social scores for all metrics using the latest available data.
-Auto-detects the most recent CSV files for each source.
+Reads the latest week per source from the materialized aggregates
+(aggregates.py), ingesting any newly collected CSV files first.
 
 Usage:
     python calculate_all_social_scores.py
+    python calculate_all_social_scores.py --rolling            # last 4 weekly snapshots
+    python calculate_all_social_scores.py --rolling 6 --half-life 3
+    python calculate_all_social_scores.py --workers 4        # score metrics in 4 processes
 """
 
-import csv
+import argparse
 import json
-import math
 import os
 from datetime import datetime
 
@@ -17,7 +20,9 @@ from datetime import datetime
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 os.chdir(SCRIPT_DIR)
 
-from data_utils import count_data_rows, get_latest_file as _get_latest_file
+import aggregates
+from data_utils import load_fred_scores, map_metrics
+from rolling_scores import DEFAULT_HALF_LIFE_WEEKS, DEFAULT_WEEKS, rolling_social_score
 
 # Load centralized config
 with open('config.json', 'r') as f:
@@ -29,111 +34,43 @@ OFFICIAL_WEIGHT = CONFIG['formula']['official_weight']
 SOCIAL_WEIGHT = CONFIG['formula']['social_weight']
 
 
-def find_latest_file(pattern, min_rows=5):
-    """Find the most recent file matching a glob pattern that has real data."""
-    return _get_latest_file(pattern, min_rows=min_rows, verbose=True)
+# Display names in report order; TikTok rows come from the combined
+# tiktok_youtube file, so they are listed last
+SOURCE_NAMES = (
+    ('youtube', 'YouTube'),
+    ('reddit', 'Reddit'),
+    ('hackernews', 'Hacker News'),
+    ('cfpb', 'CFPB'),
+    ('bluesky', 'Bluesky'),
+    ('tiktok', 'TikTok'),
+)
 
 
-def find_metric_files(slug):
-    """Find all latest data files for a metric across all sources."""
-    files = []
-    sources_found = []
+def find_metric_entries(slug):
+    """Latest aggregated week per source for a metric, as (source name, entry) pairs."""
+    aggregate = aggregates.load_metric(slug)
+    entries = []
+    for platform, source_name in SOURCE_NAMES:
+        entry = aggregates.latest_entry(aggregate, platform)
+        if entry and entry['rows']:
+            entries.append((source_name, entry))
+    return entries
 
-    # YouTube data
-    youtube_file = find_latest_file(f'collected-data/{slug}_youtube_*.csv')
-    if youtube_file:
-        files.append(youtube_file)
-        sources_found.append('YouTube')
 
-    # Reddit data
-    reddit_file = find_latest_file(f'collected-data/{slug}_reddit_*.csv')
-    if reddit_file:
-        files.append(reddit_file)
-        sources_found.append('Reddit')
-
-    # Hacker News data
-    hn_file = find_latest_file(f'collected-data/{slug}_hackernews_*.csv')
-    if hn_file:
-        files.append(hn_file)
-        sources_found.append('Hacker News')
-
-    # CFPB complaint data
-    cfpb_file = find_latest_file(f'collected-data/{slug}_cfpb_*.csv')
-    if cfpb_file:
-        files.append(cfpb_file)
-        sources_found.append('CFPB')
-
-    # Bluesky data
-    bluesky_file = find_latest_file(f'collected-data/{slug}_bluesky_*.csv')
-    if bluesky_file:
-        files.append(bluesky_file)
-        sources_found.append('Bluesky')
-
-    # TikTok data (collected via YouTube compilations)
-    # TikTok files contain all metrics, so we'll handle them separately
-
-    return files, sources_found
-
-
-def find_tiktok_data(metric_slug):
-    """Extract TikTok data for a specific metric from the combined file."""
-    tiktok_file = find_latest_file('collected-data/tiktok_youtube_*.csv')
-
-    if not tiktok_file:
-        return []
-
-    rows = []
-    try:
-        with open(tiktok_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row.get('metric', '') == metric_slug:
-                    rows.append(row)
-    except Exception as e:
-        print(f"  Error reading TikTok data: {e}")
-
-    return rows
-
-
-def calculate_score_from_rows(rows):
-    """Calculate engagement-weighted severity score from data rows."""
+def calculate_score_from_levels(level_sums):
+    """Calculate engagement-weighted severity score from per-category aggregates."""
     total_weighted_score = 0
     total_engagement = 0
     level_counts = {'L1': 0, 'L2': 0, 'L3': 0}
 
-    for row in rows:
-        category = row.get('category', '')
-
-        # Get engagement value (views for YouTube/TikTok, score for Reddit,
-        # points for HN, like_count for Bluesky)
-        view_count = 0
-        for field in ['view_count', 'views', 'score', 'points', 'like_count']:
-            try:
-                view_count = int(row.get(field, 0) or 0)
-                if view_count > 0:
-                    break
-            except (ValueError, TypeError):
-                continue
-
-        engagement_value = max(view_count, 1)
-
-        # Count levels
-        if 'LEVEL_1' in category:
-            level_counts['L1'] += 1
-        elif 'LEVEL_2' in category:
-            level_counts['L2'] += 1
-        elif 'LEVEL_3' in category:
-            level_counts['L3'] += 1
-
-        # Get severity weight
-        severity = SEVERITY_WEIGHTS.get(category, 0.33)
-
-        # Calculate engagement weight (logarithmic)
-        engagement = math.log10(engagement_value + 1)
-
-        # Add contribution
-        total_weighted_score += severity * engagement
-        total_engagement += engagement
+    for levels in level_sums:
+        for category, level in levels.items():
+            # Severity weight times summed log10 engagement of the category
+            severity = SEVERITY_WEIGHTS.get(category, 0.33)
+            total_weighted_score += severity * level['log_engagement']
+            total_engagement += level['log_engagement']
+        for key, count in aggregates.level_counts(levels).items():
+            level_counts[key] += count
 
     # Calculate final score (0-100 scale)
     if total_engagement == 0:
@@ -143,22 +80,16 @@ def calculate_score_from_rows(rows):
     return social_score, level_counts
 
 
-def load_fred_scores():
-    """Load FRED official scores if the file exists."""
-    fred_file = 'collected-data/official_scores.json'
-    if not os.path.exists(fred_file):
-        return {}
-    try:
-        with open(fred_file, 'r') as f:
-            data = json.load(f)
-        scores = {}
-        for slug, info in data.get('scores', {}).items():
-            if info.get('source') == 'fred':
-                scores[slug] = info['score']
-        return scores
-    except Exception as e:
-        print(f"  Warning: Could not load FRED scores: {e}")
-        return {}
+def get_official_score(metric, fred_scores=None):
+    """Use the FRED official score when available, otherwise the config fallback."""
+    slug = metric['slug']
+    if fred_scores and slug in fred_scores:
+        official_score = fred_scores[slug]
+        print(f"  Official Score: {official_score:.2f} (from FRED)")
+    else:
+        official_score = metric['official_score']
+        print(f"  Official Score: {official_score:.2f} (from config)")
+    return official_score
 
 
 def calculate_metric_score(metric, fred_scores=None):
@@ -169,53 +100,38 @@ def calculate_metric_score(metric, fred_scores=None):
     print(f"\n{name}:")
     print("-" * 40)
 
-    all_rows = []
-
-    # Find YouTube, Reddit, HN, CFPB, and Bluesky files
-    files, sources = find_metric_files(slug)
-
-    for csv_file in files:
-        try:
-            with open(csv_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
-                all_rows.extend(rows)
-                filename = os.path.basename(csv_file)
-                print(f"  {filename}: {len(rows)} entries")
-        except Exception as e:
-            print(f"  Error reading {csv_file}: {e}")
-
-    # Add TikTok data
-    tiktok_rows = find_tiktok_data(slug)
-    if tiktok_rows:
-        all_rows.extend(tiktok_rows)
-        print(f"  TikTok (via YouTube): {len(tiktok_rows)} entries")
-        sources.append('TikTok')
-
-    if not all_rows:
+    entries = find_metric_entries(slug)
+    for source_name, entry in entries:
+        if source_name == 'TikTok':
+            print(f"  TikTok (via YouTube): {entry['rows']} entries")
+        else:
+            print(f"  {entry['file']}: {entry['rows']} entries")
+
+    if not entries:
         print(f"  WARNING: No data found for {name}")
         return None
 
     # Calculate scores
-    social_score, levels = calculate_score_from_rows(all_rows)
-
-    # Use FRED official score when available, otherwise config fallback
-    official_score = metric['official_score']
-    if fred_scores and slug in fred_scores:
-        official_score = fred_scores[slug]
-        print(f"  Official Score: {official_score:.2f} (from FRED)")
-    else:
-        print(f"  Official Score: {official_score:.2f} (from config)")
+    social_score, levels = calculate_score_from_levels(entry['levels'] for _, entry in entries)
+    sources = [source_name for source_name, _ in entries]
 
+    official_score = get_official_score(metric, fred_scores)
     final_score = (official_score * OFFICIAL_WEIGHT) + (social_score * SOCIAL_WEIGHT)
 
-    total = len(all_rows)
+    total = sum(entry['rows'] for _, entry in entries)
     print(f"  Sources: {', '.join(sources)}")
     print(f"  Total entries: {total}")
     print(f"  Distribution: L1={levels['L1']}, L2={levels['L2']}, L3={levels['L3']}")
     print(f"  Social Score: {social_score:.2f}")
     print(f"  Final Score: {final_score:.2f}")
 
+    # Sampled comments are a separate signal, never part of the score
+    comments = aggregates.latest_entry(aggregates.load_metric(slug), 'youtube_comments')
+    if comments and comments['rows']:
+        comment_ratio, _ = calculate_score_from_levels([comments['levels']])
+        print(f"  YouTube Comments (not scored): {comments['rows']} comments, "
+              f"crisis ratio {comment_ratio:.2f}")
+
     return {
         'name': name,
         'slug': slug,
@@ -228,10 +144,80 @@ def calculate_metric_score(metric, fred_scores=None):
     }
 
 
+def calculate_rolling_metric_score(metric, fred_scores=None, weeks=DEFAULT_WEEKS,
+                                   half_life_weeks=DEFAULT_HALF_LIFE_WEEKS):
+    """Calculate a smoothed score from the last `weeks` weekly snapshots per source."""
+    slug = metric['slug']
+    name = metric['name']
+
+    print(f"\n{name}:")
+    print("-" * 40)
+
+    sources = {
+        'YouTube': (f'collected-data/{slug}_youtube_[0-9]*.csv', None),
+        'Reddit': (f'collected-data/{slug}_reddit_*.csv', None),
+        'Hacker News': (f'collected-data/{slug}_hackernews_*.csv', None),
+        'CFPB': (f'collected-data/{slug}_cfpb_*.csv', None),
+        'Bluesky': (f'collected-data/{slug}_bluesky_*.csv', None),
+        'TikTok': ('collected-data/tiktok_youtube_*.csv', slug),
+    }
+
+    social_score, levels, per_source = rolling_social_score(
+        sources, SEVERITY_WEIGHTS, weeks=weeks, half_life_weeks=half_life_weeks,
+    )
+
+    if not per_source:
+        print(f"  WARNING: No data found for {name}")
+        return None
+
+    for source_name, info in per_source.items():
+        print(f"  {source_name}: {info['items']} unique items from {len(info['files'])} weekly snapshots")
+
+    official_score = get_official_score(metric, fred_scores)
+    final_score = (official_score * OFFICIAL_WEIGHT) + (social_score * SOCIAL_WEIGHT)
+
+    total = sum(info['items'] for info in per_source.values())
+    print(f"  Total unique entries: {total}")
+    print(f"  Distribution: L1={levels['L1']}, L2={levels['L2']}, L3={levels['L3']}")
+    print(f"  Social Score (rolling): {social_score:.2f}")
+    print(f"  Final Score: {final_score:.2f}")
+
+    return {
+        'name': name,
+        'slug': slug,
+        'official': official_score,
+        'social': social_score,
+        'final': final_score,
+        'total': total,
+        'levels': levels,
+        'sources': list(per_source.keys())
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Calculate social scores for all metrics.')
+    parser.add_argument('--rolling', nargs='?', type=int, const=DEFAULT_WEEKS, default=None,
+                        metavar='WEEKS',
+                        help=f'score the last WEEKS weekly snapshots per source (default {DEFAULT_WEEKS}) '
+                             'with time decay, instead of only the latest file')
+    parser.add_argument('--half-life', type=float, default=DEFAULT_HALF_LIFE_WEEKS,
+                        metavar='WEEKS',
+                        help=f'decay half-life in weeks for --rolling (default {DEFAULT_HALF_LIFE_WEEKS})')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='processes to shard metric scoring across (default 1: scoring '
+                             'eight metrics from aggregates is faster than starting a pool)')
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
+
     print("=" * 80)
     print("CALCULATING ALL SOCIAL SCORES")
-    print("Auto-detecting latest data files")
+    if args.rolling:
+        print(f"Rolling mode: last {args.rolling} weekly snapshots, half-life {args.half_life} weeks")
+    else:
+        print("Latest week per source from materialized aggregates")
     print(f"Run time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 80)
 
@@ -242,16 +228,24 @@ def main():
     else:
         print("\nNo FRED official scores found, using config.json fallbacks.")
 
-    results = []
+    if not args.rolling:
+        ingested = aggregates.refresh()
+        if ingested:
+            print(f"Aggregated {ingested} new data files")
 
-    for metric in METRICS:
-        result = calculate_metric_score(metric, fred_scores)
-        if result:
-            results.append(result)
+    # Each metric is scored independently from its own data, so metrics are
+    # sharded across worker processes and merged back in config order
+    if args.rolling:
+        jobs = [(metric, fred_scores, args.rolling, args.half_life) for metric in METRICS]
+        results = map_metrics(calculate_rolling_metric_score, jobs, args.workers)
+    else:
+        jobs = [(metric, fred_scores) for metric in METRICS]
+        results = map_metrics(calculate_metric_score, jobs, args.workers)
+    results = [result for result in results if result]
 
     # Summary
     print("\n" + "=" * 80)
-    print("SUMMARY FOR UPDATING metricDetailData.ts")
+    print("SUMMARY FOR UPDATING metricData.generated.json")
     print("=" * 80)
     print()
 
@@ -263,21 +257,24 @@ def main():
     print()
     print(f"Total data entries across all metrics: {total_entries}")
 
-    # Show which files were used
+    # Show which files were used (rolling mode reports its snapshots per metric above)
+    if args.rolling:
+        return
+
     print("\n" + "=" * 80)
     print("DATA FILES USED")
     print("=" * 80)
 
     for metric in METRICS:
-        files, _ = find_metric_files(metric['slug'])
         print(f"\n{metric['name']}:")
-        for f in files:
-            print(f"  {os.path.basename(f)}")
+        for source_name, entry in find_metric_entries(metric['slug']):
+            if source_name != 'TikTok':
+                print(f"  {entry['file']}")
 
-    tiktok_file = find_latest_file('collected-data/tiktok_youtube_*.csv')
-    if tiktok_file:
+    tiktok_entry = aggregates.latest_entry(aggregates.load_metric(METRICS[0]['slug']), 'tiktok')
+    if tiktok_entry:
         print(f"\nTikTok (all metrics):")
-        print(f"  {os.path.basename(tiktok_file)}")
+        print(f"  {tiktok_entry['file']}")
 
     fred_file = 'collected-data/official_scores.json'
     if os.path.exists(fred_file):
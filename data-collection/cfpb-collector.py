@@ -16,6 +16,8 @@ import csv
 import time
 import requests
 from datetime import datetime, timedelta
+from aggregates import safe_ingest_file
+from pipeline_status import count_api_call, track_run
 
 # Change to the script's directory so collected-data/ paths resolve correctly
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -137,6 +139,7 @@ def fetch_complaints(params_override):
     params.update(params_override)
 
     try:
+        count_api_call('cfpb.complaints')
         response = requests.get(API_BASE, params=params, timeout=30)
 
         if response.status_code == 200:
@@ -152,6 +155,7 @@ def fetch_complaints(params_override):
         elif response.status_code == 429:
             print("  Rate limited. Waiting 10 seconds...")
             time.sleep(10)
+            count_api_call('cfpb.complaints')
             response = requests.get(API_BASE, params=params, timeout=30)
             if response.status_code == 200:
                 data = response.json()
@@ -307,6 +311,7 @@ def write_csv(rows, slug, timestamp):
         writer.writeheader()
         writer.writerows(rows)
 
+    safe_ingest_file(filename)
     return filename
 
 
@@ -355,4 +360,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    with track_run("cfpb-collector", "cfpb"):
+        main()
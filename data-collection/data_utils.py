@@ -1,12 +1,42 @@
 """Shared utilities for data collection scripts."""
 
+import contextlib
 import csv
 import glob
+import hashlib
+import html
+import io
+import json
 import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from partition_index import indexed_row_count
+
+# Collected files are named <prefix>_YYYYMMDD_HHMMSS.csv
+SNAPSHOT_TIMESTAMP_RE = re.compile(r'_(\d{8}_\d{6})\.csv$')
+
+# Engagement columns across sources (views for YouTube/TikTok, score for
+# Reddit, points for HN, like_count for Bluesky and YouTube comments), in
+# priority order
+ENGAGEMENT_FIELDS = ('view_count', 'views', 'score', 'points', 'like_count')
+
+# Native item ID columns across sources. HN rows carry no ID, so fall back
+# to the story URL, then the title. Comment rows also carry their video's ID,
+# so comment_id comes first.
+NATIVE_ID_FIELDS = ('comment_id', 'video_id', 'post_id', 'complaint_id', 'uri', 'url', 'title')
+
+OFFICIAL_SCORES_FILE = 'collected-data/official_scores.json'
 
 
 def count_data_rows(filepath):
     """Count non-header rows in a CSV file."""
+    # Combined files carry their row count in a partition index
+    indexed = indexed_row_count(filepath)
+    if indexed is not None:
+        return indexed
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
             reader = csv.reader(f)
@@ -16,6 +46,19 @@ def count_data_rows(filepath):
         return 0
 
 
+def file_digest(filepath):
+    """SHA-256 of a file's contents, to tell a rewrite from the file it replaced.
+
+    Size alone misses a same-size rewrite, and mtime is reset by every fresh
+    checkout.
+    """
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def get_latest_file(pattern, min_rows=5, verbose=False):
     """Get the most recent file matching the pattern that has real data.
 
@@ -33,3 +76,177 @@ def get_latest_file(pattern, min_rows=5, verbose=False):
         elif verbose:
             print(f"  Skipping {os.path.basename(filepath)} ({rows} rows, need >={min_rows})")
     return None
+
+
+def get_snapshot_time(filepath):
+    """Parse the collection timestamp from a snapshot filename (None if absent)."""
+    match = SNAPSHOT_TIMESTAMP_RE.search(os.path.basename(filepath))
+    if not match:
+        return None
+    return datetime.strptime(match.group(1), '%Y%m%d_%H%M%S')
+
+
+def get_weekly_files(pattern, weeks=4, min_rows=5, verbose=False):
+    """Get one snapshot per ISO week for the most recent `weeks` weeks with data.
+
+    Within a week the newest file with at least min_rows data rows wins, the
+    same rule get_latest_file applies. Returns filepaths newest first.
+    """
+    files = sorted(glob.glob(pattern), reverse=True)
+    selected = []
+    seen_weeks = set()
+    for filepath in files:
+        collected_at = get_snapshot_time(filepath)
+        if collected_at is None:
+            continue
+        week = collected_at.isocalendar()[:2]
+        if week in seen_weeks:
+            continue
+        rows = count_data_rows(filepath)
+        if rows < min_rows:
+            if verbose:
+                print(f"  Skipping {os.path.basename(filepath)} ({rows} rows, need >={min_rows})")
+            continue
+        seen_weeks.add(week)
+        selected.append(filepath)
+        if len(selected) >= weeks:
+            break
+    return selected
+
+
+def get_engagement_value(row):
+    """Extract the best engagement value from a row across different source formats."""
+    for field in ENGAGEMENT_FIELDS:
+        try:
+            val = int(row.get(field, 0) or 0)
+            if val > 0:
+                return val
+        except (ValueError, TypeError):
+            continue
+    return 1
+
+
+def get_native_id(row):
+    """Return the platform-native ID of a row (video ID, post ID, URI, ...)."""
+    for field in NATIVE_ID_FIELDS:
+        value = row.get(field)
+        if value:
+            return value
+    return ''
+
+
+def get_level_from_category(category):
+    """Convert category string to level number."""
+    if not category:
+        return 1
+    category = category.upper()
+    if 'LEVEL_3' in category or 'CRISIS' in category:
+        return 3
+    elif 'LEVEL_2' in category:
+        return 2
+    return 1
+
+
+# Emoji removal regex - targeted ranges to avoid stripping legitimate characters.
+# Avoids overly broad ranges that would catch CJK text, (R), (C), etc.
+EMOJI_RE = re.compile(
+    '['
+    '\U0001F600-\U0001F64F'  # emoticons
+    '\U0001F300-\U0001F5FF'  # symbols & pictographs
+    '\U0001F680-\U0001F6FF'  # transport & map
+    '\U0001F1E0-\U0001F1FF'  # flags
+    '\U0001F900-\U0001F9FF'  # supplemental symbols
+    '\U0001FA00-\U0001FA6F'  # chess symbols
+    '\U0001FA70-\U0001FAFF'  # symbols extended-A
+    '\U00002600-\U000026FF'  # misc symbols (sun, cloud, etc.)
+    '\U00002702-\U000027B0'  # dingbats
+    '\U000023F0-\U000023FA'  # misc technical (hourglass, etc.)
+    '\U0000270A-\U0000270D'  # hands
+    '\U00002B50'             # star
+    '\U00002B55'             # circle
+    '\U00002639'             # frowning face
+    '\U0000FE00-\U0000FE0F'  # variation selectors
+    '\U0000200D'             # zero width joiner
+    ']+',
+    flags=re.UNICODE
+)
+
+
+def strip_emoji(text):
+    """Remove emoji characters, decode HTML entities, and clean up whitespace."""
+    # Decode HTML entities (&#39; -> ', &amp; -> &, etc.)
+    cleaned = html.unescape(text)
+    # Remove emojis
+    cleaned = EMOJI_RE.sub('', cleaned)
+    # Collapse multiple spaces into one and strip
+    return re.sub(r' +', ' ', cleaned).strip()
+
+
+def read_json(path, default):
+    """Load a JSON file, or return default if it is missing or unreadable."""
+    if not os.path.exists(path):
+        return default
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"  Warning: could not read {os.path.basename(path)}: {e}")
+        return default
+
+
+def write_json(path, data):
+    """Write JSON atomically so readers never see a half-written file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+
+def load_fred_scores():
+    """Load FRED official scores if the file exists."""
+    if not os.path.exists(OFFICIAL_SCORES_FILE):
+        return {}
+    try:
+        with open(OFFICIAL_SCORES_FILE, 'r') as f:
+            data = json.load(f)
+        scores = {}
+        for slug, info in data.get('scores', {}).items():
+            if info.get('source') == 'fred':
+                scores[slug] = info['score']
+        return scores
+    except Exception as e:
+        print(f"  Warning: Could not load FRED scores: {e}")
+        return {}
+
+
+def _call_capturing_output(func, args):
+    """Run func(*args) in a worker, returning its result and printed output."""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        result = func(*args)
+    return result, buffer.getvalue()
+
+
+def map_metrics(func, arg_tuples, workers=1):
+    """Run a per-metric function over argument tuples, sharded across processes.
+
+    func must be a module-level function that reads only its own metric's
+    data. Each call's printed output is captured in the worker and replayed in
+    input order, so results and logs match a serial run no matter which
+    worker finishes first. workers <= 1 runs serially in-process.
+    """
+    arg_tuples = list(arg_tuples)
+    workers = min(workers, len(arg_tuples))
+    if workers <= 1:
+        return [func(*args) for args in arg_tuples]
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_call_capturing_output, func, args) for args in arg_tuples]
+        for future in futures:
+            result, output = future.result()
+            sys.stdout.write(output)
+            results.append(result)
+    return results
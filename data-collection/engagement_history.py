@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Append-only log of refreshed YouTube engagement.
+
+A video's statistics are stored in the snapshot that found it and only change
+when a later search happens to return it again, so older snapshots freeze
+engagement at first sight. refresh_youtube_engagement.py re-fetches
+statistics for every stored video and appends them here, one file per month:
+
+    collected-data/youtube_engagement/<YYYY-MM>.csv
+    observed_at,video_id,view_count,like_count,comment_count
+
+The aggregates (aggregates.py), and so the default scorers, and the rolling
+scorer (rolling_scores.py) use a video's newest observation in place of a
+snapshot's engagement when it is more recent than that snapshot.
+"""
+
+import csv
+import glob
+import io
+import os
+from datetime import datetime
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+HISTORY_DIR = os.path.join(SCRIPT_DIR, 'collected-data', 'youtube_engagement')
+
+FIELDS = ['observed_at', 'video_id', 'view_count', 'like_count', 'comment_count']
+
+TIME_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+
+def _month_path(when):
+    return os.path.join(HISTORY_DIR, f'{when:%Y-%m}.csv')
+
+
+def append_observations(statistics, observed_at):
+    """Append {video_id: statistics dict} observed at a datetime. Returns the file path."""
+    path = _month_path(observed_at)
+    os.makedirs(HISTORY_DIR, exist_ok=True)
+    is_new = not os.path.exists(path)
+    with open(path, 'a', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        if is_new:
+            writer.writerow(FIELDS)
+        stamp = observed_at.strftime(TIME_FORMAT)
+        for video_id, stats in statistics.items():
+            writer.writerow([stamp, video_id, int(stats.get('viewCount', 0)),
+                             int(stats.get('likeCount', 0)), int(stats.get('commentCount', 0))])
+    return path
+
+
+def latest_observations(since=None):
+    """Newest observation per video: {video_id: (observed_at, view_count)}.
+
+    With `since` (a datetime), month files before its month are not read.
+    """
+    latest = {}
+    first_month = f'{since:%Y-%m}.csv' if since else ''
+    for path in sorted(glob.glob(os.path.join(HISTORY_DIR, '*.csv'))):
+        if os.path.basename(path) < first_month:
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                # Rows are appended in time order, so later rows win
+                latest[row['video_id']] = (datetime.strptime(row['observed_at'], TIME_FORMAT),
+                                           int(row['view_count']))
+    return latest
+
+
+def log_sizes():
+    """Size of each month file of the log: {file name: bytes}."""
+    return {os.path.basename(path): os.path.getsize(path)
+            for path in glob.glob(os.path.join(HISTORY_DIR, '*.csv'))}
+
+
+def observed_since(sizes):
+    """Video IDs observed after the log had `sizes` ({file name: bytes}).
+
+    The log is append-only, so only bytes past each file's recorded size are
+    read. A file that shrank was rewritten and is read whole.
+    """
+    video_ids = set()
+    for path in sorted(glob.glob(os.path.join(HISTORY_DIR, '*.csv'))):
+        start = sizes.get(os.path.basename(path), 0)
+        size = os.path.getsize(path)
+        if size == start:
+            continue
+        with open(path, 'rb') as f:
+            header = f.readline()
+            if len(header) < start < size:
+                f.seek(start)
+            text = f.read().decode('utf-8')
+        for row in csv.DictReader(io.StringIO(text, newline=''), fieldnames=FIELDS):
+            video_ids.add(row['video_id'])
+    return video_ids
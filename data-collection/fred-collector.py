@@ -20,6 +20,8 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
+from pipeline_status import count_api_call, record_file, track_run
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -98,7 +100,9 @@ def calc_wage_stagnation(fred):
     """
     print("\n--- Wage Stagnation ---")
     try:
+        count_api_call('fred.series')
         earnings = fred.get_series(SERIES["avg_hourly_earnings"])
+        count_api_call('fred.series')
         cpi = fred.get_series(SERIES["cpi"])
     except Exception as e:
         print(f"  FRED fetch error: {e}")
@@ -139,7 +143,9 @@ def calc_housing_despair(fred):
     """Price-to-income ratio. Higher = more absurd."""
     print("\n--- Housing Despair ---")
     try:
+        count_api_call('fred.series')
         home_prices = fred.get_series(SERIES["median_home_price"])
+        count_api_call('fred.series')
         income = fred.get_series(SERIES["median_household_income"])
     except Exception as e:
         print(f"  FRED fetch error: {e}")
@@ -186,6 +192,7 @@ def calc_layoff_watch(fred):
     """Weekly initial jobless claims."""
     print("\n--- Layoff Watch ---")
     try:
+        count_api_call('fred.series')
         claims = fred.get_series(SERIES["initial_claims"])
     except Exception as e:
         print(f"  FRED fetch error: {e}")
@@ -222,6 +229,7 @@ def calc_healthcare(fred):
     """Consumer Sentiment as a proxy -- inverted."""
     print("\n--- Healthcare (proxy: Consumer Sentiment) ---")
     try:
+        count_api_call('fred.series')
         sentiment = fred.get_series(SERIES["consumer_sentiment"])
     except Exception as e:
         print(f"  FRED fetch error: {e}")
@@ -340,9 +348,11 @@ def main():
 
     with open(OUTPUT_FILE, "w") as f:
         json.dump(result, f, indent=2)
+    record_file(OUTPUT_FILE.name, len(result["scores"]))
 
     print(f"\nWrote {OUTPUT_FILE}")
 
 
 if __name__ == "__main__":
-    main()
+    with track_run("fred-collector", "fred"):
+        main()
@@ -17,6 +17,8 @@ import requests
 import time
 import csv
 from datetime import datetime, timedelta
+from aggregates import safe_ingest_file
+from pipeline_status import count_api_call, track_run
 from content_filters import filter_content
 
 # ---------------------------------------------------------------------------
@@ -108,6 +110,7 @@ def search_hn(query, hits_per_page=50):
     }
 
     try:
+        count_api_call('hackernews.search')
         response = requests.get(
             BASE_URL, headers=HEADERS, params=params, timeout=15
         )
@@ -117,6 +120,7 @@ def search_hn(query, hits_per_page=50):
         elif response.status_code == 429:
             print("  Rate limited, waiting 10s...")
             time.sleep(10)
+            count_api_call('hackernews.search')
             response = requests.get(
                 BASE_URL, headers=HEADERS, params=params, timeout=15
             )
@@ -225,6 +229,7 @@ def write_metric_csv(metric_slug, rows):
         writer.writeheader()
         writer.writerows(rows)
 
+    safe_ingest_file(filename)
     return filename
 
 
@@ -294,4 +299,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    with track_run("hackernews-collector", "hackernews"):
+        main()
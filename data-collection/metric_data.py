@@ -0,0 +1,160 @@
+"""Read and write the generated metric data behind the website.
+
+lib/metricData.generated.json holds every metric's score, level distribution,
+samples, collection progress and sources, keyed by display name.
+lib/metricDetailData.ts imports it, so the pipeline updates plain JSON in one
+serialization pass instead of regex-patching TypeScript.
+
+The site loads it in two shapes, both emitted here on save:
+- lib/metricSummary.generated.json: score, trend, headline sources and entry
+  count per metric, imported by the landing page
+- public/data/metrics/<slug>.json: one full record per metric, fetched by the
+  detail view only when a metric is opened
+
+Saving is change-aware: the new data is compared with the file on disk
+ignoring lastUpdated, and files are only rewritten (atomically) when a value
+actually changed. The result is reported as `changed=true|false` in
+$GITHUB_OUTPUT so CI can skip the Next.js build on no-op weeks.
+"""
+
+import json
+import os
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+METRIC_DATA_FILE = os.path.normpath(
+    os.path.join(SCRIPT_DIR, '..', 'lib', 'metricData.generated.json')
+)
+SUMMARY_FILE = os.path.normpath(
+    os.path.join(SCRIPT_DIR, '..', 'lib', 'metricSummary.generated.json')
+)
+DETAIL_DIR = os.path.normpath(
+    os.path.join(SCRIPT_DIR, '..', 'public', 'data', 'metrics')
+)
+
+# Number of dataSources lines shown on a landing-page card
+SUMMARY_SOURCES = 3
+
+with open(os.path.join(SCRIPT_DIR, 'config.json'), 'r') as f:
+    METRIC_SLUGS = {m['name']: m['slug'] for m in json.load(f)['metrics']}
+
+# Fields that change on every run without the data changing
+VOLATILE_FIELDS = ('lastUpdated',)
+
+
+def load_metric_data():
+    """Load all metric records, keyed by metric display name."""
+    with open(METRIC_DATA_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def changed_fields(old, new):
+    """List 'Metric: field' for every value that differs, ignoring VOLATILE_FIELDS."""
+    changes = []
+    for name in sorted(set(old) | set(new)):
+        if name not in old or name not in new:
+            changes.append(f"{name}: {'added' if name in new else 'removed'}")
+            continue
+        fields = set(old[name]) | set(new[name])
+        for field in sorted(fields - set(VOLATILE_FIELDS)):
+            if old[name].get(field) != new[name].get(field):
+                changes.append(f"{name}: {field}")
+    return changes
+
+
+def emit_changed_flag(changed):
+    """Expose the result to later workflow steps as steps.<id>.outputs.changed."""
+    output_file = os.environ.get('GITHUB_OUTPUT')
+    if output_file:
+        with open(output_file, 'a', encoding='utf-8') as f:
+            f.write(f"changed={'true' if changed else 'false'}\n")
+
+
+def _serialize(data):
+    return json.dumps(data, indent=2, ensure_ascii=False) + '\n'
+
+
+def _without(data, ignore):
+    return {key: value for key, value in data.items() if key not in ignore}
+
+
+def write_if_changed(path, data, ignore=()):
+    """Atomically write JSON to path unless it already holds that data. Returns True if written.
+
+    Top-level keys in `ignore` (timestamps) do not count as a change.
+    """
+    text = _serialize(data)
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            current = f.read()
+        if current == text:
+            return False
+        if ignore:
+            try:
+                if _without(json.loads(current), ignore) == _without(data, ignore):
+                    return False
+            except ValueError:
+                pass
+
+    # Write to a temporary file and rename it over the original, so a crash
+    # mid-write never leaves a truncated file for the site build
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+    return True
+
+
+def build_summary(data):
+    """Landing-page bundle: just what the metric cards and overall score show."""
+    return {
+        name: {
+            'title': record['title'],
+            'slug': METRIC_SLUGS.get(name, ''),
+            'score': record['score'],
+            'trend': record['trend'],
+            'dataSources': record['dataSources'][:SUMMARY_SOURCES],
+            'entryCount': record['levelDistribution']['total'],
+            'lastUpdated': record['lastUpdated'],
+        }
+        for name, record in data.items()
+    }
+
+
+def write_bundles(data):
+    """Write the summary bundle and one detail bundle per metric. Returns True if any changed."""
+    written = write_if_changed(SUMMARY_FILE, build_summary(data))
+    for name, record in data.items():
+        slug = METRIC_SLUGS.get(name)
+        if not slug:
+            print(f"  WARNING: no slug in config.json for {name}; detail bundle skipped")
+            continue
+        written |= write_if_changed(os.path.join(DETAIL_DIR, f'{slug}.json'), record)
+    return written
+
+
+def save_metric_data(data):
+    """Write all metric records and their bundles, only if a value changed.
+
+    Returns True if any file was rewritten.
+    """
+    try:
+        current = load_metric_data()
+    except (OSError, ValueError):
+        current = {}
+
+    changes = changed_fields(current, data)
+    if changes:
+        print(f"\nMetric data changes ({len(changes)}):")
+        for change in changes:
+            print(f"  {change}")
+        write_if_changed(METRIC_DATA_FILE, data)
+    else:
+        print(f"\nNo metric data changes (ignoring {', '.join(VOLATILE_FIELDS)}); "
+              f"{os.path.basename(METRIC_DATA_FILE)} left untouched")
+        # Keep the bundles in step with the file on disk (creates them if missing)
+        data = current
+
+    changed = write_bundles(data) or bool(changes)
+    emit_changed_flag(changed)
+    return changed
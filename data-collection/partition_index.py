@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Byte-offset partition index for the combined TikTok file.
+
+tiktok_youtube_<ts>.csv holds every metric's rows in one file. Instead of
+scanning the whole file once per metric, a sidecar <file>.idx.json records
+the byte ranges of each metric's rows, found in a single pass:
+
+    {"size": 48213, "header": [0, 141], "rows": 212,
+     "metrics": {"healthcare": {"rows": 31, "ranges": [[141, 6873]]}, ...}}
+
+The collector writes rows grouped by metric and builds the index right after
+saving, so each metric is one contiguous range, read with one seek and one
+read. Indexes are also built lazily on first read and rebuilt whenever the
+file size no longer matches (e.g. a rewrite).
+
+Usage:
+    python partition_index.py             # index every TikTok file
+"""
+
+import csv
+import glob
+import io
+import json
+import os
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(SCRIPT_DIR, 'collected-data')
+
+INDEX_SUFFIX = '.idx.json'
+PARTITION_COLUMN = 'metric'
+
+
+def _index_path(path):
+    return path + INDEX_SUFFIX
+
+
+def _records(f):
+    """Yield (start, end, raw bytes) per CSV record, keeping quoted newlines inside one record."""
+    start = f.tell()
+    record = b''
+    quotes = 0
+    for line in iter(f.readline, b''):
+        record += line
+        # An odd running quote count means a quoted field continues on the next line
+        quotes += line.count(b'"')
+        if quotes % 2 == 0:
+            end = start + len(record)
+            yield start, end, record
+            start = end
+            record = b''
+            quotes = 0
+    if record:
+        yield start, start + len(record), record
+
+
+def _parse_record(raw):
+    return next(csv.reader(io.StringIO(raw.decode('utf-8'), newline='')), [])
+
+
+def build_index(path):
+    """Index one combined file in a single pass and write its sidecar. Returns the index."""
+    with open(path, 'rb') as f:
+        records = _records(f)
+        header_start, header_end, header_raw = next(records, (0, 0, b''))
+        header = _parse_record(header_raw) if header_raw else []
+        column = header.index(PARTITION_COLUMN) if PARTITION_COLUMN in header else 0
+
+        metrics = {}
+        total = 0
+        for start, end, raw in records:
+            if not raw.strip():
+                continue
+            fields = _parse_record(raw)
+            if column >= len(fields):
+                continue
+            entry = metrics.setdefault(fields[column], {'rows': 0, 'ranges': []})
+            entry['rows'] += 1
+            total += 1
+            # Extend the previous range when rows of a metric are adjacent
+            if entry['ranges'] and entry['ranges'][-1][1] == start:
+                entry['ranges'][-1][1] = end
+            else:
+                entry['ranges'].append([start, end])
+
+    index = {
+        'size': os.path.getsize(path),
+        'header': [header_start, header_end],
+        'rows': total,
+        'metrics': metrics,
+    }
+
+    tmp_path = _index_path(path) + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, separators=(',', ':'))
+    os.replace(tmp_path, _index_path(path))
+    return index
+
+
+def safe_build_index(path):
+    """build_index for collectors: indexing problems never fail a collection."""
+    try:
+        build_index(path)
+    except Exception as e:
+        print(f"  Warning: could not index {os.path.basename(path)}: {e}")
+
+
+def _cached_index(path):
+    """The sidecar index if it still matches the file, else None."""
+    try:
+        with open(_index_path(path), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if index.get('size') != os.path.getsize(path):
+        return None
+    return index
+
+
+def load_index(path):
+    """Load a file's partition index, building it if missing or stale."""
+    return _cached_index(path) or build_index(path)
+
+
+def indexed_row_count(path):
+    """Data rows in path per an up-to-date sidecar index, or None if it has none."""
+    index = _cached_index(path)
+    return index['rows'] if index else None
+
+
+def read_partition(path, metric):
+    """Read one metric's rows from a combined file as dicts, without scanning the rest."""
+    index = load_index(path)
+    entry = index['metrics'].get(metric)
+    if not entry:
+        return []
+
+    with open(path, 'rb') as f:
+        start, end = index['header']
+        f.seek(start)
+        chunks = [f.read(end - start)]
+        for start, end in entry['ranges']:
+            f.seek(start)
+            chunks.append(f.read(end - start))
+
+    text = b''.join(chunks).decode('utf-8')
+    return list(csv.DictReader(io.StringIO(text, newline='')))
+
+
+def main():
+    paths = sorted(glob.glob(os.path.join(DATA_DIR, 'tiktok_youtube_*.csv')))
+    for path in paths:
+        index = build_index(path)
+        print(f"  {os.path.basename(path)}: {index['rows']} rows, "
+              f"{len(index['metrics'])} metrics, "
+              f"{sum(len(m['ranges']) for m in index['metrics'].values())} ranges")
+    print(f"Indexed {len(paths)} files")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Catalog of collector runs and the pipeline status artifact indexed from it.
+
+Every collector runs inside track_run(), which times it, records a crash as a
+failure, and counts what the run produced: aggregates.ingest_file reports
+each file written (with its row count) and request sites call
+count_api_call(). A finished run is appended as one line to
+collected-data/run_catalog.jsonl, the full history.
+
+The catalog is indexed in lib/pipeline_status.json, updated in place after
+every run: each collector's latest run (with the byte offset of its catalog
+line) and per-platform rollups of last success, rows, files, API calls,
+duration and failures. Readers get everything from that one small file
+instead of scanning the catalog or the data directory:
+
+- the CI freshness gate:  python pipeline_status.py gate --since <epoch>
+- the /status page, which imports it at build time
+
+Usage:
+    python pipeline_status.py                      # print the status summary
+    python pipeline_status.py gate --since 1767000000
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import time
+from datetime import datetime, timezone
+
+from data_utils import read_json, write_json
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CATALOG_FILE = os.path.join(SCRIPT_DIR, 'collected-data', 'run_catalog.jsonl')
+STATUS_FILE = os.path.normpath(os.path.join(SCRIPT_DIR, '..', 'lib', 'pipeline_status.json'))
+
+# Minimum new files per platform for a healthy weekly run (CI freshness gate)
+GATE_THRESHOLDS = {
+    'youtube': 5,
+    'hackernews': 3,
+    'cfpb': 1,
+    'bluesky': 5,
+}
+
+# The run in progress in this process, if any
+_current_run = None
+
+
+def _now():
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _epoch(timestamp):
+    return datetime.strptime(timestamp, '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=timezone.utc).timestamp()
+
+
+def record_file(filename, rows):
+    """Count a file written by the current run (no-op outside track_run)."""
+    if _current_run is not None and rows > 0:
+        _current_run['files'] += 1
+        _current_run['rows'] += rows
+
+
+def count_api_call(endpoint, calls=1):
+    """Count API requests made by the current run, per endpoint (no-op outside track_run)."""
+    if _current_run is not None:
+        api_calls = _current_run['api_calls']
+        api_calls[endpoint] = api_calls.get(endpoint, 0) + calls
+
+
+@contextlib.contextmanager
+def track_run(collector, platform):
+    """Record a collector run in the catalog and status index.
+
+    A run that raises (or exits non-zero) is 'failed'; one that finishes
+    without writing any data is 'empty'; otherwise 'ok'. Recording never
+    fails the collector itself.
+    """
+    global _current_run
+    run = {
+        'collector': collector,
+        'platform': platform,
+        'started': _now(),
+        'status': 'ok',
+        'error': None,
+        'files': 0,
+        'rows': 0,
+        'api_calls': {},
+    }
+    _current_run = run
+    start = time.monotonic()
+    try:
+        yield run
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            run['status'] = 'failed'
+            run['error'] = f'exit status {e.code}'
+        raise
+    except BaseException as e:
+        run['status'] = 'failed'
+        run['error'] = f'{type(e).__name__}: {e}'
+        raise
+    finally:
+        _current_run = None
+        run['finished'] = _now()
+        run['duration_s'] = round(time.monotonic() - start, 1)
+        if run['status'] == 'ok' and not run['files']:
+            run['status'] = 'empty'
+        try:
+            record_run(run)
+        except Exception as e:
+            print(f"  Warning: could not record run status: {e}")
+
+
+def _platform_rollup(collectors):
+    """Per-platform totals over each collector's latest run."""
+    platforms = {}
+    for entry in collectors.values():
+        platform = platforms.setdefault(entry['platform'], {
+            'collectors': 0, 'failures': 0, 'files': 0, 'rows': 0,
+            'api_calls': 0, 'duration_s': 0.0, 'last_run': None, 'last_success': None,
+        })
+        platform['collectors'] += 1
+        platform['failures'] += entry['status'] != 'ok'
+        platform['files'] += entry['files']
+        platform['rows'] += entry['rows']
+        platform['api_calls'] += sum(entry['api_calls'].values())
+        platform['duration_s'] = round(platform['duration_s'] + entry['duration_s'], 1)
+        platform['last_run'] = max(filter(None, (platform['last_run'], entry['finished'])))
+        if entry.get('last_success'):
+            platform['last_success'] = max(filter(None, (platform['last_success'], entry['last_success'])))
+    return platforms
+
+
+def record_run(run):
+    """Append a finished run to the catalog and fold it into the status index."""
+    os.makedirs(os.path.dirname(CATALOG_FILE), exist_ok=True)
+    with open(CATALOG_FILE, 'a', encoding='utf-8') as f:
+        offset = f.tell()
+        f.write(json.dumps(run, sort_keys=True) + '\n')
+
+    status = load_status()
+    previous = status['collectors'].get(run['collector'], {})
+    entry = dict(run, catalog_offset=offset)
+    if run['status'] == 'ok':
+        entry['last_success'] = run['finished']
+        entry['consecutive_failures'] = 0
+    else:
+        entry['last_success'] = previous.get('last_success')
+        entry['consecutive_failures'] = previous.get('consecutive_failures', 0) + 1
+
+    status['collectors'][run['collector']] = entry
+    status['platforms'] = _platform_rollup(status['collectors'])
+    status['updated'] = run['finished']
+    write_json(STATUS_FILE, status)
+
+
+def load_status():
+    """Load the status index: {'updated', 'collectors': {...}, 'platforms': {...}}."""
+    return read_json(STATUS_FILE, {'updated': None, 'collectors': {}, 'platforms': {}})
+
+
+def read_catalog_entry(offset):
+    """Read one run from the catalog by the byte offset stored in the status index."""
+    with open(CATALOG_FILE, 'r', encoding='utf-8') as f:
+        f.seek(offset)
+        return json.loads(f.readline())
+
+
+def new_files_since(status, since):
+    """New files per platform from successful runs that finished at or after `since` (epoch)."""
+    counts = dict.fromkeys(GATE_THRESHOLDS, 0)
+    for entry in status['collectors'].values():
+        if entry['status'] == 'ok' and _epoch(entry['finished']) >= since:
+            counts[entry['platform']] = counts.get(entry['platform'], 0) + entry['files']
+    return counts
+
+
+def _set_output(name, value):
+    output_file = os.environ.get('GITHUB_OUTPUT')
+    if output_file:
+        with open(output_file, 'a', encoding='utf-8') as f:
+            f.write(f'{name}={value}\n')
+
+
+def gate(since):
+    """CI freshness gate: report new files per platform and set has_new_data / failed_platforms."""
+    counts = new_files_since(load_status(), since)
+
+    print("Platform freshness report:")
+    failed = []
+    for platform, threshold in GATE_THRESHOLDS.items():
+        print(f"  {platform + ':':12} {counts[platform]} new files (threshold >={threshold})")
+        if counts[platform] < threshold:
+            failed.append(f'{platform}({counts[platform]})')
+
+    failed_platforms = ' '.join(failed)
+    _set_output('failed_platforms', failed_platforms)
+    if sum(counts[platform] for platform in GATE_THRESHOLDS) == 0:
+        _set_output('has_new_data', 'false')
+        print("::error::No new data collected from any platform.")
+    else:
+        _set_output('has_new_data', 'true')
+        if failed:
+            print(f"::warning::Platforms below threshold (will proceed with partial data): {failed_platforms}")
+
+
+def print_summary():
+    status = load_status()
+    print("=" * 70)
+    print(f"PIPELINE STATUS (updated {status['updated'] or 'never'})")
+    print("=" * 70)
+    for name, platform in sorted(status['platforms'].items()):
+        print(f"  {name:12} last success {platform['last_success'] or 'never':20} "
+              f"files={platform['files']:<3} rows={platform['rows']:<6} "
+              f"api_calls={platform['api_calls']:<5} failures={platform['failures']}")
+    for name, entry in sorted(status['collectors'].items()):
+        if entry['status'] != 'ok':
+            print(f"  {entry['status'].upper()}: {name} ({entry['error'] or 'no data written'})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pipeline run catalog and status')
+    subparsers = parser.add_subparsers(dest='command')
+    gate_parser = subparsers.add_parser('gate', help='CI freshness gate over the status index')
+    gate_parser.add_argument('--since', type=float, required=True,
+                             help='count runs finished at or after this Unix time')
+    args = parser.parse_args()
+
+    if args.command == 'gate':
+        gate(args.since)
+    else:
+        print_summary()
+
+
+if __name__ == '__main__':
+    main()
@@ -12,6 +12,8 @@ Run locally:  python run_weekly_update.py --reddit-only
 import time
 import requests
 
+from pipeline_status import count_api_call
+
 _USER_AGENT = "AbsurdityIndex/1.0 (research project; github.com/Surfrrosa/absurdity-index)"
 
 
@@ -28,6 +30,7 @@ def search_subreddit(subreddit, query, limit=25):
     headers = {"User-Agent": _USER_AGENT}
 
     try:
+        count_api_call('reddit.search')
         response = requests.get(url, headers=headers, params=params, timeout=15)
         if response.status_code == 200:
             data = response.json()
@@ -37,6 +40,7 @@ def search_subreddit(subreddit, query, limit=25):
         elif response.status_code == 429:
             print(f"    Rate limited on r/{subreddit}, waiting 10s...")
             time.sleep(10)
+            count_api_call('reddit.search')
             response = requests.get(url, headers=headers, params=params, timeout=15)
             if response.status_code == 200:
                 data = response.json()
@@ -12,6 +12,8 @@ import csv
 import sys
 import time
 from datetime import datetime
+from aggregates import safe_ingest_file
+from pipeline_status import track_run
 from reddit_client import search_subreddit, is_authenticated
 
 
@@ -95,6 +97,16 @@ def run_collection(metric_slug, banner, subreddits, search_terms,
                    level_3_keywords, level_2_keywords,
                    level_3_phrases, level_2_phrases):
     """Run the full collection pipeline for a single metric."""
+    collector = f"{metric_slug.replace('_', '-')}-reddit-collector"
+    with track_run(collector, 'reddit'):
+        _run_collection(metric_slug, banner, subreddits, search_terms,
+                        level_3_keywords, level_2_keywords,
+                        level_3_phrases, level_2_phrases)
+
+
+def _run_collection(metric_slug, banner, subreddits, search_terms,
+                    level_3_keywords, level_2_keywords,
+                    level_3_phrases, level_2_phrases):
     print("=" * 70)
     print(f"REDDIT {banner} (OAuth2)")
     print("=" * 70)
@@ -161,6 +173,7 @@ def run_collection(metric_slug, banner, subreddits, search_terms,
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         writer.writerows(all_posts)
+    safe_ingest_file(filename)
 
     print(f"\nData saved to: {filename}")
     print("=" * 70)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Refresh engagement for every YouTube video already collected.
+
+Reads the video IDs stored in all YouTube and TikTok snapshots, re-fetches
+their statistics with videos.list, 50 IDs per call at 1 quota unit each (a
+few thousand videos cost around a hundred units), and appends the results to
+the engagement log (engagement_history.py). Videos observed longest ago go
+first, so a tight quota allowance still rotates through all of them. The next
+aggregates refresh (aggregates.py, run before scoring) folds the new views
+into the YouTube and TikTok aggregates every scorer reads.
+
+Usage:
+    python refresh_youtube_engagement.py
+    python refresh_youtube_engagement.py --dry-run    # count videos and units only
+"""
+
+import argparse
+import csv
+import glob
+import math
+import os
+import sys
+from datetime import datetime
+
+import youtube_quota
+from aggregates import DATA_DIR, REFRESHED_PLATFORMS, classify_file
+from engagement_history import append_observations, latest_observations
+from pipeline_status import record_file, track_run
+from youtube_client import MAX_IDS_PER_CALL, fetch_video_statistics, get_client
+
+COLLECTOR = 'youtube-engagement-refresh'
+# Its own platform in the run status, so refreshes never count toward the
+# YouTube collectors' freshness gate
+PLATFORM = 'youtube_engagement'
+
+
+def stored_video_ids():
+    """Distinct video IDs across YouTube and TikTok snapshots, newest snapshot first."""
+    video_ids = {}
+    for path in sorted(glob.glob(os.path.join(DATA_DIR, '*.csv')), reverse=True):
+        if classify_file(os.path.basename(path)) not in REFRESHED_PLATFORMS:
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                if row.get('video_id'):
+                    video_ids.setdefault(row['video_id'], None)
+    return list(video_ids)
+
+
+def refresh_order(video_ids):
+    """Never-observed videos first, then the longest since their last observation."""
+    observed = latest_observations()
+    never = datetime.min
+    return sorted(video_ids, key=lambda video_id: observed.get(video_id, (never,))[0])
+
+
+def refresh(youtube, video_ids, quota):
+    """Fetch statistics batch by batch and append them. Returns (videos refreshed, log file)."""
+    refreshed = 0
+    path = None
+    for start in range(0, len(video_ids), MAX_IDS_PER_CALL):
+        if not quota.can_afford(units=youtube_quota.UNIT_COSTS['youtube.videos']):
+            print(f"\nQuota allowance used up; {len(video_ids) - start} videos left for next time")
+            break
+        batch = video_ids[start:start + MAX_IDS_PER_CALL]
+        try:
+            # max_age=0: always ask the API, never the video cache
+            statistics = fetch_video_statistics(youtube, batch, max_age=0)
+        except Exception as e:
+            print(f"  ✗ Error fetching statistics: {e}")
+            if youtube_quota.is_quota_error(e):
+                quota.mark_exhausted()
+                print("  Daily YouTube quota exhausted; stopping.")
+                break
+            continue
+        path = append_observations(statistics, datetime.now())
+        refreshed += len(statistics)
+    return refreshed, path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Refresh statistics of collected YouTube videos')
+    parser.add_argument('--dry-run', action='store_true', help='count videos and quota units only')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("YOUTUBE ENGAGEMENT REFRESH")
+    print("=" * 70)
+
+    video_ids = refresh_order(stored_video_ids())
+    units = math.ceil(len(video_ids) / MAX_IDS_PER_CALL) * youtube_quota.UNIT_COSTS['youtube.videos']
+    print(f"Stored videos: {len(video_ids)} ({units} videos.list calls)")
+    if args.dry_run:
+        return
+
+    with track_run(COLLECTOR, PLATFORM):
+        youtube = get_client()
+        if youtube is None:
+            print("\nFATAL: YOUTUBE_API_KEY not set. Exiting.")
+            print("  Add it to .env: YOUTUBE_API_KEY=your_key_here")
+            sys.exit(1)
+
+        quota = youtube_quota.plan_units(COLLECTOR, units)
+        refreshed, path = refresh(youtube, video_ids, quota)
+        if path:
+            record_file(os.path.basename(path), refreshed)
+        missing = len(video_ids) - refreshed
+        print(f"\nRefreshed {refreshed} videos for {quota.spent} quota units"
+              + (f" ({missing} not refreshed or no longer available)" if missing else ""))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Sparse TF-IDF relevance index for sample selection.
+
+Each metric has a relevance profile built from its keyword list
+(update_sample_data.RELEVANCE_KEYWORDS). Titles and keywords are reduced to
+the same terms: lowercase word tokens, lightly stemmed, plus adjacent-token
+bigrams, so 'prior authorization' must appear as a phrase and 'ai' no longer
+matches inside 'thai' or 'pay' inside 'paypal'.
+
+IDF is computed over the run's corpus of candidate titles (the sample pools),
+so a term that shows up everywhere this week counts for little. Scoring a title is a sparse
+product of its TF-IDF vector with the term -> metric postings of all profiles,
+giving its cosine similarity to every metric in one pass over its terms.
+"""
+
+import math
+import re
+from collections import Counter
+
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+# Longest first; applied once, and only if at least 3 characters remain.
+# 'es' and 'ies' need no entry of their own: stripping 's' and then the
+# final 'e' below handles them (wages -> wage -> wag, salaries -> salarie ->
+# salari)
+STEM_SUFFIXES = ('ations', 'ation', 'ings', 'ing', 'ions', 'ion', 'ed', 's')
+
+
+# Suffixes that double a final consonant: cancelled -> cancell -> cancel
+DOUBLING_SUFFIXES = ('ings', 'ing', 'ed')
+
+
+def _stem(token):
+    for suffix in STEM_SUFFIXES:
+        # 'ss' is not a plural: loss stays loss, losses -> losse -> loss
+        if suffix == 's' and token.endswith('ss'):
+            break
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            token = token[:-len(suffix)]
+            if suffix in DOUBLING_SUFFIXES and len(token) > 3 and token[-1] == token[-2]:
+                token = token[:-1]
+            break
+    # A final 'e' and 'y' are normalized after the suffix, so a word and its
+    # inflections meet: wage/wages/waged -> wag, salary/salaries -> salari,
+    # deny/denied -> deni
+    if len(token) > 3 and token.endswith('e'):
+        token = token[:-1]
+    if len(token) > 3 and token.endswith('y'):
+        token = token[:-1] + 'i'
+    return token
+
+
+def tokenize(text):
+    """Lowercase, stemmed word tokens."""
+    return [_stem(token) for token in TOKEN_RE.findall(text.lower())]
+
+
+def _bigrams(tokens):
+    return [f'{a} {b}' for a, b in zip(tokens, tokens[1:])]
+
+
+def text_terms(text):
+    """Index terms of a title: every token and every adjacent pair."""
+    tokens = tokenize(text)
+    return tokens + _bigrams(tokens)
+
+
+def keyword_terms(keyword):
+    """Profile terms of a keyword: the token itself, or its bigrams for a phrase."""
+    tokens = tokenize(keyword)
+    return tokens if len(tokens) == 1 else _bigrams(tokens)
+
+
+class RelevanceIndex:
+    """Scores texts against every metric's keyword profile by TF-IDF cosine similarity."""
+
+    def __init__(self, profiles, corpus):
+        """
+        Args:
+            profiles: {metric name: [keyword, ...]}
+            corpus: iterable of texts (this run's candidate titles) for IDF
+        """
+        documents = 0
+        document_frequency = Counter()
+        for text in corpus:
+            documents += 1
+            document_frequency.update(set(text_terms(text)))
+        self._documents = documents
+        self._document_frequency = document_frequency
+
+        # Sparse term x metric matrix, stored as postings term -> {metric: weight}
+        self._postings = {}
+        self.metrics = [metric for metric, keywords in profiles.items() if keywords]
+        for metric in self.metrics:
+            vector = {}
+            for keyword in profiles[metric]:
+                for term in keyword_terms(keyword):
+                    vector[term] = self.idf(term)
+            norm = math.sqrt(sum(w * w for w in vector.values())) or 1.0
+            for term, weight in vector.items():
+                self._postings.setdefault(term, {})[metric] = weight / norm
+
+        self._cache = {}
+
+    def idf(self, term):
+        """Smoothed inverse document frequency; never zero, so rare profile terms still count."""
+        df = self._document_frequency.get(term, 0)
+        return math.log((1 + self._documents) / (1 + df)) + 1
+
+    def scores(self, text):
+        """Cosine similarity of text to every metric profile: {metric: score}."""
+        if text in self._cache:
+            return self._cache[text]
+
+        counts = Counter(text_terms(text))
+        vector = {term: count * self.idf(term) for term, count in counts.items()}
+        norm = math.sqrt(sum(w * w for w in vector.values())) or 1.0
+
+        result = dict.fromkeys(self.metrics, 0.0)
+        for term, weight in vector.items():
+            for metric, profile_weight in self._postings.get(term, {}).items():
+                result[metric] += weight * profile_weight / norm
+
+        self._cache[text] = result
+        return result
+
+    def score(self, text, metric):
+        """Relevance of text to one metric (0 when no profile term occurs).
+
+        Metrics without a keyword profile accept everything.
+        """
+        if metric not in self.metrics:
+            return 1.0
+        return self.scores(text)[metric]
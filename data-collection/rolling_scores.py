@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Rolling-window, time-decayed social scoring across weekly snapshots.
+
+The default scorer reads only the latest file per source, so one bad
+collection week (a Reddit 403, an exhausted YouTube quota) whipsaws the score.
+This module instead streams the last N weekly snapshots per source:
+
+1. Each snapshot is reduced once to a compact run of (native_id, engagement,
+   category) rows sorted by ID, stored as a sidecar in .cache/sorted_runs/
+   and rebuilt only when the snapshot's contents change.
+2. The runs are streamed from disk through a k-way merge (heapq.merge), so
+   items arrive grouped by ID with the newest observation first and the
+   merge holds one row per snapshot, never a whole week.
+3. Each item is counted once, using its newest observation, and weighted by
+   an exponential decay on that observation's age.
+
+A YouTube video's engagement comes from the engagement log
+(engagement_history.py) instead when it was refreshed after the snapshot,
+so older snapshots do not freeze views at first sight.
+
+Used by calculate_all_social_scores.py --rolling.
+"""
+
+import csv
+import heapq
+import math
+import os
+from itertools import groupby
+
+from data_utils import (file_digest, get_engagement_value, get_native_id, get_snapshot_time,
+                        get_weekly_files)
+from engagement_history import latest_observations
+from partition_index import read_partition
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+RUN_DIR = os.path.join(SCRIPT_DIR, '.cache', 'sorted_runs')
+
+DEFAULT_WEEKS = 4
+DEFAULT_HALF_LIFE_WEEKS = 2.0
+
+
+def _read_rows(filepath, filter_metric=None):
+    """Stream a snapshot's rows; for a combined file, only filter_metric's slice."""
+    if filter_metric is not None:
+        # Read just this metric's byte range via the partition index
+        yield from read_partition(filepath, filter_metric)
+        return
+    with open(filepath, 'r', encoding='utf-8') as f:
+        yield from csv.DictReader(f)
+
+
+def _run_path(filepath, filter_metric=None):
+    name = os.path.basename(filepath)
+    if filter_metric is not None:
+        name += f'.{filter_metric}'
+    return os.path.join(RUN_DIR, name + '.tsv')
+
+
+def build_run(filepath, filter_metric=None, digest=None):
+    """Write a snapshot's sorted run sidecar and return its path.
+
+    The first line records the snapshot's content hash, so a rewritten
+    snapshot gets a new run. Only this one snapshot is held in memory while
+    it is sorted.
+    """
+    run = []
+    try:
+        for row in _read_rows(filepath, filter_metric):
+            native_id = get_native_id(row)
+            if native_id:
+                run.append((native_id, get_engagement_value(row), row.get('category', '')))
+    except Exception as e:
+        print(f"  Error reading {filepath}: {e}")
+    run.sort()
+
+    path = _run_path(filepath, filter_metric)
+    os.makedirs(RUN_DIR, exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, delimiter='\t', lineterminator='\n')
+        writer.writerow(['sha256', digest or file_digest(filepath)])
+        writer.writerows(run)
+    os.replace(tmp_path, path)
+    return path
+
+
+def _current_run(filepath, filter_metric=None):
+    """The snapshot's run sidecar, built first if missing or stale."""
+    path = _run_path(filepath, filter_metric)
+    digest = file_digest(filepath)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            header = f.readline().rstrip('\n').split('\t')
+        if header == ['sha256', digest]:
+            return path
+    except OSError:
+        pass
+    return build_run(filepath, filter_metric, digest)
+
+
+def _sorted_run(run_path, snapshot_index):
+    """Stream a run sidecar as (native_id, snapshot_index, engagement, category) tuples."""
+    with open(run_path, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f, delimiter='\t')
+        next(reader, None)
+        for native_id, engagement, category in reader:
+            yield native_id, snapshot_index, int(engagement), category
+
+
+def merge_snapshots(filepaths, filter_metric=None):
+    """K-way merge snapshots (newest first) into one observation per item.
+
+    Yields (native_id, snapshot_index, engagement, category) where
+    snapshot_index is the position of the newest snapshot the item appeared in.
+    """
+    # Build any missing runs one snapshot at a time before the merge starts
+    run_paths = [_current_run(path, filter_metric) for path in filepaths]
+    runs = [_sorted_run(path, i) for i, path in enumerate(run_paths)]
+    merged = heapq.merge(*runs)
+    for _, observations in groupby(merged, key=lambda obs: obs[0]):
+        yield next(observations)
+
+
+def decay_weight(age_days, half_life_weeks):
+    """Exponential decay: an observation half_life_weeks old counts half."""
+    if half_life_weeks <= 0:
+        return 1.0
+    return 0.5 ** (age_days / (half_life_weeks * 7))
+
+
+def rolling_social_score(sources, severity_weights, weeks=DEFAULT_WEEKS,
+                         half_life_weeks=DEFAULT_HALF_LIFE_WEEKS):
+    """Calculate a smoothed social score from the last `weeks` snapshots per source.
+
+    `sources` maps a source name to (glob pattern, metric filter or None).
+    Items are deduplicated within a source by native ID; ages are measured
+    from the newest snapshot across all sources so results are reproducible.
+
+    Returns (social_score, level_counts, per_source) where per_source maps
+    each source name to {'files': [...], 'items': n}.
+    """
+    snapshots = {}
+    for source_name, (pattern, filter_metric) in sources.items():
+        files = get_weekly_files(pattern, weeks=weeks)
+        if files:
+            snapshots[source_name] = (files, filter_metric)
+
+    level_counts = {'L1': 0, 'L2': 0, 'L3': 0}
+    per_source = {}
+    if not snapshots:
+        return 0, level_counts, per_source
+
+    reference = max(get_snapshot_time(files[0]) for files, _ in snapshots.values())
+    observations = latest_observations(
+        since=min(get_snapshot_time(files[-1]) for files, _ in snapshots.values()))
+
+    total_weighted = 0
+    total_engagement = 0
+
+    for source_name, (files, filter_metric) in snapshots.items():
+        times = [get_snapshot_time(path) for path in files]
+        ages = [(reference - collected_at).total_seconds() / 86400 for collected_at in times]
+        weights = [decay_weight(age, half_life_weeks) for age in ages]
+        items = 0
+
+        for native_id, snapshot_index, engagement_val, category in merge_snapshots(files, filter_metric):
+            items += 1
+            # A refresh after the snapshot replaces its frozen engagement
+            observation = observations.get(native_id)
+            if observation and observation[0] > times[snapshot_index]:
+                engagement_val = max(observation[1], 1)
+            if 'LEVEL_1' in category:
+                level_counts['L1'] += 1
+            elif 'LEVEL_2' in category:
+                level_counts['L2'] += 1
+            elif 'LEVEL_3' in category:
+                level_counts['L3'] += 1
+
+            severity = severity_weights.get(category, 0.33)
+            engagement = math.log10(engagement_val + 1) * weights[snapshot_index]
+            total_weighted += severity * engagement
+            total_engagement += engagement
+
+        if items:
+            per_source[source_name] = {'files': files, 'items': items}
+
+    if total_engagement == 0:
+        return 0, level_counts, per_source
+
+    return (total_weighted / total_engagement) * 100, level_counts, per_source
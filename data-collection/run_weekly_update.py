@@ -75,6 +75,12 @@ def run_all_youtube():
     for script in YOUTUBE_COLLECTORS:
         run_collector(script, delay_after=5)
 
+    # Samples comments of the videos just collected
+    run_collector('youtube-comments-collector.py')
+
+    # Last, so it gets whatever quota the collectors left
+    run_collector('refresh_youtube_engagement.py')
+
 def run_all_reddit():
     """Run all Reddit collectors with delays to avoid rate limiting."""
     print("\n" + "="*80)
@@ -84,6 +90,14 @@ def run_all_reddit():
     for script in REDDIT_COLLECTORS:
         run_collector(script, delay_after=20)  # 20 second delay between Reddit calls
 
+def update_aggregates():
+    """Fold newly collected files into the per-metric aggregates."""
+    print("\n" + "="*80)
+    print("UPDATING AGGREGATES")
+    print("="*80)
+
+    run_collector('aggregates.py')
+
 def calculate_scores():
     """Run the score calculator."""
     print("\n" + "="*80)
@@ -93,9 +107,9 @@ def calculate_scores():
     run_collector('calculate_all_social_scores.py')
 
 def update_typescript():
-    """Update the metricDetailData.ts file."""
+    """Update the generated metric data imported by metricDetailData.ts."""
     print("\n" + "="*80)
-    print("UPDATING metricDetailData.ts")
+    print("UPDATING metricData.generated.json")
     print("="*80)
 
     run_collector('update_metric_data.py')
@@ -119,6 +133,7 @@ def main():
         run_all_youtube()
         run_all_reddit()
 
+    update_aggregates()
     calculate_scores()
 
     if not no_update:
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Sample candidate pool per metric, platform and severity level.
+
+The website shows a handful of samples per metric, always drawn from the most
+engaged entries of each platform's latest file. Rather than reload every
+platform's CSV to pick them, aggregates.ingest_file hands each new file to
+store_candidates(), which keeps its top POOL_SIZE entries per level by
+engagement, already normalized for display: HTML entities decoded, emoji
+stripped, URL and date filled in.
+
+    collected-data/sample_pool/<slug>.json
+    {"metric": slug,
+     "platforms": {platform: {"file": name, "candidates": [
+         {"order": 17, "level": 3, "engagement": 48211, "title": "...",
+          "url": "...", "date": "2026-05-01", "videoId": "...", ...}, ...]}}}
+
+Candidates are stored in file order; `order` is the row's position in the
+file, so ties break as they would on the raw rows. As with the aggregates,
+the newest file with at least MIN_ROWS rows wins, so the pool always matches
+the data the scores were computed from. Sample refresh reads these few files
+instead of the corpus.
+"""
+
+import heapq
+import os
+
+from data_utils import get_level_from_category, read_json, strip_emoji, write_json
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+POOL_DIR = os.path.join(SCRIPT_DIR, 'collected-data', 'sample_pool')
+
+# Candidates kept per severity level; selection shows at most 2 per platform,
+# the rest is headroom for relevance filtering
+POOL_SIZE = 12
+
+
+def _int(value):
+    try:
+        return int(value or 0)
+    except (ValueError, TypeError):
+        return 0
+
+
+def _youtube_candidate(row):
+    video_id = row.get('video_id', '')
+    url = row.get('url', '') or (f'https://www.youtube.com/watch?v={video_id}' if video_id else '')
+    # Placeholder rows from early collections
+    if 'TBD' in video_id or 'TBD' in url:
+        return None
+    return {
+        'title': row.get('title', ''),
+        'engagement': _int(row.get('view_count')),
+        'date': row.get('published_date', row.get('published', '')),
+        'url': url,
+        'videoId': video_id,
+        'viewCount': _int(row.get('view_count')),
+        'commentCount': _int(row.get('comment_count', row.get('comments'))),
+    }
+
+
+def _reddit_candidate(row):
+    return {
+        'title': row.get('title', ''),
+        'engagement': _int(row.get('score')),
+        'date': row.get('created_date', ''),
+        'url': row.get('url', ''),
+    }
+
+
+def _tiktok_candidate(row):
+    return {
+        'title': row.get('title', ''),
+        'engagement': _int(row.get('views')),
+        'date': row.get('published', ''),
+        'url': row.get('url', ''),
+        'videoId': row.get('video_id', ''),
+        'viewCount': _int(row.get('views')),
+    }
+
+
+def _hackernews_candidate(row):
+    return {
+        'title': row.get('title', ''),
+        'engagement': _int(row.get('points')),
+        'date': row.get('created_date', row.get('date', '')),
+        'url': row.get('url', ''),
+    }
+
+
+def _cfpb_candidate(row):
+    # Complaints carry no engagement; file order decides
+    return {
+        'title': row.get('title', row.get('narrative', '')),
+        'engagement': 0,
+        'date': row.get('date_received', row.get('date', '')),
+        'url': row.get('url', ''),
+    }
+
+
+# Platforms samples are drawn from, and how each one's rows are normalized
+NORMALIZERS = {
+    'youtube': _youtube_candidate,
+    'reddit': _reddit_candidate,
+    'tiktok': _tiktok_candidate,
+    'hackernews': _hackernews_candidate,
+    'cfpb': _cfpb_candidate,
+}
+
+
+def normalize_rows(platform, rows):
+    """Normalized candidates for a file's rows, skipping rows with nothing to show."""
+    normalize = NORMALIZERS[platform]
+    candidates = []
+    for order, row in enumerate(rows):
+        candidate = normalize(row)
+        if candidate is None:
+            continue
+        candidate['title'] = strip_emoji(candidate['title'])
+        if not candidate['title']:
+            continue
+        candidate['date'] = candidate['date'][:10]
+        candidate['order'] = order
+        candidate['level'] = get_level_from_category(row.get('category', ''))
+        candidates.append(candidate)
+    return candidates
+
+
+def top_by_level(candidates, k, by_level=True):
+    """Keep the k most engaged candidates per severity level in one streaming pass.
+
+    Each level holds a bounded min-heap, so the pass is O(n log k) however
+    large the input grows. Ties keep file order, as a stable sort would.
+    With by_level=False every candidate shares one heap (level 0).
+
+    Returns ({level: candidates, highest engagement first}, {level: total candidates}).
+    """
+    levels = (3, 2, 1) if by_level else (0,)
+    heaps = {level: [] for level in levels}
+    counts = {level: 0 for level in levels}
+
+    for candidate in candidates:
+        level = candidate['level'] if by_level else 0
+        counts[level] += 1
+        # (engagement, -order) is unique, so candidates themselves are never compared
+        item = (candidate['engagement'], -candidate['order'], candidate)
+        heap = heaps[level]
+        if len(heap) < k:
+            heapq.heappush(heap, item)
+        elif item[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, item)
+
+    ranked = {
+        level: [item[2] for item in sorted(heap, key=lambda item: item[:2], reverse=True)]
+        for level, heap in heaps.items()
+    }
+    return ranked, counts
+
+
+def _pool_path(slug):
+    return os.path.join(POOL_DIR, f'{slug}.json')
+
+
+def load_pool(slug):
+    """Load one metric's pool: {'platforms': {platform: {'file', 'candidates'}}}."""
+    return read_json(_pool_path(slug), {'metric': slug, 'platforms': {}})
+
+
+def store_candidates(slug, platform, filename, rows):
+    """Replace a metric/platform pool with a file's top candidates if it is the newest."""
+    if platform not in NORMALIZERS:
+        return
+    pool = load_pool(slug)
+    current = pool['platforms'].get(platform)
+    # An equal name is the same file rewritten in place (Reddit dedup), so replace it
+    if current and current['file'] > filename:
+        return
+
+    ranked, _ = top_by_level(normalize_rows(platform, rows), POOL_SIZE)
+    kept = [candidate for level in ranked.values() for candidate in level]
+    kept.sort(key=lambda candidate: candidate['order'])
+    pool['platforms'][platform] = {'file': filename, 'candidates': kept}
+    write_json(_pool_path(slug), pool)
+
+
+def drop_file(slug, platform, filename):
+    """Remove a metric/platform pool drawn from filename. Returns True if it was."""
+    pool = load_pool(slug)
+    current = pool['platforms'].get(platform)
+    if not current or current['file'] != filename:
+        return False
+    del pool['platforms'][platform]
+    write_json(_pool_path(slug), pool)
+    return True
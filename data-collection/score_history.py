@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Append-only per-metric score history, and trends computed from it.
+
+Each metric has collected-data/score_history/<slug>.csv with one row per ISO
+week:
+
+    date,score,official_score,social_score,entries
+
+Appending a week is O(1), and a rerun in the same week rewrites just that
+last row. Trend lookups read only the last few rows by seeking back from
+the end of the file, so they cost the same however long the history grows.
+
+The trend is the least-squares slope of the score over the last
+`trend.window_weeks` weeks (config.json), in points per week: above
+`trend.threshold_per_week` is worsening, below its negative is improving.
+"""
+
+import csv
+import io
+import json
+import os
+from datetime import date
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+HISTORY_DIR = os.path.join(SCRIPT_DIR, 'collected-data', 'score_history')
+
+FIELDS = ['date', 'score', 'official_score', 'social_score', 'entries']
+
+with open(os.path.join(SCRIPT_DIR, 'config.json'), 'r') as f:
+    TREND_CONFIG = json.load(f)['trend']
+
+# Bytes read per step when seeking back for the last rows
+_TAIL_BLOCK = 4096
+
+
+def _history_path(slug):
+    return os.path.join(HISTORY_DIR, f'{slug}.csv')
+
+
+def _tail_lines(path, count):
+    """Last `count` lines of a file as (offset, text) pairs, reading back from the end."""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        position = end
+        data = b''
+        # count + 1 newlines guarantee `count` complete lines (the header stops us early)
+        while position > 0 and data.count(b'\n') <= count:
+            step = min(_TAIL_BLOCK, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+
+    lines = []
+    offset = end
+    for line in reversed(data.splitlines(keepends=True)):
+        offset -= len(line)
+        lines.append((offset, line.decode('utf-8')))
+        if len(lines) == count:
+            break
+    # The first line of a partial block may be cut off; only keep it at offset 0
+    return [(o, text) for o, text in reversed(lines) if o == 0 or o > position]
+
+
+def read_recent(slug, weeks):
+    """The last `weeks` history rows, oldest first, as dicts with parsed values."""
+    path = _history_path(slug)
+    if not os.path.exists(path):
+        return []
+    rows = []
+    for _, text in _tail_lines(path, weeks + 1):
+        values = next(csv.reader([text.rstrip('\r\n')]), [])
+        if not values or values[0] == 'date':
+            continue
+        row = dict(zip(FIELDS, values))
+        rows.append({
+            'date': date.fromisoformat(row['date']),
+            'score': float(row['score']),
+            'official_score': float(row['official_score']),
+            'social_score': float(row['social_score']),
+            'entries': int(row['entries']),
+        })
+    return rows[-weeks:]
+
+
+def _format_row(values):
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator='\n').writerow(values)
+    return buffer.getvalue().encode('utf-8')
+
+
+def record_score(slug, when, score, official_score, social_score, entries):
+    """Append this week's score; a second run in the same ISO week replaces it."""
+    path = _history_path(slug)
+    os.makedirs(HISTORY_DIR, exist_ok=True)
+    line = _format_row([when.isoformat(), round(score, 2), round(official_score, 2),
+                        round(social_score, 2), entries])
+
+    if not os.path.exists(path):
+        with open(path, 'wb') as f:
+            f.write(_format_row(FIELDS) + line)
+        return
+
+    tail = _tail_lines(path, 1)
+    with open(path, 'r+b') as f:
+        if tail:
+            offset, text = tail[0]
+            last_date = text.split(',', 1)[0]
+            if last_date != 'date' and date.fromisoformat(last_date).isocalendar()[:2] == when.isocalendar()[:2]:
+                f.truncate(offset)
+        f.seek(0, os.SEEK_END)
+        f.write(line)
+
+
+def least_squares_slope(points):
+    """Slope of y over x for [(x, y), ...]; None with fewer than two distinct x."""
+    n = len(points)
+    if n < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if variance == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+def score_trend(slug, window_weeks=None, threshold=None):
+    """Trend over the last window_weeks of history: (trend, slope per week).
+
+    Returns (None, None) until there are at least two weeks of history.
+    """
+    window_weeks = window_weeks or TREND_CONFIG['window_weeks']
+    threshold = TREND_CONFIG['threshold_per_week'] if threshold is None else threshold
+
+    history = read_recent(slug, window_weeks)
+    if not history:
+        return None, None
+    start = history[0]['date']
+    slope = least_squares_slope([((row['date'] - start).days / 7, row['score']) for row in history])
+    if slope is None:
+        return None, None
+    if slope > threshold:
+        return 'worsening', slope
+    if slope < -threshold:
+        return 'improving', slope
+    return 'neutral', slope
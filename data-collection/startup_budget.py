@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Startup time of every collector entry point, against a budget.
+
+Each collector runs as its own process, so whatever it does before its first
+request (interpreter start, imports, building the API client) is paid once
+per collector per run. This starts each entry point in a fresh interpreter,
+imports it without running main() and builds its YouTube client if it uses
+one, and reports the wall time against startup_budget_ms (config.json). The
+best of a few runs is reported, so a cold disk cache does not count.
+
+YOUTUBE_API_KEY is set to a placeholder when absent: building a client makes
+no request.
+
+Usage:
+    python startup_budget.py                     # every entry point
+    python startup_budget.py --check             # exit 1 if any is over budget
+    python startup_budget.py --imports tiktok-youtube-collector.py   # its slowest imports
+"""
+
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+with open(os.path.join(SCRIPT_DIR, 'config.json'), 'r') as f:
+    BUDGET_MS = json.load(f)['startup_budget_ms']
+
+# Collectors and jobs the weekly run starts as separate processes
+ENTRY_POINTS = sorted(os.path.basename(path)
+                      for path in glob.glob(os.path.join(SCRIPT_DIR, '*-collector.py')))
+ENTRY_POINTS.append('refresh_youtube_engagement.py')
+
+# Imports the entry point (without running main) and builds its client
+PROBE = """
+import runpy, sys
+runpy.run_path(sys.argv[1], run_name='startup_probe')
+if 'youtube_client' in sys.modules:
+    sys.modules['youtube_client'].get_client()
+"""
+
+RUNS = 3
+
+
+def _environment():
+    env = dict(os.environ)
+    env.setdefault('YOUTUBE_API_KEY', 'startup-probe')
+    return env
+
+
+def measure(script, runs=RUNS):
+    """Best wall time in ms to start `script` in a fresh interpreter, or (None, error)."""
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-c', PROBE, script], cwd=SCRIPT_DIR,
+                                env=_environment(), capture_output=True, text=True)
+        elapsed = (time.perf_counter() - start) * 1000
+        if result.returncode != 0:
+            lines = result.stderr.strip().splitlines()
+            return None, lines[-1] if lines else f'exit status {result.returncode}'
+        best = elapsed if best is None else min(best, elapsed)
+    return best, None
+
+
+def slowest_imports(script, count=15):
+    """The top-level imports of `script` with the largest cumulative time: [(ms, module)]."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', PROBE, script],
+                            cwd=SCRIPT_DIR, env=_environment(), capture_output=True, text=True)
+    imports = []
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # Only top-level entries; nested ones are indented
+        if not name.startswith('  '):
+            imports.append((int(cumulative) / 1000, name.strip()))
+    return sorted(imports, reverse=True)[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Collector startup times against the budget')
+    parser.add_argument('--check', action='store_true', help='exit 1 if any entry point is over budget')
+    parser.add_argument('--imports', metavar='SCRIPT', help="list one entry point's slowest imports")
+    args = parser.parse_args()
+
+    if args.imports:
+        for ms, name in slowest_imports(args.imports):
+            print(f"  {ms:7.1f} ms  {name}")
+        return
+
+    print("=" * 70)
+    print(f"COLLECTOR STARTUP (budget {BUDGET_MS} ms, best of {RUNS})")
+    print("=" * 70)
+    over = []
+    for script in ENTRY_POINTS:
+        ms, error = measure(script)
+        if ms is None:
+            print(f"  {script:42} failed: {error}")
+            continue
+        flag = ''
+        if ms > BUDGET_MS:
+            flag = '  OVER BUDGET'
+            over.append(script)
+        print(f"  {script:42} {ms:6.0f} ms{flag}")
+
+    if over:
+        print(f"\n{len(over)} over budget; see python startup_budget.py --imports <script>")
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
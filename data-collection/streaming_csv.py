@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Streaming CSV writer for collectors.
+
+Collectors write each row as soon as it is classified instead of holding the
+run in memory (or in a DataFrame) and writing it at the end:
+
+    with StreamingCsvWriter(path, FIELDNAMES, rank_field='view_count') as writer:
+        for row in rows:
+            writer.write(row)          # False if the row's ID was already written
+    writer.written, writer.counts, writer.top()
+
+Rows whose ID was already written are skipped, counts per category are kept
+as rows go by, and the top_k rows by rank_field are kept in a bounded heap,
+so the run summary never needs the rows again. Rows go to <path>.tmp, which
+replaces path on exit only if at least one row was written: a failed or
+empty run leaves no file and never clobbers previous data.
+"""
+
+import csv
+import heapq
+import os
+
+
+class StreamingCsvWriter:
+    """Write unique rows straight to a CSV, keeping category counts and the top rows."""
+
+    def __init__(self, path, fieldnames, id_field='video_id', category_field='category',
+                 rank_field=None, top_k=5):
+        self.path = path
+        self.id_field = id_field
+        self.category_field = category_field
+        self.rank_field = rank_field
+        self.top_k = top_k
+        self.written = 0
+        self.duplicates = 0
+        self.counts = {}
+        self.saved = False
+        self._ids = set()
+        self._top = []
+        self._tmp_path = path + '.tmp'
+        self._file = open(self._tmp_path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=fieldnames)
+        self._writer.writeheader()
+
+    def __contains__(self, row_id):
+        return row_id in self._ids
+
+    def write(self, row):
+        """Write a row unless its ID was already written. Returns True if written."""
+        row_id = row[self.id_field]
+        if row_id in self._ids:
+            self.duplicates += 1
+            return False
+        self._ids.add(row_id)
+        self._writer.writerow(row)
+        self.written += 1
+
+        category = row.get(self.category_field)
+        self.counts[category] = self.counts.get(category, 0) + 1
+        if self.rank_field:
+            # Ties keep the earlier row
+            item = (row[self.rank_field], -self.written, row)
+            if len(self._top) < self.top_k:
+                heapq.heappush(self._top, item)
+            else:
+                heapq.heappushpop(self._top, item)
+        return True
+
+    def writerows(self, rows):
+        """Write rows, skipping repeated IDs. Returns how many were written."""
+        return sum(1 for row in rows if self.write(row))
+
+    def top(self):
+        """The top_k rows by rank_field, highest first."""
+        return [row for _, _, row in sorted(self._top, reverse=True)]
+
+    def close(self, keep=True):
+        """Finish the file: it replaces path if kept and not empty, else it is discarded."""
+        if self._file.closed:
+            return
+        self._file.close()
+        if keep and self.written:
+            os.replace(self._tmp_path, self.path)
+            self.saved = True
+        else:
+            os.remove(self._tmp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(keep=exc_type is None)
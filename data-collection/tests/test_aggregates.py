@@ -0,0 +1,122 @@
+import csv
+import os
+from datetime import datetime
+
+import pytest
+
+import aggregates
+import engagement_history
+import sample_pool
+from aggregates import MIN_ROWS, latest_entry, level_counts, load_metric, refresh
+
+FIELDS = ['video_id', 'title', 'view_count', 'category', 'published_date']
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    aggregates_dir = tmp_path / 'aggregates'
+    monkeypatch.setattr(aggregates, 'DATA_DIR', str(tmp_path))
+    monkeypatch.setattr(aggregates, 'AGGREGATES_DIR', str(aggregates_dir))
+    monkeypatch.setattr(aggregates, 'MANIFEST_FILE', str(aggregates_dir / '_manifest.json'))
+    monkeypatch.setattr(aggregates, '_observations', None)
+    monkeypatch.setattr(sample_pool, 'POOL_DIR', str(tmp_path / 'sample_pool'))
+    monkeypatch.setattr(engagement_history, 'HISTORY_DIR', str(tmp_path / 'youtube_engagement'))
+    return tmp_path
+
+
+def _snapshot(data_dir, name, views, prefix='v', category='LEVEL_1_CONCERN'):
+    path = data_dir / name
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        for i, count in enumerate(views):
+            writer.writerow({'video_id': f'{prefix}{i}', 'title': f'Video {prefix}{i}',
+                             'view_count': count, 'category': category,
+                             'published_date': '2026-05-01'})
+    return path
+
+
+def _weeks(slug='healthcare', platform='youtube'):
+    return {week: entry['file'] for week, entry in load_metric(slug)['platforms'].get(platform, {}).items()}
+
+
+def test_newest_file_of_each_week_wins(data_dir):
+    _snapshot(data_dir, 'healthcare_youtube_20260504_100000.csv', [9] * MIN_ROWS)
+    _snapshot(data_dir, 'healthcare_youtube_20260506_100000.csv', [99] * MIN_ROWS)
+    _snapshot(data_dir, 'healthcare_youtube_20260511_100000.csv', [999] * MIN_ROWS, category='LEVEL_3_CRISIS')
+    assert refresh() == 3
+    assert _weeks() == {'2026-W19': 'healthcare_youtube_20260506_100000.csv',
+                        '2026-W20': 'healthcare_youtube_20260511_100000.csv'}
+    entry = latest_entry(load_metric('healthcare'), 'youtube')
+    assert level_counts(entry['levels']) == {'L1': 0, 'L2': 0, 'L3': MIN_ROWS}
+    assert entry['levels']['LEVEL_3_CRISIS']['engagement'] == 999 * MIN_ROWS
+    assert entry['video_ids'] == [f'v{i}' for i in range(MIN_ROWS)]
+
+
+def test_small_files_never_displace_real_data(data_dir):
+    _snapshot(data_dir, 'healthcare_youtube_20260504_100000.csv', [9] * MIN_ROWS)
+    _snapshot(data_dir, 'healthcare_youtube_20260506_100000.csv', [99] * (MIN_ROWS - 1))
+    refresh()
+    assert _weeks() == {'2026-W19': 'healthcare_youtube_20260504_100000.csv'}
+
+
+def test_unchanged_files_are_not_read_again(data_dir, monkeypatch):
+    path = _snapshot(data_dir, 'healthcare_youtube_20260504_100000.csv', [9] * MIN_ROWS)
+    assert refresh() == 1
+    assert refresh() == 0
+    # Same size, different content
+    _snapshot(data_dir, path.name, [8] * MIN_ROWS)
+    assert refresh() == 1
+    assert latest_entry(load_metric('healthcare'), 'youtube')['levels']['LEVEL_1_CONCERN']['engagement'] == 8 * MIN_ROWS
+
+
+def test_deleting_the_latest_file_falls_back_within_its_week(data_dir):
+    _snapshot(data_dir, 'healthcare_youtube_20260504_100000.csv', [9] * MIN_ROWS, prefix='old')
+    newest = _snapshot(data_dir, 'healthcare_youtube_20260506_100000.csv', [99] * MIN_ROWS, prefix='new')
+    refresh()
+    assert sample_pool.load_pool('healthcare')['platforms']['youtube']['file'] == newest.name
+
+    os.remove(newest)
+    refresh()
+    assert _weeks() == {'2026-W19': 'healthcare_youtube_20260504_100000.csv'}
+    pool = sample_pool.load_pool('healthcare')['platforms']['youtube']
+    assert pool['file'] == 'healthcare_youtube_20260504_100000.csv'
+    assert {candidate['videoId'] for candidate in pool['candidates']} == {f'old{i}' for i in range(MIN_ROWS)}
+
+
+def test_deleting_a_weeks_only_file_drops_the_week(data_dir):
+    _snapshot(data_dir, 'healthcare_youtube_20260504_100000.csv', [9] * MIN_ROWS)
+    latest = _snapshot(data_dir, 'healthcare_youtube_20260511_100000.csv', [99] * MIN_ROWS)
+    refresh()
+    os.remove(latest)
+    refresh()
+    assert _weeks() == {'2026-W19': 'healthcare_youtube_20260504_100000.csv'}
+
+
+def test_a_rewrite_below_min_rows_is_taken_back_out(data_dir):
+    _snapshot(data_dir, 'healthcare_youtube_20260504_100000.csv', [9] * MIN_ROWS)
+    newest = _snapshot(data_dir, 'healthcare_youtube_20260506_100000.csv', [99] * MIN_ROWS)
+    refresh()
+    _snapshot(data_dir, newest.name, [99])
+    refresh()
+    assert _weeks() == {'2026-W19': 'healthcare_youtube_20260504_100000.csv'}
+
+
+def test_new_observations_re_read_only_the_entries_holding_them(data_dir, monkeypatch):
+    _snapshot(data_dir, 'healthcare_youtube_20260504_100000.csv', [9] * MIN_ROWS, prefix='a')
+    _snapshot(data_dir, 'healthcare_youtube_20260511_100000.csv', [9] * MIN_ROWS, prefix='b')
+    refresh()
+
+    reads = []
+    metric_rows = aggregates._metric_rows
+    monkeypatch.setattr(aggregates, '_metric_rows', lambda *args: reads.append(args[0]) or metric_rows(*args))
+    engagement_history.append_observations({'b0': {'viewCount': 5000}}, datetime(2026, 5, 12, 10))
+    refresh()
+
+    assert reads == ['healthcare_youtube_20260511_100000.csv']
+    levels = latest_entry(load_metric('healthcare'), 'youtube')['levels']
+    assert levels['LEVEL_1_CONCERN']['engagement'] == 5000 + 9 * (MIN_ROWS - 1)
+
+    reads.clear()
+    refresh()
+    assert reads == []
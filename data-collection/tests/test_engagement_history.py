@@ -0,0 +1,34 @@
+from datetime import datetime
+
+import pytest
+
+import engagement_history
+from engagement_history import append_observations, latest_observations, log_sizes, observed_since
+
+
+@pytest.fixture(autouse=True)
+def history_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(engagement_history, 'HISTORY_DIR', str(tmp_path / 'youtube_engagement'))
+
+
+def test_later_observations_win():
+    append_observations({'a': {'viewCount': 10}}, datetime(2026, 5, 1, 12))
+    append_observations({'a': {'viewCount': 25}, 'b': {'viewCount': 3}}, datetime(2026, 5, 8, 12))
+    latest = latest_observations()
+    assert latest['a'] == (datetime(2026, 5, 8, 12), 25)
+    assert latest['b'] == (datetime(2026, 5, 8, 12), 3)
+
+
+def test_observed_since_reads_only_appended_rows():
+    append_observations({'a': {}, 'b': {}}, datetime(2026, 5, 1, 12))
+    sizes = log_sizes()
+    append_observations({'c': {}}, datetime(2026, 5, 8, 12))
+    append_observations({'d': {}}, datetime(2026, 6, 1, 12))
+    assert observed_since(sizes) == {'c', 'd'}
+    assert observed_since(log_sizes()) == set()
+    assert observed_since({}) == {'a', 'b', 'c', 'd'}
+
+
+def test_observed_since_rereads_a_rewritten_file():
+    append_observations({'a': {}, 'b': {}}, datetime(2026, 5, 1, 12))
+    assert observed_since({'2026-05.csv': 10 ** 6}) == {'a', 'b'}
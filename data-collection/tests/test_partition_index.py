@@ -0,0 +1,53 @@
+import csv
+
+from partition_index import build_index, indexed_row_count, load_index, read_partition
+
+FIELDS = ['metric', 'video_id', 'title', 'views']
+
+
+def _combined(path, rows):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    return str(path)
+
+
+def _row(metric, video_id, title='Title', views='1'):
+    return {'metric': metric, 'video_id': video_id, 'title': title, 'views': views}
+
+
+ROWS = [
+    _row('healthcare', 'a'),
+    _row('healthcare', 'b', 'Two lines,\n"quoted" and all'),
+    _row('layoff_watch', 'c'),
+    _row('healthcare', 'd'),
+]
+
+
+def test_read_partition_returns_only_that_metrics_rows(tmp_path):
+    path = _combined(tmp_path / 'tiktok_youtube_20260504_100000.csv', ROWS)
+    assert read_partition(path, 'healthcare') == [row for row in ROWS if row['metric'] == 'healthcare']
+    assert read_partition(path, 'layoff_watch') == [ROWS[2]]
+    assert read_partition(path, 'missing') == []
+
+
+def test_adjacent_rows_share_one_range(tmp_path):
+    path = _combined(tmp_path / 'tiktok_youtube_20260504_100000.csv', ROWS)
+    index = build_index(path)
+    assert index['rows'] == 4
+    assert index['metrics']['healthcare']['rows'] == 3
+    assert len(index['metrics']['healthcare']['ranges']) == 2
+    assert len(index['metrics']['layoff_watch']['ranges']) == 1
+
+
+def test_a_rewritten_file_is_reindexed(tmp_path):
+    path = _combined(tmp_path / 'tiktok_youtube_20260504_100000.csv', ROWS)
+    assert indexed_row_count(path) is None
+    load_index(path)
+    assert indexed_row_count(path) == 4
+
+    _combined(path, ROWS[:2])
+    assert indexed_row_count(path) is None
+    assert read_partition(path, 'healthcare') == ROWS[:2]
+    assert indexed_row_count(path) == 2
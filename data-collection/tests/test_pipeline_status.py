@@ -0,0 +1,61 @@
+import pytest
+
+import pipeline_status
+from pipeline_status import (count_api_call, load_status, new_files_since, read_catalog_entry,
+                             record_file, track_run)
+
+
+@pytest.fixture(autouse=True)
+def status_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline_status, 'CATALOG_FILE', str(tmp_path / 'run_catalog.jsonl'))
+    monkeypatch.setattr(pipeline_status, 'STATUS_FILE', str(tmp_path / 'pipeline_status.json'))
+
+
+def test_a_run_counts_files_rows_and_api_calls():
+    with track_run('collect-youtube', 'youtube'):
+        record_file('healthcare_youtube_20260504_100000.csv', 40)
+        record_file('layoff_watch_youtube_20260504_100000.csv', 0)
+        count_api_call('search.list', 3)
+        count_api_call('search.list')
+
+    entry = load_status()['collectors']['collect-youtube']
+    assert (entry['status'], entry['files'], entry['rows']) == ('ok', 1, 40)
+    assert entry['api_calls'] == {'search.list': 4}
+    assert read_catalog_entry(entry['catalog_offset'])['rows'] == 40
+
+
+def test_counts_outside_a_run_are_ignored():
+    record_file('healthcare_youtube_20260504_100000.csv', 40)
+    count_api_call('search.list')
+    assert load_status()['collectors'] == {}
+
+
+def test_failures_and_empty_runs():
+    with pytest.raises(RuntimeError):
+        with track_run('collect-bluesky', 'bluesky'):
+            raise RuntimeError('rate limited')
+    with track_run('collect-cfpb', 'cfpb'):
+        pass
+
+    status = load_status()
+    failed = status['collectors']['collect-bluesky']
+    assert failed['status'] == 'failed'
+    assert failed['error'] == 'RuntimeError: rate limited'
+    assert failed['consecutive_failures'] == 1
+    assert status['collectors']['collect-cfpb']['status'] == 'empty'
+    assert status['platforms']['bluesky']['failures'] == 1
+
+
+def test_last_success_survives_a_later_failure():
+    with track_run('collect-bluesky', 'bluesky'):
+        record_file('healthcare_bluesky_20260504_100000.csv', 10)
+    success = load_status()['collectors']['collect-bluesky']['last_success']
+
+    with pytest.raises(SystemExit):
+        with track_run('collect-bluesky', 'bluesky'):
+            raise SystemExit(1)
+
+    entry = load_status()['collectors']['collect-bluesky']
+    assert entry['status'] == 'failed'
+    assert entry['last_success'] == success
+    assert new_files_since(load_status(), 0)['bluesky'] == 0
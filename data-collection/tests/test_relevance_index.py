@@ -0,0 +1,67 @@
+import re
+
+import pytest
+
+from relevance_index import RelevanceIndex, _stem, tokenize
+from update_sample_data import RELEVANCE_KEYWORDS
+
+# Keyword words that have no regular plural: function words, adjectives,
+# participles, names, and words already plural
+NO_PLURAL = {
+    'a', 'ad', 'ai', 'i', 'of', 'to', 'saas', 'crisis', 'airlines', 'cancelled',
+    'delayed', 'denied', 'fired', 'overbooked', 'rejected', 'stranded',
+    'supported', 'uninsured', 'united',
+}
+
+
+def _plural(word):
+    if re.search(r'[^aeiou]y$', word):
+        return word[:-1] + 'ies'
+    if re.search(r'(s|x|z|ch|sh)$', word):
+        return word + 'es'
+    return word + 's'
+
+
+KEYWORD_WORDS = sorted({
+    word
+    for keywords in RELEVANCE_KEYWORDS.values()
+    for keyword in keywords
+    for word in re.findall(r'[a-z0-9]+', keyword)
+    if word not in NO_PLURAL
+})
+
+
+@pytest.mark.parametrize('word', KEYWORD_WORDS)
+def test_keyword_singular_and_plural_share_a_stem(word):
+    assert _stem(word) == _stem(_plural(word))
+
+
+@pytest.mark.parametrize('forms', [
+    ('wage', 'wages'), ('home', 'homes'), ('mortgage', 'mortgages'),
+    ('increase', 'increases'), ('salary', 'salaries'), ('loss', 'losses'),
+    ('layoff', 'layoffs'), ('cancel', 'cancelled', 'cancelling'),
+    ('deny', 'denied'), ('evict', 'evicted', 'evicting'),
+])
+def test_inflections_share_a_stem(forms):
+    assert len({_stem(form) for form in forms}) == 1
+
+
+def test_tokens_do_not_match_inside_words():
+    assert 'ai' not in tokenize('Thai food')
+    assert 'pai' not in tokenize('PayPal refunds')
+
+
+@pytest.mark.parametrize('title, metric', [
+    ('Wages have not kept up', 'Wage Stagnation'),
+    ('Homes are unaffordable now', 'Housing Despair'),
+    ('Mortgages are crushing families', 'Housing Despair'),
+])
+def test_plural_titles_are_relevant(title, metric):
+    index = RelevanceIndex(RELEVANCE_KEYWORDS, [title])
+    assert index.score(title, metric) > 0
+
+
+def test_phrase_keywords_need_the_phrase():
+    index = RelevanceIndex(RELEVANCE_KEYWORDS, [])
+    assert index.score('Prior authorization again', 'What Healthcare?') > 0
+    assert index.score('Authorization prior again', 'What Healthcare?') == 0
@@ -0,0 +1,52 @@
+import csv
+
+import pytest
+
+import rolling_scores
+from rolling_scores import merge_snapshots
+
+
+@pytest.fixture(autouse=True)
+def run_dir(tmp_path, monkeypatch):
+    path = tmp_path / 'sorted_runs'
+    monkeypatch.setattr(rolling_scores, 'RUN_DIR', str(path))
+    return path
+
+
+def _snapshot(path, rows):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=['video_id', 'view_count', 'category'])
+        writer.writeheader()
+        writer.writerows(rows)
+    return str(path)
+
+
+def _row(video_id, views, category='LEVEL_1_CONCERN'):
+    return {'video_id': video_id, 'view_count': views, 'category': category}
+
+
+def test_merge_keeps_one_observation_per_item_from_the_newest_snapshot(tmp_path):
+    newest = _snapshot(tmp_path / 'healthcare_youtube_20260511_100000.csv',
+                       [_row('b', 200, 'LEVEL_3_CRISIS'), _row('c', 30)])
+    older = _snapshot(tmp_path / 'healthcare_youtube_20260504_100000.csv',
+                      [_row('a', 10), _row('b', 100), _row('c', 20)])
+    merged = list(merge_snapshots([newest, older]))
+    assert merged == [
+        ('a', 1, 10, 'LEVEL_1_CONCERN'),
+        ('b', 0, 200, 'LEVEL_3_CRISIS'),
+        ('c', 0, 30, 'LEVEL_1_CONCERN'),
+    ]
+
+
+def test_runs_are_reused_until_the_snapshot_changes(tmp_path, run_dir):
+    path = _snapshot(tmp_path / 'healthcare_youtube_20260504_100000.csv', [_row('a', 10)])
+    list(merge_snapshots([path]))
+    run_file = run_dir / 'healthcare_youtube_20260504_100000.csv.tsv'
+    built = run_file.stat().st_mtime_ns
+
+    list(merge_snapshots([path]))
+    assert run_file.stat().st_mtime_ns == built
+
+    # Same size, different content: the content hash catches it
+    _snapshot(path, [_row('a', 90)])
+    assert list(merge_snapshots([path])) == [('a', 0, 90, 'LEVEL_1_CONCERN')]
@@ -0,0 +1,71 @@
+import pytest
+
+import sample_pool
+from sample_pool import drop_file, load_pool, normalize_rows, store_candidates, top_by_level
+
+
+def _candidate(order, engagement, level):
+    return {'order': order, 'engagement': engagement, 'level': level}
+
+
+def test_top_by_level_keeps_at_most_k_per_level():
+    candidates = [_candidate(i, i * 10, 1 + i % 3) for i in range(30)]
+    ranked, counts = top_by_level(candidates, 3)
+    assert counts == {3: 10, 2: 10, 1: 10}
+    for level, kept in ranked.items():
+        assert len(kept) == 3
+        assert all(candidate['level'] == level for candidate in kept)
+    assert [candidate['engagement'] for candidate in ranked[3]] == [290, 260, 230]
+
+
+def test_top_by_level_with_fewer_candidates_than_k():
+    ranked, counts = top_by_level([_candidate(0, 5, 2)], 3)
+    assert ranked == {3: [], 2: [_candidate(0, 5, 2)], 1: []}
+    assert counts == {3: 0, 2: 1, 1: 0}
+
+
+def test_top_by_level_ties_keep_file_order():
+    candidates = [_candidate(i, 7, 1) for i in range(5)]
+    ranked, _ = top_by_level(candidates, 2)
+    assert [candidate['order'] for candidate in ranked[1]] == [0, 1]
+
+
+def test_top_by_level_can_share_one_heap():
+    candidates = [_candidate(i, i, 1 + i % 3) for i in range(6)]
+    ranked, counts = top_by_level(candidates, 4, by_level=False)
+    assert [candidate['order'] for candidate in ranked[0]] == [5, 4, 3, 2]
+    assert counts == {0: 6}
+
+
+def test_normalize_rows_skips_placeholders_and_empty_titles():
+    rows = [
+        {'video_id': 'a', 'title': 'Medical debt', 'view_count': '12', 'category': 'LEVEL_2_STRESS',
+         'published_date': '2026-05-01T10:00:00Z'},
+        {'video_id': 'TBD_1', 'title': 'Placeholder', 'view_count': '99'},
+        {'video_id': 'b', 'title': '', 'view_count': '5'},
+    ]
+    [candidate] = normalize_rows('youtube', rows)
+    assert candidate['videoId'] == 'a'
+    assert (candidate['engagement'], candidate['level'], candidate['date']) == (12, 2, '2026-05-01')
+
+
+def test_newer_files_replace_the_pool_and_dropping_removes_it(tmp_path, monkeypatch):
+    monkeypatch.setattr(sample_pool, 'POOL_DIR', str(tmp_path))
+    rows = [{'title': f'Post {i}', 'score': str(i), 'url': f'https://x/{i}'} for i in range(20)]
+    store_candidates('healthcare', 'reddit', 'healthcare_reddit_20260504_100000.csv', rows)
+    pool = load_pool('healthcare')['platforms']['reddit']
+    assert len(pool['candidates']) == sample_pool.POOL_SIZE
+    assert [c['order'] for c in pool['candidates']] == sorted(c['order'] for c in pool['candidates'])
+
+    # An older file never displaces a newer one
+    store_candidates('healthcare', 'reddit', 'healthcare_reddit_20260427_100000.csv', rows[:1])
+    assert load_pool('healthcare')['platforms']['reddit']['file'] == pool['file']
+
+    assert not drop_file('healthcare', 'reddit', 'healthcare_reddit_20260427_100000.csv')
+    assert drop_file('healthcare', 'reddit', pool['file'])
+    assert load_pool('healthcare')['platforms'] == {}
+
+
+@pytest.mark.parametrize('platform', sorted(sample_pool.NORMALIZERS))
+def test_every_platform_normalizes_an_empty_row(platform):
+    assert normalize_rows(platform, [{}]) == []
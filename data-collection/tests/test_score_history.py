@@ -0,0 +1,60 @@
+from datetime import date
+
+import pytest
+
+import score_history
+from score_history import _tail_lines, least_squares_slope, read_recent, record_score
+
+
+@pytest.fixture
+def history(tmp_path, monkeypatch):
+    monkeypatch.setattr(score_history, 'HISTORY_DIR', str(tmp_path))
+    path = tmp_path / 'healthcare.csv'
+    lines = ['date,score,official_score,social_score,entries\n']
+    lines += [f'2026-01-{day:02d},{day}.5,{day},{day + 1},{day * 10}\n' for day in range(1, 29)]
+    path.write_text(''.join(lines))
+    return path, lines
+
+
+def test_tail_lines_returns_the_last_lines_with_their_offsets(history):
+    path, lines = history
+    tail = _tail_lines(str(path), 3)
+    assert [text for _, text in tail] == lines[-3:]
+    data = path.read_bytes()
+    for offset, text in tail:
+        assert data[offset:offset + len(text)] == text.encode('utf-8')
+
+
+def test_tail_lines_seeks_back_across_blocks(history, monkeypatch):
+    path, lines = history
+    # A tiny block forces several seeks and lines cut across block edges
+    monkeypatch.setattr(score_history, '_TAIL_BLOCK', 7)
+    assert [text for _, text in _tail_lines(str(path), 5)] == lines[-5:]
+
+
+def test_tail_lines_stops_at_the_start_of_a_short_file(history):
+    path, lines = history
+    tail = _tail_lines(str(path), 100)
+    assert [text for _, text in tail] == lines
+    assert tail[0][0] == 0
+
+
+def test_read_recent_skips_the_header(history):
+    rows = read_recent('healthcare', 2)
+    assert [row['entries'] for row in rows] == [270, 280]
+    assert len(read_recent('healthcare', 100)) == 28
+    assert read_recent('missing', 4) == []
+
+
+def test_a_second_run_in_the_same_week_replaces_its_row(tmp_path, monkeypatch):
+    monkeypatch.setattr(score_history, 'HISTORY_DIR', str(tmp_path))
+    record_score('healthcare', date(2026, 5, 4), 50, 40, 60, 100)
+    record_score('healthcare', date(2026, 5, 7), 55, 40, 70, 120)
+    record_score('healthcare', date(2026, 5, 11), 52, 41, 63, 90)
+    rows = read_recent('healthcare', 4)
+    assert [(row['date'], row['entries']) for row in rows] == [
+        (date(2026, 5, 7), 120), (date(2026, 5, 11), 90)]
+
+
+def test_least_squares_slope():
+    assert least_squares_slope([(0, 1.0), (1, 3.0), (2, 5.0)]) == pytest.approx(2.0)
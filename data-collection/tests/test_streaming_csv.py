@@ -0,0 +1,61 @@
+import csv
+
+import pytest
+
+from streaming_csv import StreamingCsvWriter
+
+FIELDS = ['video_id', 'view_count', 'category']
+
+
+def _row(video_id, views, category='LEVEL_1_CONCERN'):
+    return {'video_id': video_id, 'view_count': views, 'category': category}
+
+
+def test_repeated_ids_are_written_once(tmp_path):
+    path = tmp_path / 'out.csv'
+    with StreamingCsvWriter(str(path), FIELDS) as writer:
+        assert writer.write(_row('a', 1))
+        assert not writer.write(_row('a', 2))
+        assert writer.writerows([_row('b', 3), _row('a', 4), _row('c', 5, 'LEVEL_2_STRESS')]) == 2
+        assert 'b' in writer
+
+    assert (writer.written, writer.duplicates) == (3, 2)
+    assert writer.counts == {'LEVEL_1_CONCERN': 2, 'LEVEL_2_STRESS': 1}
+    with open(path, newline='') as f:
+        assert [row['view_count'] for row in csv.DictReader(f)] == ['1', '3', '5']
+
+
+def test_top_keeps_the_highest_ranked_rows_and_ties_keep_the_earlier(tmp_path):
+    with StreamingCsvWriter(str(tmp_path / 'out.csv'), FIELDS, rank_field='view_count', top_k=2) as writer:
+        writer.writerows([_row('a', 5), _row('b', 9), _row('c', 9), _row('d', 1)])
+    assert [row['video_id'] for row in writer.top()] == ['b', 'c']
+
+
+def test_file_appears_only_when_finished(tmp_path):
+    path = tmp_path / 'out.csv'
+    with StreamingCsvWriter(str(path), FIELDS) as writer:
+        writer.write(_row('a', 1))
+        assert not path.exists()
+        assert (tmp_path / 'out.csv.tmp').exists()
+    assert writer.saved
+    assert path.exists()
+    assert not (tmp_path / 'out.csv.tmp').exists()
+
+
+def test_empty_run_leaves_no_file(tmp_path):
+    path = tmp_path / 'out.csv'
+    with StreamingCsvWriter(str(path), FIELDS) as writer:
+        pass
+    assert not writer.saved
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_failed_run_keeps_the_previous_file(tmp_path):
+    path = tmp_path / 'out.csv'
+    path.write_text('previous\n')
+    with pytest.raises(RuntimeError):
+        with StreamingCsvWriter(str(path), FIELDS) as writer:
+            writer.write(_row('a', 1))
+            raise RuntimeError('collector crashed')
+    assert path.read_text() == 'previous\n'
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,39 @@
+from update_sample_data import _ranked_candidates
+
+
+def _candidate(order, engagement, title, level=3):
+    return {'order': order, 'engagement': engagement, 'title': title, 'level': level}
+
+
+def _titles(candidates, relevance, **kwargs):
+    return [c['title'] for c in _ranked_candidates(candidates, relevance, **kwargs)]
+
+
+def test_relevance_does_not_promote_a_much_weaker_item():
+    candidates = [_candidate(0, 247000, 'popular'), _candidate(1, 12000, 'apt')]
+    scores = {'popular': 0.1, 'apt': 0.9}
+    assert _titles(candidates, lambda c: scores[c['title']]) == ['popular', 'apt']
+
+
+def test_relevance_reorders_comparably_engaged_items():
+    candidates = [_candidate(0, 100000, 'popular'), _candidate(1, 60000, 'apt')]
+    scores = {'popular': 0.1, 'apt': 0.9}
+    assert _titles(candidates, lambda c: scores[c['title']]) == ['apt', 'popular']
+
+
+def test_off_topic_candidates_are_dropped():
+    candidates = [_candidate(0, 5000, 'off'), _candidate(1, 10, 'on')]
+    assert _titles(candidates, lambda c: 0.0 if c['title'] == 'off' else 0.5) == ['on']
+
+
+def test_levels_come_highest_first():
+    candidates = [_candidate(0, 900, 'mild', level=1), _candidate(1, 10, 'crisis', level=3)]
+    assert _titles(candidates, lambda c: 1.0) == ['crisis', 'mild']
+
+
+def test_doubling_reaches_past_the_first_band():
+    # Only the 11th most engaged candidate is relevant
+    candidates = [_candidate(i, 1000 - i, f'noise {i}') for i in range(10)]
+    candidates.append(_candidate(10, 1, 'match'))
+    relevance = lambda c: 1.0 if c['title'] == 'match' else 0.0
+    assert _titles(candidates, relevance, k=4) == ['match']
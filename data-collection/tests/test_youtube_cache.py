@@ -0,0 +1,86 @@
+import json
+
+import pytest
+
+import youtube_cache
+from youtube_cache import SearchCache, VideoCache, search_key
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1767000000
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(youtube_cache.time, 'time', clock)
+    return clock
+
+
+def _video(video_id, **fields):
+    return dict({'id': video_id}, **fields)
+
+
+def test_entries_expire_after_the_ttl(tmp_path, clock):
+    cache = VideoCache(str(tmp_path / 'videos.json'), ttl_hours=1, max_entries=10)
+    cache.put(_video('a', title='A'), ['snippet'])
+    clock.now += 3600
+    assert cache.get('a', ['snippet']) == {'id': 'a', 'title': 'A'}
+    clock.now += 1
+    assert cache.get('a', ['snippet']) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    # A caller may accept older entries than the TTL
+    assert cache.get('a', ['snippet'], max_age=7200) is not None
+
+
+def test_a_video_answers_only_requests_for_parts_it_holds(tmp_path, clock):
+    cache = VideoCache(str(tmp_path / 'videos.json'), ttl_hours=1, max_entries=10)
+    cache.put(_video('a', snippet={'title': 'A'}), ['snippet'])
+    assert cache.get('a', ['snippet', 'statistics']) is None
+    cache.put(_video('a', statistics={'viewCount': '5'}), ['statistics'])
+    assert cache.get('a', ['snippet', 'statistics']) == {
+        'id': 'a', 'snippet': {'title': 'A'}, 'statistics': {'viewCount': '5'}}
+
+
+def test_save_evicts_the_least_recently_used(tmp_path, clock):
+    path = tmp_path / 'videos.json'
+    cache = VideoCache(str(path), ttl_hours=24, max_entries=2)
+    for video_id in ('a', 'b', 'c'):
+        cache.put(_video(video_id), ['snippet'])
+        clock.now += 10
+    # Reading 'a' makes 'b' the least recently used
+    cache.get('a', ['snippet'])
+    cache.save()
+
+    assert set(json.loads(path.read_text())) == {'a', 'c'}
+    assert len(VideoCache(str(path), ttl_hours=24, max_entries=2)) == 2
+    assert not (tmp_path / 'videos.json.tmp').exists()
+
+
+def test_save_skips_an_unchanged_cache(tmp_path, clock):
+    path = tmp_path / 'videos.json'
+    VideoCache(str(path), ttl_hours=1, max_entries=10).save()
+    assert not path.exists()
+
+
+def test_search_key_ignores_the_time_of_day():
+    morning = {'q': 'medical debt', 'publishedAfter': '2026-02-01T08:00:00Z', 'order': 'viewCount'}
+    evening = dict(morning, publishedAfter='2026-02-01T20:30:00Z')
+    assert search_key(morning) == search_key(evening)
+    assert search_key(morning) != search_key(dict(morning, order='date'))
+
+
+def test_has_does_not_count_as_a_hit(tmp_path, clock):
+    cache = SearchCache(str(tmp_path / 'searches.json'), ttl_hours=1, max_entries=10)
+    params = {'q': 'rent', 'publishedAfter': '2026-02-01T08:00:00Z'}
+    assert not cache.has(params)
+    cache.put(params, [{'id': 'a'}])
+    assert cache.has(params)
+    assert cache.get(params) == [{'id': 'a'}]
+    assert (cache.hits, cache.misses) == (1, 0)
+    clock.now += 3601
+    assert not cache.has(params)
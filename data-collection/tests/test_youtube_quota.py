@@ -0,0 +1,65 @@
+import pytest
+
+import youtube_quota
+from youtube_quota import TERM_COST, allowance, plan, quota_day
+
+
+@pytest.fixture(autouse=True)
+def quota(tmp_path, monkeypatch):
+    monkeypatch.setattr(youtube_quota, 'LEDGER_FILE', str(tmp_path / 'youtube_quota.json'))
+    config = {'daily_units': 10000, 'reserve_units': 200, 'priority': {}}
+    monkeypatch.setattr(youtube_quota, 'QUOTA_CONFIG', config)
+    monkeypatch.setattr(youtube_quota, '_active_plan', None)
+    return config
+
+
+def _ledger(spent=None, demand=None, exhausted=False):
+    return {'day': quota_day(), 'spent': spent or {}, 'demand': demand or {},
+            'term_yield': {}, 'exhausted': exhausted}
+
+
+def test_allowance_splits_what_is_left_by_demand():
+    ledger = _ledger(spent={'done': 1800}, demand={'a': 9000, 'done': 1800})
+    # 8000 left, shared 9000:3000 between a (pending) and b (planning)
+    assert allowance(ledger, 'b', 3000) == 2000
+    # Never more than asked for
+    assert allowance(_ledger(demand={'a': 1000}), 'b', 100) == 100
+
+
+def test_allowance_weights_by_priority(quota):
+    quota['priority'] = {'a': 3.0}
+    ledger = _ledger(demand={'a': 1000})
+    assert allowance(ledger, 'b', 9800) == int(9800 * 9800 / (3000 + 9800))
+
+
+def test_allowance_is_zero_once_exhausted():
+    assert allowance(_ledger(exhausted=True), 'a', 1000) == 0
+
+
+def test_collectors_that_already_ran_take_no_share():
+    ledger = _ledger(spent={'cached': 0}, demand={'cached': 5000})
+    assert allowance(ledger, 'b', 9800) == 9800
+
+
+def test_plan_records_a_cached_only_run():
+    plan('cached', ['a', 'b'], cached_terms=['a', 'b'])
+    ledger = youtube_quota.load_ledger()
+    assert ledger['spent'] == {'cached': 0}
+    assert allowance(ledger, 'later', 9800) == 9800
+
+
+def test_plan_keeps_one_term_on_a_thin_share():
+    youtube_quota.write_json(youtube_quota.LEDGER_FILE, _ledger(
+        spent={'done': 9750}, demand={'big': 100000}))
+    quota_plan = plan('small', ['x', 'y', 'z'])
+    assert len(quota_plan.terms) == 1
+    assert quota_plan.can_afford(quota_plan.terms[0])
+    quota_plan.charge('youtube.search')
+    assert not quota_plan.can_afford('another')
+
+
+def test_plan_keeps_untried_terms_then_best_yield():
+    ledger = _ledger(spent={'done': 9800 - 2 * TERM_COST})
+    ledger['term_yield'] = {'c': {'low': 1.0, 'high': 9.0}}
+    youtube_quota.write_json(youtube_quota.LEDGER_FILE, ledger)
+    assert plan('c', ['low', 'high', 'new']).terms == ['high', 'new']
@@ -13,13 +13,18 @@ Usage:
 """
 
 import os
-import csv
+import itertools
 import math
 from datetime import datetime
+from aggregates import safe_ingest_file
+import youtube_quota
+from pipeline_status import track_run
+from partition_index import safe_build_index
+from streaming_csv import StreamingCsvWriter
+from youtube_client import fetch_videos, get_client, search_cached, search_videos
 from content_filters import filter_content
 
 try:
-    from googleapiclient.discovery import build
     from googleapiclient.errors import HttpError
 except ImportError:
     print("ERROR: google-api-python-client not installed.")
@@ -117,6 +122,10 @@ LEVEL_2_KEYWORDS = [
     'reaction', 'shocked', 'wow', 'crazy'
 ]
 
+FIELDNAMES = ['metric', 'video_id', 'url', 'title', 'channel', 'description',
+              'views', 'likes', 'comments', 'engagement_score', 'category',
+              'published', 'collected_date', 'source']
+
 
 def categorize_content(text, description=''):
     """Categorize content by severity level."""
@@ -146,36 +155,38 @@ def calculate_engagement_score(views, likes, comments):
     return round(engagement_rate * view_weight * 100, 2)
 
 
+def search_params(query, max_results=15):
+    """search.list parameters for one compilation query."""
+    return {
+        'q': query,
+        'part': 'id,snippet',
+        'maxResults': max_results,
+        'type': 'video',
+        'order': 'relevance',
+        'relevanceLanguage': 'en',
+        'regionCode': 'US',
+        'publishedAfter': '2024-01-01T00:00:00Z',  # Recent content only
+    }
+
+
 def search_tiktok_compilations(youtube, query, max_results=15):
     """Search YouTube for TikTok compilation videos."""
     try:
-        search_response = youtube.search().list(
-            q=query,
-            part='id,snippet',
-            maxResults=max_results,
-            type='video',
-            order='relevance',
-            relevanceLanguage='en',
-            regionCode='US',
-            publishedAfter='2024-01-01T00:00:00Z',  # Recent content only
-        ).execute()
-
-        video_ids = [item['id']['videoId'] for item in search_response.get('items', [])]
+        items = search_videos(youtube, **search_params(query, max_results))
+
+        video_ids = [item['id']['videoId'] for item in items]
 
         if not video_ids:
             return []
 
         # Get detailed video stats
-        videos_response = youtube.videos().list(
-            part='snippet,statistics',
-            id=','.join(video_ids)
-        ).execute()
-
-        return videos_response.get('items', [])
+        videos = fetch_videos(youtube, video_ids, part='snippet,statistics')
+        return [videos[video_id] for video_id in video_ids if video_id in videos]
 
     except HttpError as e:
-        if e.resp.status == 403:
+        if youtube_quota.is_quota_error(e):
             print(f"    API quota exceeded")
+            youtube_quota.mark_exhausted()
         else:
             print(f"    HTTP Error: {e}")
         return []
@@ -184,8 +195,8 @@ def search_tiktok_compilations(youtube, query, max_results=15):
         return []
 
 
-def collect_metric_tiktoks(youtube, metric_name, queries):
-    """Collect TikTok compilation videos for a metric."""
+def collect_metric_tiktoks(youtube, metric_name, queries, quota):
+    """Collect TikTok compilation videos for a metric, searching the queries the quota plan kept."""
     print(f"\n{'='*60}")
     print(f"Collecting TikTok compilations: {metric_name.upper().replace('_', ' ')}")
     print(f"{'='*60}")
@@ -194,6 +205,11 @@ def collect_metric_tiktoks(youtube, metric_name, queries):
     seen_ids = set()
 
     for query in queries:
+        if query not in quota.terms:
+            continue
+        if not quota.can_afford(query):
+            print(f"\n  Quota allowance used up; skipping remaining queries")
+            break
         print(f"\n  Searching: '{query}'")
 
         videos = search_tiktok_compilations(youtube, query)
@@ -218,7 +234,6 @@ def collect_metric_tiktoks(youtube, metric_name, queries):
             likes = int(stats.get('likeCount', 0))
             comments = int(stats.get('commentCount', 0))
 
-            full_text = f"{title} {description}"
             category = categorize_content(title, description)
 
             # Skip filtered content (clickbait/spam)
@@ -246,6 +261,7 @@ def collect_metric_tiktoks(youtube, metric_name, queries):
             new_count += 1
 
         print(f"    Found {new_count} new videos")
+        quota.record_yield(query, new_count)
 
     return all_videos
 
@@ -257,80 +273,72 @@ def main():
     print("=" * 80)
     print("\nStrategy: Find TikTok content via YouTube compilation videos")
 
-    youtube = build('youtube', 'v3', developerKey=API_KEY)
-
-    all_results = []
-
-    for metric_name, queries in TIKTOK_QUERIES.items():
-        videos = collect_metric_tiktoks(youtube, metric_name, queries)
-        all_results.extend(videos)
-
-        # Stats for this metric
-        if videos:
-            l3 = sum(1 for v in videos if v['category'] == 'LEVEL_3_CRISIS')
-            l2 = sum(1 for v in videos if v['category'] == 'LEVEL_2_FRUSTRATED')
-            l1 = sum(1 for v in videos if v['category'] == 'LEVEL_1_CASUAL')
-            total_views = sum(v['views'] for v in videos)
-            print(f"\n  Total: {len(videos)} | Views: {total_views:,} | L1: {l1}, L2: {l2}, L3: {l3}")
-
-    # Deduplicate - same video can appear in multiple metric searches
-    if all_results:
-        seen_ids = set()
-        deduplicated = []
-        for video in all_results:
-            if video['video_id'] not in seen_ids:
-                seen_ids.add(video['video_id'])
-                deduplicated.append(video)
-
-        duplicates_removed = len(all_results) - len(deduplicated)
-        if duplicates_removed > 0:
-            print(f"\n  Removed {duplicates_removed} cross-metric duplicates")
-
-        all_results = deduplicated
-
-    # Save results
-    if all_results:
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        output_file = f'collected-data/tiktok_youtube_{timestamp}.csv'
-
-        fieldnames = ['metric', 'video_id', 'url', 'title', 'channel', 'description',
-                      'views', 'likes', 'comments', 'engagement_score', 'category',
-                      'published', 'collected_date', 'source']
-
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(all_results)
-
-        print(f"\n{'='*80}")
-        print("COLLECTION COMPLETE")
-        print(f"{'='*80}")
-        print(f"Total TikTok compilation videos: {len(all_results)}")
-        print(f"Saved to: {output_file}")
-
-        # Summary by metric
-        print(f"\n{'='*80}")
-        print("BY METRIC")
-        print(f"{'='*80}")
-        for metric in TIKTOK_QUERIES.keys():
-            count = sum(1 for r in all_results if r['metric'] == metric)
-            views = sum(r['views'] for r in all_results if r['metric'] == metric)
-            print(f"  {metric.replace('_', ' ').title():25} {count:3} videos ({views:,} views)")
-
-        # Overall level distribution
-        print(f"\n{'='*80}")
-        print("SEVERITY DISTRIBUTION")
-        print(f"{'='*80}")
-        l1 = sum(1 for r in all_results if r['category'] == 'LEVEL_1_CASUAL')
-        l2 = sum(1 for r in all_results if r['category'] == 'LEVEL_2_FRUSTRATED')
-        l3 = sum(1 for r in all_results if r['category'] == 'LEVEL_3_CRISIS')
-        total = len(all_results)
-        print(f"  Level 1 (Casual):     {l1:3} ({l1/total*100:.1f}%)")
-        print(f"  Level 2 (Frustrated): {l2:3} ({l2/total*100:.1f}%)")
-        print(f"  Level 3 (Crisis):     {l3:3} ({l3/total*100:.1f}%)")
-    else:
+    youtube = get_client()
+    # Queries round-robin across metrics, so a tight quota trims every metric's
+    # list instead of dropping the last metrics entirely
+    rounds = itertools.zip_longest(*TIKTOK_QUERIES.values())
+    planned = [query for queries in rounds for query in queries if query]
+    quota = youtube_quota.plan('tiktok-youtube-collector', planned,
+                               cached_terms=[query for query in planned
+                                             if search_cached(**search_params(query))])
+
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    output_file = f'collected-data/tiktok_youtube_{timestamp}.csv'
+    by_metric = {}
+
+    # Rows are written metric by metric as they are collected, so each metric
+    # indexes as one range; the file only appears if any were written
+    with StreamingCsvWriter(output_file, FIELDNAMES) as writer:
+        for metric_name, queries in TIKTOK_QUERIES.items():
+            videos = collect_metric_tiktoks(youtube, metric_name, queries, quota)
+
+            # Stats for this metric
+            if videos:
+                l3 = sum(1 for v in videos if v['category'] == 'LEVEL_3_CRISIS')
+                l2 = sum(1 for v in videos if v['category'] == 'LEVEL_2_FRUSTRATED')
+                l1 = sum(1 for v in videos if v['category'] == 'LEVEL_1_CASUAL')
+                total_views = sum(v['views'] for v in videos)
+                print(f"\n  Total: {len(videos)} | Views: {total_views:,} | L1: {l1}, L2: {l2}, L3: {l3}")
+
+            # Same video can appear in multiple metric searches; the first metric keeps it
+            written = [video for video in videos if writer.write(video)]
+            by_metric[metric_name] = (len(written), sum(v['views'] for v in written))
+
+    if writer.duplicates:
+        print(f"\n  Removed {writer.duplicates} cross-metric duplicates")
+
+    if not writer.saved:
         print("\nNo videos collected. API quota may be exceeded.")
-
+        return
+
+    safe_ingest_file(output_file)
+    safe_build_index(output_file)
+
+    print(f"\n{'='*80}")
+    print("COLLECTION COMPLETE")
+    print(f"{'='*80}")
+    print(f"Total TikTok compilation videos: {writer.written}")
+    print(f"Saved to: {output_file}")
+
+    # Summary by metric
+    print(f"\n{'='*80}")
+    print("BY METRIC")
+    print(f"{'='*80}")
+    for metric, (count, views) in by_metric.items():
+        print(f"  {metric.replace('_', ' ').title():25} {count:3} videos ({views:,} views)")
+
+    # Overall level distribution
+    print(f"\n{'='*80}")
+    print("SEVERITY DISTRIBUTION")
+    print(f"{'='*80}")
+    l1 = writer.counts.get('LEVEL_1_CASUAL', 0)
+    l2 = writer.counts.get('LEVEL_2_FRUSTRATED', 0)
+    l3 = writer.counts.get('LEVEL_3_CRISIS', 0)
+    total = writer.written
+    print(f"  Level 1 (Casual):     {l1:3} ({l1/total*100:.1f}%)")
+    print(f"  Level 2 (Frustrated): {l2:3} ({l2/total*100:.1f}%)")
+    print(f"  Level 3 (Crisis):     {l3:3} ({l3/total*100:.1f}%)")
 
 if __name__ == '__main__':
-    main()
+    with track_run('tiktok-youtube-collector', 'tiktok'):
+        main()
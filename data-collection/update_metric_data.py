@@ -1,26 +1,32 @@
 #!/usr/bin/env python3
 """
-Automatically updates metricDetailData.ts with calculated scores from collected data.
+Automatically updates the generated metric data (lib/metricData.generated.json,
+imported by lib/metricDetailData.ts) with calculated scores from collected data.
 This script is designed to run as part of the weekly automation pipeline.
 
 Usage:
     python update_metric_data.py
+    python update_metric_data.py --samples     # also refresh sampleData in the same pass
+    python update_metric_data.py --workers 4   # score metrics in 4 processes
 """
 
-import csv
+import argparse
 import json
-import math
 import os
 import re
-from datetime import datetime
+from datetime import date, datetime
 
 # Change to the script's directory
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 os.chdir(SCRIPT_DIR)
 
-from data_utils import count_data_rows, get_latest_file as _get_latest_file
+import aggregates
+import score_history
+import update_sample_data
+from data_utils import load_fred_scores, map_metrics
+from metric_data import METRIC_DATA_FILE, load_metric_data, save_metric_data, write_if_changed
 
-METRIC_DATA_FILE = '../lib/metricDetailData.ts'
+SCORE_BREAKDOWN_FILE = 'collected-data/score_breakdown.json'
 
 # Load centralized config
 with open('config.json', 'r') as f:
@@ -31,8 +37,6 @@ METRICS = {}
 for m in CONFIG['metrics']:
     METRICS[m['name']] = {
         'slug': m['slug'],
-        'youtube_pattern': m['youtube_pattern'],
-        'reddit_pattern': m['reddit_pattern'],
         'official_score': m['official_score']
     }
 
@@ -40,360 +44,292 @@ SEVERITY_WEIGHTS = CONFIG['severity_weights']
 OFFICIAL_WEIGHT = CONFIG['formula']['official_weight']
 SOCIAL_WEIGHT = CONFIG['formula']['social_weight']
 
-# TikTok file pattern (contains all metrics)
-TIKTOK_PATTERN = 'tiktok_youtube_*.csv'
-
-
-def get_latest_file(pattern, min_rows=5):
-    """Get the most recent file matching the pattern that has real data."""
-    return _get_latest_file(f'collected-data/{pattern}', min_rows=min_rows)
-
-
-def _read_rows_with_levels(csv_file, filter_metric=None):
-    """Read a category CSV, count L1/L2/L3 distribution; optionally filter by 'metric' column."""
-    rows = []
-    level_counts = {'L1': 0, 'L2': 0, 'L3': 0}
-    if not csv_file:
-        return rows, level_counts, 0
-    try:
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if filter_metric is not None and row.get('metric', '') != filter_metric:
-                    continue
-                rows.append(row)
-                category = row.get('category', '')
-                if 'LEVEL_1' in category:
-                    level_counts['L1'] += 1
-                elif 'LEVEL_2' in category:
-                    level_counts['L2'] += 1
-                elif 'LEVEL_3' in category:
-                    level_counts['L3'] += 1
-    except Exception as e:
-        print(f"  Error reading {csv_file}: {e}")
-    return rows, level_counts, len(rows)
-
-
-def get_tiktok_data_for_metric(metric_slug):
-    """Extract TikTok data for a specific metric from the combined file."""
-    return _read_rows_with_levels(get_latest_file(TIKTOK_PATTERN), filter_metric=metric_slug)
-
-
-def get_engagement_value(row):
-    """Extract the best engagement value from a row across different source formats."""
-    for field in ('view_count', 'views', 'score', 'points', 'like_count'):
-        try:
-            val = int(row.get(field, 0) or 0)
-            if val > 0:
-                return val
-        except (ValueError, TypeError):
-            continue
-    return 1
-
-
-def get_source_data(pattern):
-    """Read rows, level counts, and total from the latest file matching pattern."""
-    return _read_rows_with_levels(get_latest_file(pattern))
-
-
-def load_fred_scores():
-    """Load FRED official scores if the file exists."""
-    fred_file = 'collected-data/official_scores.json'
-    if not os.path.exists(fred_file):
-        return {}
-    try:
-        with open(fred_file, 'r') as f:
-            data = json.load(f)
-        scores = {}
-        for slug, info in data.get('scores', {}).items():
-            if info.get('source') == 'fred':
-                scores[slug] = info['score']
-        return scores
-    except Exception as e:
-        print(f"  Warning: Could not load FRED scores: {e}")
-        return {}
-
-
-def calculate_metric_scores():
-    """Calculate scores for all metrics."""
-    results = {}
-    fred_scores = load_fred_scores()
-    if fred_scores:
-        print(f"FRED official scores loaded for: {', '.join(fred_scores.keys())}")
 
-    for metric_name, config in METRICS.items():
-        print(f"\nProcessing: {metric_name}")
-        slug = config['slug']
-
-        # Collect data from all sources
-        sources = {}
-        sources['youtube'] = get_source_data(config['youtube_pattern'])
-        sources['reddit'] = get_source_data(config['reddit_pattern'])
-        sources['tiktok'] = get_tiktok_data_for_metric(slug)
-        sources['hackernews'] = get_source_data(f'{slug}_hackernews_*.csv')
-        sources['cfpb'] = get_source_data(f'{slug}_cfpb_*.csv')
-        sources['bluesky'] = get_source_data(f'{slug}_bluesky_*.csv')
-
-        # Combine all rows for engagement-weighted scoring
-        total_weighted = 0
-        total_engagement = 0
-
-        for source_name, (rows, levels, count) in sources.items():
-            for row in rows:
-                engagement_val = get_engagement_value(row)
-                category = row.get('category', '')
-                severity = SEVERITY_WEIGHTS.get(category, 0.33)
-                engagement = math.log10(engagement_val + 1)
-                total_weighted += severity * engagement
-                total_engagement += engagement
-
-        if total_engagement > 0:
-            combined_social = (total_weighted / total_engagement) * 100
-        else:
-            combined_social = 0
-
-        # Use FRED official score when available
-        official = fred_scores.get(slug, config['official_score'])
-        if slug in fred_scores:
-            print(f"  Official: {official:.2f} (FRED)")
-        final_score = (official * OFFICIAL_WEIGHT) + (combined_social * SOCIAL_WEIGHT)
-
-        # Aggregate level counts and totals
-        total_l1 = sum(s[1]['L1'] for s in sources.values())
-        total_l2 = sum(s[1]['L2'] for s in sources.values())
-        total_l3 = sum(s[1]['L3'] for s in sources.values())
-        total_entries = sum(s[2] for s in sources.values())
-
-        results[metric_name] = {
-            'score': round(final_score, 2),
-            'crisisRatio': round(combined_social, 2),
-            'level1': total_l1,
-            'level2': total_l2,
-            'level3': total_l3,
-            'total': total_entries,
-            'youtube_count': sources['youtube'][2],
-            'reddit_count': sources['reddit'][2],
-            'tiktok_count': sources['tiktok'][2],
-            'hackernews_count': sources['hackernews'][2],
-            'cfpb_count': sources['cfpb'][2],
-            'bluesky_count': sources['bluesky'][2],
-        }
+def get_source_levels(aggregate, platform):
+    """Per-category sums from a platform's latest aggregated week ({} if none)."""
+    entry = aggregates.latest_entry(aggregate, platform)
+    return entry['levels'] if entry else {}
 
-        counts = [f"YT:{sources['youtube'][2]}", f"RD:{sources['reddit'][2]}",
-                  f"TT:{sources['tiktok'][2]}", f"HN:{sources['hackernews'][2]}",
-                  f"CFPB:{sources['cfpb'][2]}", f"BS:{sources['bluesky'][2]}"]
-        print(f"  {', '.join(counts)}, Total: {total_entries}")
-        print(f"  Score: {final_score:.2f}, Crisis Ratio: {combined_social:.2f}")
 
-    return results
+def calculate_metric_scores(workers=1):
+    """Calculate scores for all metrics, sharding metrics across `workers` processes."""
+    fred_scores = load_fred_scores()
+    if fred_scores:
+        print(f"FRED official scores loaded for: {', '.join(fred_scores.keys())}")
 
+    ingested = aggregates.refresh()
+    if ingested:
+        print(f"Aggregated {ingested} new data files")
+
+    names = list(METRICS)
+    scores = map_metrics(score_metric, [(name, fred_scores) for name in names], workers)
+    return dict(zip(names, scores))
+
+
+def score_metric(metric_name, fred_scores):
+    """Score one metric from its own aggregate partition."""
+    config = METRICS[metric_name]
+    print(f"\nProcessing: {metric_name}")
+    slug = config['slug']
+
+    # Per-category sums from the latest week of every source
+    aggregate = aggregates.load_metric(slug)
+    sources = {platform: get_source_levels(aggregate, platform)
+               for platform in aggregates.SCORED_PLATFORMS}
+
+    # Engagement-weighted scoring over the aggregates, keeping per-source
+    # and per-level partial sums alongside the totals
+    total_weighted = 0
+    total_engagement = 0
+    partials = {}
+    level_totals = {'L1': 0, 'L2': 0, 'L3': 0}
+
+    for source_name, levels in sources.items():
+        source_sums = {'count': 0, 'weighted': 0.0, 'engagement': 0.0, 'levels': {}}
+        for category, level in levels.items():
+            severity = SEVERITY_WEIGHTS.get(category, 0.33)
+            engagement = level['log_engagement']
+            total_weighted += severity * engagement
+            total_engagement += engagement
+
+            source_sums['count'] += level['count']
+            source_sums['weighted'] += severity * engagement
+            source_sums['engagement'] += engagement
+            source_sums['levels'][category or 'UNCATEGORIZED'] = {
+                'count': level['count'], 'engagement': engagement}
+        for key, count in aggregates.level_counts(levels).items():
+            level_totals[key] += count
+        partials[source_name] = source_sums
+
+    if total_engagement > 0:
+        combined_social = (total_weighted / total_engagement) * 100
+    else:
+        combined_social = 0
+
+    contributions = source_contributions(partials, total_weighted, total_engagement)
+
+    # Use FRED official score when available
+    official = fred_scores.get(slug, config['official_score'])
+    if slug in fred_scores:
+        print(f"  Official: {official:.2f} (FRED)")
+    final_score = (official * OFFICIAL_WEIGHT) + (combined_social * SOCIAL_WEIGHT)
+
+    counts = {name: partials[name]['count'] for name in sources}
+    total_entries = sum(counts.values())
+
+    result = {
+        'score': round(final_score, 2),
+        'officialScore': round(official, 2),
+        'crisisRatio': round(combined_social, 2),
+        'level1': level_totals['L1'],
+        'level2': level_totals['L2'],
+        'level3': level_totals['L3'],
+        'total': total_entries,
+        'youtube_count': counts['youtube'],
+        'reddit_count': counts['reddit'],
+        'tiktok_count': counts['tiktok'],
+        'hackernews_count': counts['hackernews'],
+        'cfpb_count': counts['cfpb'],
+        'bluesky_count': counts['bluesky'],
+        'contributions': contributions,
+        'commentSignal': comment_signal(aggregate),
+    }
 
-def read_current_scores():
-    """Read current scores from the TypeScript file before overwriting."""
-    scores = {}
-    try:
-        with open(METRIC_DATA_FILE, 'r', encoding='utf-8') as f:
-            content = f.read()
-        for metric_name in METRICS:
-            pattern = rf'title: "{re.escape(metric_name)}",\s*score: ([\d.]+)'
-            match = re.search(pattern, content)
-            if match:
-                scores[metric_name] = float(match.group(1))
-    except Exception as e:
-        print(f"  Could not read previous scores: {e}")
-    return scores
+    labels = [f"YT:{counts['youtube']}", f"RD:{counts['reddit']}",
+              f"TT:{counts['tiktok']}", f"HN:{counts['hackernews']}",
+              f"CFPB:{counts['cfpb']}", f"BS:{counts['bluesky']}"]
+    print(f"  {', '.join(labels)}, Total: {total_entries}")
+    print(f"  Score: {final_score:.2f}, Crisis Ratio: {combined_social:.2f}")
+    if result['commentSignal']:
+        print(f"  YouTube Comments (not scored): {result['commentSignal']['comments']}, "
+              f"Crisis Ratio: {result['commentSignal']['crisisRatio']:.2f}")
+    for source_name, c in contributions.items():
+        if c['count']:
+            print(f"    {source_name:11} share {c['engagement_share']:5.1f}%, "
+                  f"alone {c['social_alone']:5.2f}, marginal {c['marginal']:+6.2f}")
+
+    return result
+
+
+def comment_signal(aggregate):
+    """Crisis ratio of the latest sampled YouTube comments, shown beside the score (None if none)."""
+    levels = get_source_levels(aggregate, 'youtube_comments')
+    comments = sum(level['count'] for level in levels.values())
+    if not comments:
+        return None
+    engagement = sum(level['log_engagement'] for level in levels.values())
+    weighted = sum(SEVERITY_WEIGHTS.get(category, 0.33) * level['log_engagement']
+                   for category, level in levels.items())
+    return {
+        'comments': comments,
+        'crisisRatio': round(weighted / engagement * 100, 2) if engagement else 0,
+        'level3': aggregates.level_counts(levels)['L3'],
+    }
 
 
-def calculate_trend(old_score, new_score, threshold=2.0):
-    """Determine trend based on score change.
+def source_contributions(partials, total_weighted, total_engagement):
+    """Derive each source's contribution to the social score from partial sums.
 
-    A threshold prevents noise from flipping the trend on tiny fluctuations.
+    marginal is how many points the combined social score would move if the
+    source were dropped (combined minus leave-one-out), so a week-over-week
+    score jump can be traced to a source without re-running anything.
     """
-    if old_score is None:
-        return 'worsening'  # default for first run
-    diff = new_score - old_score
-    if diff > threshold:
-        return 'worsening'
-    elif diff < -threshold:
-        return 'improving'
-    return 'neutral'
+    combined = (total_weighted / total_engagement) * 100 if total_engagement else 0
+    contributions = {}
+    for source_name, sums in partials.items():
+        rest_engagement = total_engagement - sums['engagement']
+        rest_weighted = total_weighted - sums['weighted']
+        without = (rest_weighted / rest_engagement) * 100 if rest_engagement > 0 else 0
+        alone = (sums['weighted'] / sums['engagement']) * 100 if sums['engagement'] else 0
+        contributions[source_name] = {
+            'count': sums['count'],
+            'engagement': round(sums['engagement'], 4),
+            'weighted': round(sums['weighted'], 4),
+            'engagement_share': round(sums['engagement'] / total_engagement * 100, 2) if total_engagement else 0,
+            'social_alone': round(alone, 2),
+            'marginal': round(combined - without, 2) if sums['engagement'] else 0,
+            'levels': {
+                category: {'count': lv['count'], 'engagement': round(lv['engagement'], 4)}
+                for category, lv in sorted(sums['levels'].items())
+            },
+        }
+    return contributions
+
+
+def write_score_breakdown(results):
+    """Save per-source contributions so score changes can be diagnosed by lookup."""
+    breakdown = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'metrics': {
+            name: {
+                'score': data['score'],
+                'social': data['crisisRatio'],
+                'sources': data['contributions'],
+            }
+            for name, data in results.items()
+        },
+    }
+    # generated_at alone is not a change, so no-op runs leave the file alone
+    if write_if_changed(SCORE_BREAKDOWN_FILE, breakdown, ignore=('generated_at',)):
+        print(f"\nSaved per-source breakdown to {SCORE_BREAKDOWN_FILE}")
+    else:
+        print(f"\nPer-source breakdown unchanged ({SCORE_BREAKDOWN_FILE})")
+
+
+# (platform label, result count key, noun) for collectionProgress/dataSources.
+# The pipeline recomputes the progress percentage for the platforms flagged
+# True; YouTube and Reddit keep their existing percentage.
+PLATFORM_COUNTS = (
+    ('YouTube', 'youtube_count', 'videos', False),
+    ('Reddit', 'reddit_count', 'posts', False),
+    ('TikTok', 'tiktok_count', 'videos', True),
+    ('Hacker News', 'hackernews_count', 'stories', True),
+    ('CFPB', 'cfpb_count', 'complaints', True),
+    ('Bluesky', 'bluesky_count', 'posts', True),
+)
+
+
+def update_metric_record(record, data, trend, today):
+    """Apply one metric's calculated results to its generated data record."""
+    record['score'] = data['score']
+    record['crisisRatio'] = data['crisisRatio']
+    record['trend'] = trend
+    record['levelDistribution'] = {
+        'level1': data['level1'],
+        'level2': data['level2'],
+        'level3': data['level3'],
+        'total': data['total'],
+    }
+    record['lastUpdated'] = today
+    # Kept from the last run that sampled comments, like the platform counts
+    if data.get('commentSignal'):
+        record['commentSignal'] = data['commentSignal']
+
+    for platform, count_key, noun, update_percentage in PLATFORM_COUNTS:
+        count = data.get(count_key, 0)
+        if count <= 0:
+            continue
 
+        # collectionProgress counts (and percentages)
+        for progress in record['collectionProgress']:
+            if progress['platform'] == platform:
+                progress['current'] = count
+                if update_percentage:
+                    progress['percentage'] = min(100, int(count / progress['target'] * 100))
+                break
 
-def update_typescript_file(results):
-    """Update the metricDetailData.ts file with new scores."""
-    previous_scores = read_current_scores()
+        # dataSources counts (e.g., "YouTube: 170 videos" -> "YouTube: 135 videos")
+        source_pattern = re.compile(rf'^({re.escape(platform)}: )\d+( {noun})')
+        for i, source in enumerate(record['dataSources']):
+            if source_pattern.match(source):
+                record['dataSources'][i] = source_pattern.sub(rf'\g<1>{count}\g<2>', source)
+                break
 
-    with open(METRIC_DATA_FILE, 'r', encoding='utf-8') as f:
-        content = f.read()
 
+def update_metric_records(metric_data, results):
+    """Apply new scores to the loaded metric data, with trends from the score history."""
     today = datetime.now().strftime('%B %d, %Y').replace(' 0', ' ')
 
     for metric_name, data in results.items():
         print(f"\nUpdating {metric_name}...")
+        record = metric_data.get(metric_name)
+        if record is None:
+            print(f"  WARNING: {metric_name} not found in {METRIC_DATA_FILE}")
+            continue
 
-        # Update score
-        pattern = rf'("{re.escape(metric_name)}": \{{\s*title: "{re.escape(metric_name)}",\s*score: )[\d.]+'
-        replacement = rf'\g<1>{data["score"]}'
-        content = re.sub(pattern, replacement, content)
-
-        # Update crisisRatio
-        pattern = rf'(title: "{re.escape(metric_name)}",\s*score: [\d.]+,\s*label: "[^"]+",\s*trend: "[^"]+",\s*officialScore: [\d.]+,\s*crisisRatio: )[\d.]+'
-        replacement = rf'\g<1>{data["crisisRatio"]}'
-        content = re.sub(pattern, replacement, content)
-
-        # Update trend
-        old_score = previous_scores.get(metric_name)
-        trend = calculate_trend(old_score, data['score'])
-        data['trend'] = trend
-        pattern = rf'(title: "{re.escape(metric_name)}",\s*score: [\d.]+,\s*label: "[^"]+",\s*trend: )"[^"]+"'
-        replacement = rf'\g<1>"{trend}"'
-        content = re.sub(pattern, replacement, content)
-        if old_score is not None:
-            print(f"  Trend: {old_score:.2f} -> {data['score']:.2f} = {trend}")
+        slug = METRICS[metric_name]['slug']
+        score_history.record_score(slug, date.today(), data['score'], data['officialScore'],
+                                   data['crisisRatio'], data['total'])
+        trend, slope = score_history.score_trend(slug)
+        if trend is None:
+            trend = record.get('trend', 'neutral')
+            print(f"  Trend: not enough score history yet, keeping {trend}")
         else:
-            print(f"  Trend: no previous score, defaulting to {trend}")
-
-        # Update levelDistribution
-        pattern = rf'(title: "{re.escape(metric_name)}".*?levelDistribution: \{{\s*level1: )\d+'
-        replacement = rf'\g<1>{data["level1"]}'
-        content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-
-        pattern = rf'(title: "{re.escape(metric_name)}".*?levelDistribution: \{{[^}}]*level2: )\d+'
-        replacement = rf'\g<1>{data["level2"]}'
-        content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-
-        pattern = rf'(title: "{re.escape(metric_name)}".*?levelDistribution: \{{[^}}]*level3: )\d+'
-        replacement = rf'\g<1>{data["level3"]}'
-        content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-
-        pattern = rf'(title: "{re.escape(metric_name)}".*?levelDistribution: \{{[^}}]*total: )\d+'
-        replacement = rf'\g<1>{data["total"]}'
-        content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-
-        # Update lastUpdated
-        pattern = rf'(title: "{re.escape(metric_name)}".*?lastUpdated: ")[^"]+'
-        replacement = rf'\g<1>{today}'
-        content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-
-        # Update collectionProgress counts and percentages for YouTube
-        if data.get('youtube_count', 0) > 0:
-            pattern = rf'(title: "{re.escape(metric_name)}".*?platform: "YouTube",\s*current: )\d+'
-            replacement = rf'\g<1>{data["youtube_count"]}'
-            content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-
-        # Update collectionProgress counts and percentages for Reddit
-        if data.get('reddit_count', 0) > 0:
-            pattern = rf'(title: "{re.escape(metric_name)}".*?platform: "Reddit",\s*current: )\d+'
-            replacement = rf'\g<1>{data["reddit_count"]}'
-            content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-
-        # Update collectionProgress counts and percentages for TikTok
-        tiktok_count = data.get('tiktok_count', 0)
-        if tiktok_count > 0:
-            pattern = rf'(title: "{re.escape(metric_name)}".*?platform: "TikTok",\s*current: )\d+'
-            replacement = rf'\g<1>{tiktok_count}'
-            content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-            pattern = rf'(title: "{re.escape(metric_name)}".*?platform: "TikTok",\s*current: \d+,\s*target: )(\d+)(,\s*percentage: )\d+'
-            def calc_tiktok_pct(match):
-                target = int(match.group(2))
-                pct = min(100, int(tiktok_count / target * 100))
-                return f'{match.group(1)}{target}{match.group(3)}{pct}'
-            content = re.sub(pattern, calc_tiktok_pct, content, flags=re.DOTALL)
-
-        # Update collectionProgress for Hacker News
-        hn_count = data.get('hackernews_count', 0)
-        if hn_count > 0:
-            pattern = rf'(title: "{re.escape(metric_name)}".*?platform: "Hacker News",\s*current: )\d+'
-            replacement = rf'\g<1>{hn_count}'
-            content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-            pattern = rf'(title: "{re.escape(metric_name)}".*?platform: "Hacker News",\s*current: \d+,\s*target: )(\d+)(,\s*percentage: )\d+'
-            def calc_hn_pct(match):
-                target = int(match.group(2))
-                pct = min(100, int(hn_count / target * 100))
-                return f'{match.group(1)}{target}{match.group(3)}{pct}'
-            content = re.sub(pattern, calc_hn_pct, content, flags=re.DOTALL)
-
-        # Update collectionProgress for CFPB
-        cfpb_count = data.get('cfpb_count', 0)
-        if cfpb_count > 0:
-            pattern = rf'(title: "{re.escape(metric_name)}".*?platform: "CFPB",\s*current: )\d+'
-            replacement = rf'\g<1>{cfpb_count}'
-            content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-            pattern = rf'(title: "{re.escape(metric_name)}".*?platform: "CFPB",\s*current: \d+,\s*target: )(\d+)(,\s*percentage: )\d+'
-            def calc_cfpb_pct(match):
-                target = int(match.group(2))
-                pct = min(100, int(cfpb_count / target * 100))
-                return f'{match.group(1)}{target}{match.group(3)}{pct}'
-            content = re.sub(pattern, calc_cfpb_pct, content, flags=re.DOTALL)
-
-        # Update collectionProgress for Bluesky
-        bluesky_count = data.get('bluesky_count', 0)
-        if bluesky_count > 0:
-            pattern = rf'(title: "{re.escape(metric_name)}".*?platform: "Bluesky",\s*current: )\d+'
-            replacement = rf'\g<1>{bluesky_count}'
-            content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-            pattern = rf'(title: "{re.escape(metric_name)}".*?platform: "Bluesky",\s*current: \d+,\s*target: )(\d+)(,\s*percentage: )\d+'
-            def calc_bluesky_pct(match):
-                target = int(match.group(2))
-                pct = min(100, int(bluesky_count / target * 100))
-                return f'{match.group(1)}{target}{match.group(3)}{pct}'
-            content = re.sub(pattern, calc_bluesky_pct, content, flags=re.DOTALL)
-
-        # Update dataSources counts (e.g., "YouTube: 170 videos" -> "YouTube: 135 videos")
-        if data.get('youtube_count', 0) > 0:
-            pattern = rf'(title: "{re.escape(metric_name)}".*?dataSources:.*?"YouTube: )\d+( videos)'
-            replacement = rf'\g<1>{data["youtube_count"]}\g<2>'
-            content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-
-        if data.get('reddit_count', 0) > 0:
-            pattern = rf'(title: "{re.escape(metric_name)}".*?dataSources:.*?"Reddit: )\d+( posts)'
-            replacement = rf'\g<1>{data["reddit_count"]}\g<2>'
-            content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-
-        if data.get('tiktok_count', 0) > 0:
-            pattern = rf'(title: "{re.escape(metric_name)}".*?dataSources:.*?"TikTok: )\d+( videos)'
-            replacement = rf'\g<1>{data["tiktok_count"]}\g<2>'
-            content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-
-        if data.get('hackernews_count', 0) > 0:
-            pattern = rf'(title: "{re.escape(metric_name)}".*?dataSources:.*?"Hacker News: )\d+( stories)'
-            replacement = rf'\g<1>{data["hackernews_count"]}\g<2>'
-            content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-
-        if data.get('cfpb_count', 0) > 0:
-            pattern = rf'(title: "{re.escape(metric_name)}".*?dataSources:.*?"CFPB: )\d+( complaints)'
-            replacement = rf'\g<1>{data["cfpb_count"]}\g<2>'
-            content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-
-        if data.get('bluesky_count', 0) > 0:
-            pattern = rf'(title: "{re.escape(metric_name)}".*?dataSources:.*?"Bluesky: )\d+( posts)'
-            replacement = rf'\g<1>{data["bluesky_count"]}\g<2>'
-            content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-
-    with open(METRIC_DATA_FILE, 'w', encoding='utf-8') as f:
-        f.write(content)
-
-    print(f"\nUpdated {METRIC_DATA_FILE}")
+            print(f"  Trend: {slope:+.2f} points/week = {trend}")
+        data['trend'] = trend
+
+        update_metric_record(record, data, trend, today)
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Update the generated metric data from collected data.')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='processes to shard metric scoring across (default 1: scoring '
+                             'eight metrics from aggregates is faster than starting a pool)')
+    parser.add_argument('--samples', action='store_true',
+                        help='also refresh sampleData (update_sample_data.py) before saving')
+    args = parser.parse_args()
+
     print("=" * 80)
     print("ABSURDITY INDEX - AUTOMATED METRIC DATA UPDATE")
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 80)
 
-    results = calculate_metric_scores()
+    results = calculate_metric_scores(args.workers)
 
     print("\n" + "=" * 80)
     print("SUMMARY")
     print("=" * 80)
     for name, data in results.items():
         print(f"{name:25} -> Score: {data['score']:5.2f}, Entries: {data['total']}")
+    write_score_breakdown(results)
 
     print("\n" + "=" * 80)
-    print("UPDATING TYPESCRIPT FILE")
+    print("UPDATING METRIC DATA")
     print("=" * 80)
-    update_typescript_file(results)
+    # Load the metric data once; scores and samples are applied to the same
+    # model and it is written back once
+    metric_data = load_metric_data()
+    update_metric_records(metric_data, results)
+
+    if args.samples:
+        print("\n" + "=" * 80)
+        print("UPDATING SAMPLE DATA")
+        print("=" * 80)
+        update_sample_data.update_samples(metric_data)
+
+    if save_metric_data(metric_data):
+        print(f"\nUpdated {METRIC_DATA_FILE}")
 
     print("\n" + "=" * 80)
     print("COMPLETE")
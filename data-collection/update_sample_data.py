@@ -1,97 +1,56 @@
 #!/usr/bin/env python3
 """
-Auto-update sampleData arrays in metricDetailData.ts from collected data.
+Auto-update sampleData arrays in the generated metric data from collected data.
 
 This script:
-1. Reads the latest collected data for each metric (YouTube, Reddit, TikTok, HN, CFPB)
-2. Selects representative samples (mix of severity levels and platforms)
-3. Strips emoji characters from sample content
-4. Updates the sampleData arrays in metricDetailData.ts
+1. Reads each metric's sample candidate pool (sample_pool.py), kept up to
+   date as collected files are aggregated, already emoji-stripped
+2. Ranks candidates by relevance to the metric (relevance_index.py)
+3. Selects representative samples (mix of severity levels and platforms)
+4. Updates the sampleData arrays in lib/metricData.generated.json
 
-Run this AFTER data collection, BEFORE or AFTER update_metric_data.py
+Run this AFTER data collection, BEFORE or AFTER update_metric_data.py, or let
+`update_metric_data.py --samples` run it on the same loaded data so the file
+is read and written once.
 
 Usage:
     python update_sample_data.py
 """
 
 import os
-import csv
-import html
-import re
-import json
 from datetime import datetime
+from itertools import islice
 
 # Change to script directory
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 os.chdir(SCRIPT_DIR)
 
-from data_utils import count_data_rows, get_latest_file as _get_latest_file
-
-DATA_DIR = 'collected-data'
-METRIC_DATA_FILE = '../lib/metricDetailData.ts'
-
-
-def get_latest_file(pattern, min_rows=5):
-    """Find latest file in DATA_DIR matching pattern."""
-    return _get_latest_file(os.path.join(DATA_DIR, pattern), min_rows=min_rows)
-
-# Metric configurations
-METRICS = {
-    'What Healthcare?': {
-        'slug': 'healthcare',
-        'youtube_pattern': 'healthcare_youtube_*.csv',
-        'reddit_pattern': 'healthcare_reddit_*.csv',
-        'tiktok_metric': 'healthcare'
-    },
-    'AI Psychosis': {
-        'slug': 'ai_psychosis',
-        'youtube_pattern': 'ai_psychosis_youtube_*.csv',
-        'reddit_pattern': 'ai_psychosis_reddit_*.csv',
-        'tiktok_metric': 'ai_psychosis'
-    },
-    'Subscription Overload': {
-        'slug': 'subscription_overload',
-        'youtube_pattern': 'subscription_overload_youtube_*.csv',
-        'reddit_pattern': 'subscription_overload_reddit_*.csv',
-        'tiktok_metric': 'subscription_overload'
-    },
-    'Wage Stagnation': {
-        'slug': 'wage_stagnation',
-        'youtube_pattern': 'wage_stagnation_youtube_*.csv',
-        'reddit_pattern': 'wage_stagnation_reddit_*.csv',
-        'tiktok_metric': 'wage_stagnation'
-    },
-    'Housing Despair': {
-        'slug': 'housing_despair',
-        'youtube_pattern': 'housing_despair_youtube_*.csv',
-        'reddit_pattern': 'housing_despair_reddit_*.csv',
-        'tiktok_metric': 'housing_despair'
-    },
-    'Dating App Despair': {
-        'slug': 'dating_app_despair',
-        'youtube_pattern': 'dating_app_despair_youtube_*.csv',
-        'reddit_pattern': 'dating_app_despair_reddit_*.csv',
-        'tiktok_metric': 'dating_app_despair'
-    },
-    'Layoff Watch': {
-        'slug': 'layoff_watch',
-        'youtube_pattern': 'layoff_watch_youtube_*.csv',
-        'reddit_pattern': 'layoff_watch_reddit_*.csv',
-        'tiktok_metric': 'layoff_watch'
-    },
-    'Airline Chaos': {
-        'slug': 'airline_chaos',
-        'youtube_pattern': 'airline_chaos_youtube_*.csv',
-        'reddit_pattern': 'airline_chaos_reddit_*.csv',
-        'tiktok_metric': 'airline_chaos'
-    }
-}
-
-# TikTok combined file pattern
-TIKTOK_PATTERN = 'tiktok_youtube_*.csv'
+import aggregates
+import sample_pool
+from metric_data import METRIC_DATA_FILE, METRIC_SLUGS, load_metric_data, save_metric_data
+from relevance_index import RelevanceIndex
+
+# Candidates per severity level considered before relevance ranking. A few
+# more than any platform's sample count, so the doubling fallback in
+# _ranked_candidates is rarely needed.
+CANDIDATE_POOL_SIZE = 8
+
+# Relevance only reorders candidates of comparable reach: one is picked over
+# a more engaged relevant candidate only if it has at least this share of
+# that candidate's engagement
+ENGAGEMENT_BAND = 0.5
+
+# Samples per platform: 2 YouTube + 2 Reddit + 1 TikTok + 1 HN/CFPB = up to 6
+SAMPLES_PER_PLATFORM = (
+    ('youtube', 2),
+    ('reddit', 2),
+    ('tiktok', 1),
+)
 
-# Per-metric relevance keywords for filtering noisy samples.
-# A sample must contain at least one keyword (case-insensitive) to be selected.
+# Per-metric relevance keywords for filtering noisy samples. They form each
+# metric's TF-IDF profile (relevance_index.py): a sample must share at least
+# one keyword, as a whole word or phrase, and the best match among comparably
+# engaged candidates is picked first.
 RELEVANCE_KEYWORDS = {
     'What Healthcare?': [
         'healthcare', 'health care', 'insurance', 'medical', 'hospital', 'doctor',
@@ -141,400 +100,135 @@ RELEVANCE_KEYWORDS = {
     ],
 }
 
-# Emoji removal regex - targeted ranges to avoid stripping legitimate characters.
-# Avoids overly broad ranges that would catch CJK text, (R), (C), etc.
-EMOJI_RE = re.compile(
-    '['
-    '\U0001F600-\U0001F64F'  # emoticons
-    '\U0001F300-\U0001F5FF'  # symbols & pictographs
-    '\U0001F680-\U0001F6FF'  # transport & map
-    '\U0001F1E0-\U0001F1FF'  # flags
-    '\U0001F900-\U0001F9FF'  # supplemental symbols
-    '\U0001FA00-\U0001FA6F'  # chess symbols
-    '\U0001FA70-\U0001FAFF'  # symbols extended-A
-    '\U00002600-\U000026FF'  # misc symbols (sun, cloud, etc.)
-    '\U00002702-\U000027B0'  # dingbats
-    '\U000023F0-\U000023FA'  # misc technical (hourglass, etc.)
-    '\U0000270A-\U0000270D'  # hands
-    '\U00002B50'             # star
-    '\U00002B55'             # circle
-    '\U00002639'             # frowning face
-    '\U0000FE00-\U0000FE0F'  # variation selectors
-    '\U0000200D'             # zero width joiner
-    ']+',
-    flags=re.UNICODE
-)
-
-
-def is_relevant(title, metric_name):
-    """Check if a title contains at least one relevance keyword for the metric."""
-    keywords = RELEVANCE_KEYWORDS.get(metric_name, [])
-    if not keywords:
-        return True
-    title_lower = title.lower()
-    return any(kw in title_lower for kw in keywords)
-
-
-def strip_emoji(text):
-    """Remove emoji characters, decode HTML entities, and clean up whitespace."""
-    # Decode HTML entities (&#39; -> ', &amp; -> &, etc.)
-    cleaned = html.unescape(text)
-    # Remove emojis
-    cleaned = EMOJI_RE.sub('', cleaned)
-    # Collapse multiple spaces into one and strip
-    return re.sub(r' +', ' ', cleaned).strip()
-
-
-
-def read_csv_data(filepath):
-    """Read CSV file and return list of dicts."""
-    if not filepath or not os.path.exists(filepath):
-        return []
-
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return list(csv.DictReader(f))
-    except Exception as e:
-        print(f"  Error reading {filepath}: {e}")
-        return []
 
+def _by_relevance_in_band(scored):
+    """Order relevant (score, candidate) pairs, given most engaged first.
 
-def get_level_from_category(category):
-    """Convert category string to level number."""
-    if not category:
-        return 1
-    category = category.upper()
-    if 'LEVEL_3' in category or 'CRISIS' in category:
-        return 3
-    elif 'LEVEL_2' in category:
-        return 2
-    return 1
-
-
-def _severity_sorted_candidates(data, engagement_field):
-    """Group rows by severity level and sort each group by engagement.
-
-    Returns candidates ordered L3 > L2 > L1, with highest engagement first
-    within each level.
+    Each pick is the most relevant candidate with at least ENGAGEMENT_BAND
+    of the engagement of the most engaged one left, the more engaged winning
+    ties, so relevance never puts a much weaker item ahead of a popular
+    relevant one.
     """
-    by_level = {3: [], 2: [], 1: []}
-    for row in data:
-        level = get_level_from_category(row.get('category', ''))
-        by_level[level].append(row)
-
-    for level in by_level:
-        by_level[level].sort(key=lambda x: int(x.get(engagement_field, 0) or 0), reverse=True)
-
-    return by_level[3] + by_level[2] + by_level[1]
-
-
-def select_youtube_samples(data, metric_name, max_samples=2):
-    """Select representative YouTube samples prioritizing severity, then views."""
-    if not data:
-        return []
-
-    candidates = _severity_sorted_candidates(data, 'view_count')
-    samples = []
-
-    for row in candidates:
-        title = strip_emoji(row.get('title', '')[:100])
-        if not title:
-            continue
-        if not is_relevant(title, metric_name):
-            continue
-
-        video_id = row.get('video_id', '')
-        url = row.get('url', '')
-        if not url and video_id:
-            url = f'https://www.youtube.com/watch?v={video_id}'
-
-        if 'TBD' in video_id or 'TBD' in url:
-            continue
-
-        samples.append({
-            'content': title,
-            'platform': 'youtube',
-            'level': get_level_from_category(row.get('category', '')),
-            'date': row.get('published_date', row.get('published', ''))[:10],
-            'url': url,
-            'videoId': video_id,
-            'viewCount': int(row.get('view_count', 0) or 0),
-            'commentCount': int(row.get('comment_count', row.get('comments', 0)) or 0)
-        })
-
-        if len(samples) >= max_samples:
-            break
-
-    return samples
-
-
-def select_reddit_samples(data, metric_name, max_samples=2):
-    """Select representative Reddit samples by score, preferring level diversity."""
-    if not data:
-        return []
-
-    sorted_data = sorted(data, key=lambda x: int(x.get('score', 0) or 0), reverse=True)
-
-    samples = []
-    seen_levels = set()
-
-    for row in sorted_data:
-        level = get_level_from_category(row.get('category', ''))
-
-        if level not in seen_levels or len(samples) < max_samples:
-            title = strip_emoji(row.get('title', '')[:100])
-            if not title:
-                continue
-            if not is_relevant(title, metric_name):
-                continue
-
-            samples.append({
-                'content': title,
-                'platform': 'reddit',
-                'level': level,
-                'date': row.get('created_date', '')[:10],
-                'url': row.get('url', '')
-            })
-            seen_levels.add(level)
-
-            if len(samples) >= max_samples:
+    remaining = list(scored)
+    while remaining:
+        floor = remaining[0][1]['engagement'] * ENGAGEMENT_BAND
+        best = max(range(len(remaining)),
+                   key=lambda i: (remaining[i][1]['engagement'] >= floor, remaining[i][0], -i))
+        yield remaining.pop(best)[1]
+
+
+def _ranked_candidates(candidates, relevance, by_level=True, k=CANDIDATE_POOL_SIZE):
+    """Yield relevant candidates L3 > L2 > L1, by relevance among comparably engaged ones.
+
+    Only each level's top k by engagement survive the streaming pass, and
+    only those are scored: relevance(candidate) returns a score, 0 meaning
+    off-topic. Relevant survivors are yielded by _by_relevance_in_band. If
+    the caller needs more than a level's relevant survivors, the heaps are
+    rebuilt at twice the size and the next engagement band is ranked the
+    same way.
+    """
+    ranked, counts = sample_pool.top_by_level(candidates, k, by_level)
+    for level in ranked:
+        position = 0
+        while True:
+            band = ranked[level][position:]
+            position = len(ranked[level])
+            # band is in engagement order; off-topic candidates are dropped
+            scored = [(score, c) for score, c in ((relevance(c), c) for c in band) if score > 0]
+            yield from _by_relevance_in_band(scored)
+            if position >= counts[level]:
                 break
+            k *= 2
+            ranked, counts = sample_pool.top_by_level(candidates, k, by_level)
 
-    return samples
-
-
-def select_tiktok_samples(all_tiktok_data, metric_slug, display_name, max_samples=1):
-    """Select TikTok samples for a specific metric, prioritizing severity."""
-    if not all_tiktok_data:
-        return []
-
-    metric_data = [r for r in all_tiktok_data if r.get('metric', '') == metric_slug]
-    if not metric_data:
-        return []
-
-    candidates = _severity_sorted_candidates(metric_data, 'views')
-    samples = []
-
-    for row in candidates:
-        title = strip_emoji(row.get('title', '')[:100])
-        if not title:
-            continue
-        if not is_relevant(title, display_name):
-            continue
-
-        samples.append({
-            'content': title,
-            'platform': 'tiktok',
-            'level': get_level_from_category(row.get('category', '')),
-            'date': row.get('published', '')[:10],
-            'url': row.get('url', ''),
-            'videoId': row.get('video_id', ''),
-            'viewCount': int(row.get('views', 0) or 0)
-        })
-
-        if len(samples) >= max_samples:
-            break
-
-    return samples
-
-
-def select_hn_samples(data, metric_name, max_samples=1):
-    """Select representative Hacker News samples, prioritizing severity then points."""
-    if not data:
-        return []
-
-    candidates = _severity_sorted_candidates(data, 'points')
-    samples = []
-
-    for row in candidates:
-        title = strip_emoji(row.get('title', '')[:100])
-        if not title:
-            continue
-        if not is_relevant(title, metric_name):
-            continue
-
-        samples.append({
-            'content': title,
-            'platform': 'hackernews',
-            'level': get_level_from_category(row.get('category', '')),
-            'date': row.get('created_date', row.get('date', ''))[:10],
-            'url': row.get('url', '')
-        })
-
-        if len(samples) >= max_samples:
-            break
-
-    return samples
-
-
-def select_cfpb_samples(data, max_samples=1):
-    """Select representative CFPB complaint samples."""
-    if not data:
-        return []
 
-    samples = []
-    seen_levels = set()
+def _relevance_scorer(index, metric_name):
+    """relevance(candidate) for _ranked_candidates: its title's score for one metric."""
+    def relevance(candidate):
+        return index.score(candidate['title'], metric_name)
+    return relevance
 
-    for row in data:
-        level = get_level_from_category(row.get('category', ''))
-
-        if level not in seen_levels or len(samples) < max_samples:
-            title = strip_emoji(row.get('title', row.get('narrative', ''))[:100])
-            if not title:
-                continue
-
-            samples.append({
-                'content': title,
-                'platform': 'cfpb',
-                'level': level,
-                'date': row.get('date_received', row.get('date', ''))[:10],
-                'url': row.get('url', '')
-            })
-            seen_levels.add(level)
-
-            if len(samples) >= max_samples:
-                break
-
-    return samples
 
+def to_sample(candidate, platform):
+    """Shape a pool candidate as a selected sample."""
+    sample = {
+        'content': candidate['title'][:100].strip(),
+        'platform': platform,
+        'level': candidate['level'],
+        'date': candidate['date'],
+        'url': candidate['url'],
+    }
+    for field in ('videoId', 'viewCount', 'commentCount'):
+        if field in candidate:
+            sample[field] = candidate[field]
+    return sample
 
-def format_sample_for_ts(sample):
-    """Format a sample dict as TypeScript object string."""
-    lines = ['      {']
 
-    # Content (escape quotes and backslashes)
-    content = sample.get('content', '').replace('\\', '\\\\').replace('"', '\\"')
-    lines.append(f'        content: "{content}",')
-    lines.append(f'        platform: "{sample.get("platform", "")}",')
-    lines.append(f'        level: {sample.get("level", 1)},')
-    lines.append(f'        date: "{sample.get("date", "")}",')
+def select_samples(candidates, platform, metric_name, index, max_samples):
+    """Select a platform's samples: severity first, then relevance among the most engaged.
 
-    url = sample.get('url', '')
+    Reddit is ranked by score across levels, and CFPB complaints (no
+    engagement, no keyword match expected) are taken in filing order.
+    """
+    if platform == 'cfpb':
+        ranked = iter(candidates)
+    else:
+        relevance = _relevance_scorer(index, metric_name)
+        ranked = _ranked_candidates(candidates, relevance, by_level=(platform != 'reddit'))
+    return [to_sample(candidate, platform) for candidate in islice(ranked, max_samples)]
+
+
+def format_sample(sample):
+    """Shape a selected sample as a DataPoint record (see lib/metricDetailData.ts)."""
+    record = {
+        'content': sample.get('content', ''),
+        'platform': sample.get('platform', ''),
+        'level': sample.get('level', 1),
+        'date': sample.get('date', ''),
+        'url': sample.get('url', ''),
+    }
     # Optional fields for YouTube/TikTok
     if sample.get('videoId'):
-        lines.append(f'        url: "{url}",')
-        lines.append(f'        videoId: "{sample.get("videoId")}",')
-        lines.append(f'        viewCount: {sample.get("viewCount", 0)},')
-        lines.append(f'        commentCount: {sample.get("commentCount", 0)}')
-    else:
-        lines.append(f'        url: "{url}"')
-
-    lines.append('      }')
-    return '\n'.join(lines)
-
-
-def find_sample_data_range(content, metric_name):
-    """Find the start and end positions of the sampleData array for a metric.
-
-    Returns (start, end) positions of the array contents (between [ and ]),
-    or None if not found.
-    """
-    # Find the metric's title declaration
-    title_pattern = f'title: "{re.escape(metric_name)}"'
-    title_match = re.search(title_pattern, content)
-    if not title_match:
-        return None
-
-    # From title position, find sampleData: [
-    search_start = title_match.end()
-    sample_marker = 'sampleData: ['
-    marker_pos = content.find(sample_marker, search_start)
-    if marker_pos == -1:
-        return None
-
-    # Make sure this sampleData belongs to this metric (not the next one)
-    # Check there's no other metric title between our title and sampleData
-    next_title = re.search(r'title: "[^"]+",\s*score:', content[search_start + 1:])
-    if next_title and (search_start + 1 + next_title.start()) < marker_pos:
-        return None
-
-    array_start = marker_pos + len(sample_marker)
-
-    # Find matching ] by counting brackets
-    depth = 1
-    pos = array_start
-    while pos < len(content) and depth > 0:
-        if content[pos] == '[':
-            depth += 1
-        elif content[pos] == ']':
-            depth -= 1
-        pos += 1
-
-    if depth != 0:
-        return None
-
-    array_end = pos - 1  # position of the ]
-    return (array_start, array_end)
-
-
-def update_metric_samples(content, metric_name, samples):
-    """Update the sampleData array for a metric in the TypeScript content."""
-    if not samples:
-        return content
-
-    result = find_sample_data_range(content, metric_name)
-    if result is None:
-        print(f"  WARNING: Could not find sampleData for {metric_name}")
-        return content
-
-    array_start, array_end = result
-
-    # Format samples as TypeScript
-    samples_ts = ',\n'.join(format_sample_for_ts(s) for s in samples)
-
-    # Replace the array contents
-    new_content = content[:array_start] + '\n' + samples_ts + '\n    ' + content[array_end:]
-
-    return new_content
-
-
-def main():
-    print("=" * 80)
-    print("AUTO-UPDATE SAMPLE DATA")
-    print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("=" * 80)
-
-    # Read current TypeScript file
-    with open(METRIC_DATA_FILE, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Load TikTok data once (combined file)
-    tiktok_file = get_latest_file(TIKTOK_PATTERN)
-    all_tiktok_data = read_csv_data(tiktok_file) if tiktok_file else []
-    print(f"\nLoaded {len(all_tiktok_data)} TikTok entries")
-
-    # Process each metric
-    for metric_name, config in METRICS.items():
+        record['videoId'] = sample['videoId']
+        record['viewCount'] = sample.get('viewCount', 0)
+        record['commentCount'] = sample.get('commentCount', 0)
+    return record
+
+
+def update_samples(metric_data):
+    """Select fresh samples for every metric and set them on the loaded metric data."""
+    # Make sure the pools include any files collected since the last aggregation
+    aggregates.refresh()
+
+    pools = {}
+    for metric_name, slug in METRIC_SLUGS.items():
+        platforms = sample_pool.load_pool(slug)['platforms']
+        pools[metric_name] = {platform: entry['candidates'] for platform, entry in platforms.items()}
+
+    # Relevance IDF is computed over every candidate title in this run
+    titles = (
+        candidate['title']
+        for pool in pools.values()
+        for platform, candidates in pool.items()
+        if platform != 'cfpb'
+        for candidate in candidates
+    )
+    index = RelevanceIndex(RELEVANCE_KEYWORDS, titles)
+
+    for metric_name, pool in pools.items():
         print(f"\n{metric_name}:")
-        slug = config['slug']
+        for platform in sample_pool.NORMALIZERS:
+            print(f"  {platform}: {len(pool.get(platform, []))} candidates")
 
-        # Get latest data files
-        youtube_file = get_latest_file(config['youtube_pattern'])
-        reddit_file = get_latest_file(config['reddit_pattern'])
-        hn_file = get_latest_file(f'{slug}_hackernews_*.csv')
-        cfpb_file = get_latest_file(f'{slug}_cfpb_*.csv')
-
-        youtube_data = read_csv_data(youtube_file) if youtube_file else []
-        reddit_data = read_csv_data(reddit_file) if reddit_file else []
-        hn_data = read_csv_data(hn_file) if hn_file else []
-        cfpb_data = read_csv_data(cfpb_file) if cfpb_file else []
-
-        print(f"  YouTube: {len(youtube_data)} entries")
-        print(f"  Reddit: {len(reddit_data)} entries")
-        print(f"  HN: {len(hn_data)} entries")
-        print(f"  CFPB: {len(cfpb_data)} entries")
-
-        # Select samples: 2 YouTube + 2 Reddit + 1 TikTok + 1 HN/CFPB = up to 6
         samples = []
-        samples.extend(select_youtube_samples(youtube_data, metric_name, max_samples=2))
-        samples.extend(select_reddit_samples(reddit_data, metric_name, max_samples=2))
-        samples.extend(select_tiktok_samples(all_tiktok_data, config['tiktok_metric'], metric_name, max_samples=1))
+        for platform, max_samples in SAMPLES_PER_PLATFORM:
+            samples.extend(select_samples(pool.get(platform, []), platform, metric_name, index, max_samples))
 
         # Add HN or CFPB sample if available
-        if hn_data:
-            samples.extend(select_hn_samples(hn_data, metric_name, max_samples=1))
-        elif cfpb_data:
-            samples.extend(select_cfpb_samples(cfpb_data, max_samples=1))
+        if pool.get('hackernews'):
+            samples.extend(select_samples(pool['hackernews'], 'hackernews', metric_name, index, 1))
+        elif pool.get('cfpb'):
+            samples.extend(select_samples(pool['cfpb'], 'cfpb', metric_name, index, 1))
 
         # Deduplicate by content (case-insensitive)
         seen_content = set()
@@ -548,16 +242,27 @@ def main():
 
         print(f"  Selected {len(samples)} samples")
 
-        # Update content
-        content = update_metric_samples(content, metric_name, samples)
+        if not samples:
+            continue
+        if metric_name not in metric_data:
+            print(f"  WARNING: {metric_name} not found in {METRIC_DATA_FILE}")
+            continue
+        metric_data[metric_name]['sampleData'] = [format_sample(s) for s in samples]
+
+
+def main():
+    print("=" * 80)
+    print("AUTO-UPDATE SAMPLE DATA")
+    print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 80)
 
-    # Write updated file
-    with open(METRIC_DATA_FILE, 'w', encoding='utf-8') as f:
-        f.write(content)
+    metric_data = load_metric_data()
+    update_samples(metric_data)
+    changed = save_metric_data(metric_data)
 
     print("\n" + "=" * 80)
     print("COMPLETE")
-    print(f"Updated: {METRIC_DATA_FILE}")
+    print(f"{'Updated' if changed else 'Unchanged'}: {METRIC_DATA_FILE}")
     print("=" * 80)
 
 
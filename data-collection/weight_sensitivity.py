@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Weight sensitivity analysis for the Absurdity Index scoring formula.
+
+config.json fixes official_weight/social_weight and the severity weights.
+This script measures how much the metric scores and rankings depend on those
+choices by re-scoring every metric over a grid of thousands of weight
+combinations in a single matrix operation.
+
+The social score is linear in the severity weights:
+
+    social = sum_level(w_level * E_level) / sum_level(E_level) * 100
+
+where E_level is the summed log10 engagement of a metric's entries at that
+level. Those per-level sums come straight from the materialized aggregates
+(aggregates.py), so evaluating the whole grid is one (metrics x levels) @
+(levels x combos) product, fast enough to run on every methodology change.
+
+Usage:
+    python weight_sensitivity.py
+    python weight_sensitivity.py --steps 12 --json sensitivity.json
+"""
+
+import argparse
+import json
+import os
+import time
+from datetime import datetime
+
+import numpy as np
+
+# Change to script directory
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+os.chdir(SCRIPT_DIR)
+
+import aggregates
+from data_utils import load_fred_scores
+
+with open('config.json', 'r') as f:
+    CONFIG = json.load(f)
+
+METRICS = CONFIG['metrics']
+SEVERITY_WEIGHTS = CONFIG['severity_weights']
+OFFICIAL_WEIGHT = CONFIG['formula']['official_weight']
+
+# Severity levels in matrix column order. Categories without a LEVEL_ prefix
+# fall back to 0.33 in the scorers, which is the L1 weight, so they count as L1.
+LEVELS = ('L1', 'L2', 'L3')
+
+# Default search ranges (inclusive) for each free parameter
+GRID_RANGES = {
+    'L1': (0.1, 0.5),
+    'L2': (0.4, 0.9),
+    'L3': (0.8, 1.0),
+    'official_weight': (0.2, 0.6),
+}
+
+
+def level_of(category):
+    """Map a category string (LEVEL_2_FRUSTRATED, ...) to L1/L2/L3."""
+    if 'LEVEL_3' in category:
+        return 'L3'
+    if 'LEVEL_2' in category:
+        return 'L2'
+    return 'L1'
+
+
+def load_level_sums():
+    """Per-metric log10 engagement sums by severity level, from the aggregates."""
+    aggregates.refresh()
+    level_sums = {}
+    for metric in METRICS:
+        aggregate = aggregates.load_metric(metric['slug'])
+        sums = {level: 0.0 for level in LEVELS}
+        for platform in aggregates.SCORED_PLATFORMS:
+            entry = aggregates.latest_entry(aggregate, platform)
+            if not entry:
+                continue
+            for category, level in entry['levels'].items():
+                sums[level_of(category)] += level['log_engagement']
+        level_sums[metric['slug']] = sums
+    return level_sums
+
+
+def build_grid(steps):
+    """All monotone (L1 < L2 < L3) severity weights x official weight combinations.
+
+    Returns (severity, official) where severity is a (levels x combos) matrix
+    and official is a (combos,) vector of official weights.
+    """
+    axes = [np.linspace(*GRID_RANGES[name], steps)
+            for name in ('L1', 'L2', 'L3', 'official_weight')]
+    l1, l2, l3, official = (a.ravel() for a in np.meshgrid(*axes, indexing='ij'))
+    keep = (l1 < l2) & (l2 < l3)
+    severity = np.vstack([l1[keep], l2[keep], l3[keep]])
+    return severity, official[keep]
+
+
+def evaluate(engagement, official_scores, severity, official_weight):
+    """Final scores for every metric under every weight combination.
+
+    engagement:      (metrics x levels) summed log10 engagement per level
+    official_scores: (metrics,) official component per metric
+    severity:        (levels x combos) severity weights
+    official_weight: (combos,) official weight; social weight is 1 - official
+    Returns a (metrics x combos) matrix of final scores.
+    """
+    totals = engagement.sum(axis=1, keepdims=True)
+    totals[totals == 0] = 1
+    social = (engagement @ severity) / totals * 100
+    return official_scores[:, None] * official_weight + social * (1 - official_weight)
+
+
+def ranks_of(scores):
+    """Rank metrics per column (1 = highest score)."""
+    order = np.argsort(-scores, axis=0, kind='stable')
+    ranks = np.empty_like(order)
+    rows = np.arange(scores.shape[0])[:, None]
+    ranks[order, np.arange(scores.shape[1])] = rows + 1
+    return ranks
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Weight sensitivity analysis.')
+    parser.add_argument('--steps', type=int, default=10,
+                        help='grid points per weight (default 10)')
+    parser.add_argument('--json', metavar='PATH',
+                        help='also write the tables to a JSON file')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("WEIGHT SENSITIVITY ANALYSIS")
+    print(f"Run time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 80)
+
+    level_sums = load_level_sums()
+    fred_scores = load_fred_scores()
+
+    names = [m['name'] for m in METRICS]
+    engagement = np.array([[level_sums[m['slug']][level] for level in LEVELS] for m in METRICS])
+    official_scores = np.array([fred_scores.get(m['slug'], m['official_score']) for m in METRICS])
+
+    baseline_severity = np.array([[SEVERITY_WEIGHTS['LEVEL_1_AWARE']],
+                                  [SEVERITY_WEIGHTS['LEVEL_2_STRUGGLING']],
+                                  [SEVERITY_WEIGHTS['LEVEL_3_CRISIS']]])
+    baseline = evaluate(engagement, official_scores, baseline_severity,
+                        np.array([OFFICIAL_WEIGHT]))[:, 0]
+    baseline_ranks = ranks_of(baseline[:, None])[:, 0]
+
+    severity, official_weight = build_grid(args.steps)
+    started = time.perf_counter()
+    scores = evaluate(engagement, official_scores, severity, official_weight)
+    ranks = ranks_of(scores)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    n = len(names)
+    combos = scores.shape[1]
+    # Spearman correlation of each combination's ranking with the baseline
+    rank_diff = ranks - baseline_ranks[:, None]
+    spearman = 1 - 6 * (rank_diff ** 2).sum(axis=0) / (n * (n ** 2 - 1))
+
+    print(f"\nEvaluated {combos:,} weight combinations x {n} metrics in {elapsed_ms:.1f} ms")
+    print("Grid: " + ", ".join(f"{k} {lo}-{hi}" for k, (lo, hi) in GRID_RANGES.items())
+          + f", {args.steps} steps each, L1 < L2 < L3")
+
+    print("\n" + "=" * 80)
+    print("RANK STABILITY")
+    print("=" * 80)
+    print(f"{'Metric':25} {'Base':>5} {'Same %':>7} {'Best':>5} {'Worst':>6}")
+    rank_table = []
+    for i, name in enumerate(names):
+        same = float((ranks[i] == baseline_ranks[i]).mean() * 100)
+        row = {
+            'metric': name,
+            'baseline_rank': int(baseline_ranks[i]),
+            'same_rank_pct': round(same, 1),
+            'best_rank': int(ranks[i].min()),
+            'worst_rank': int(ranks[i].max()),
+        }
+        rank_table.append(row)
+        print(f"{name:25} {row['baseline_rank']:>5} {same:>6.1f}% {row['best_rank']:>5} {row['worst_rank']:>6}")
+    print(f"\nRank correlation with baseline (Spearman): "
+          f"min {spearman.min():.3f}, median {np.median(spearman):.3f}")
+
+    print("\n" + "=" * 80)
+    print("SCORE RANGE")
+    print("=" * 80)
+    print(f"{'Metric':25} {'Base':>6} {'Min':>6} {'P5':>6} {'Median':>7} {'P95':>6} {'Max':>6}")
+    p5, median, p95 = np.percentile(scores, [5, 50, 95], axis=1)
+    score_table = []
+    for i, name in enumerate(names):
+        row = {
+            'metric': name,
+            'baseline': round(float(baseline[i]), 2),
+            'min': round(float(scores[i].min()), 2),
+            'p5': round(float(p5[i]), 2),
+            'median': round(float(median[i]), 2),
+            'p95': round(float(p95[i]), 2),
+            'max': round(float(scores[i].max()), 2),
+        }
+        score_table.append(row)
+        print(f"{name:25} {row['baseline']:>6.2f} {row['min']:>6.2f} {row['p5']:>6.2f} "
+              f"{row['median']:>7.2f} {row['p95']:>6.2f} {row['max']:>6.2f}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                'generated_at': datetime.now().isoformat(timespec='seconds'),
+                'combinations': combos,
+                'grid': {k: list(v) for k, v in GRID_RANGES.items()},
+                'steps': args.steps,
+                'spearman_min': round(float(spearman.min()), 4),
+                'spearman_median': round(float(np.median(spearman)), 4),
+                'rank_stability': rank_table,
+                'score_range': score_table,
+            }, f, indent=2)
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+YouTube Comment Sampler - All Metrics
+
+The video collectors classify only a title and the start of a description,
+while the plainest crisis signals are often in the comments. For each metric
+this samples the top comment threads (commentThreads.list, most relevant
+first) of the most-viewed videos in its latest YouTube snapshot, classifies
+every comment with that metric's own rules (youtube_collector_base), and
+writes collected-data/<slug>_youtube_comments_<ts>.csv. The files are
+aggregated as their own platform and reported beside the score (a comment
+crisis ratio per metric), not in it: many comments share one video. The
+videos are already on-topic, so required_keywords are not applied to their
+comments.
+
+One commentThreads.list call (1 quota unit) per video, run on a small thread
+pool, capped by youtube_comments.max_units (config.json) and the day's quota
+allowance. Videos are taken round-robin across metrics, so a cap trims every
+metric evenly.
+
+Usage:
+    python youtube-comments-collector.py
+"""
+
+import csv
+import itertools
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+import youtube_quota
+from aggregates import safe_ingest_file
+from data_utils import get_latest_file
+from pipeline_status import track_run
+from streaming_csv import StreamingCsvWriter
+from youtube_client import fetch_comment_threads, get_client, get_thread_client
+from youtube_collector_base import categorize_video, metric_rules
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+with open(os.path.join(SCRIPT_DIR, 'config.json'), 'r') as f:
+    CONFIG = json.load(f)
+
+COMMENT_CONFIG = CONFIG['youtube_comments']
+METRICS = {m['slug']: m['name'] for m in CONFIG['metrics']}
+
+COLLECTOR = 'youtube-comments-collector'
+
+FIELDNAMES = [
+    'comment_id', 'video_id', 'url', 'video_title', 'text', 'published_date',
+    'like_count', 'reply_count', 'crisis_keywords', 'category',
+]
+
+# Characters of comment text kept
+TEXT_LIMIT = 500
+
+
+def top_videos(metric_slug, count):
+    """The most-viewed videos of a metric's latest YouTube snapshot, skipping ones without comments."""
+    path = get_latest_file(f'collected-data/{metric_slug}_youtube_[0-9]*.csv')
+    if path is None:
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        # Older snapshots have no comment_count; those videos are tried anyway
+        rows = [row for row in csv.DictReader(f)
+                if row.get('video_id') and row.get('comment_count') != '0']
+    rows.sort(key=lambda row: int(row.get('view_count') or 0), reverse=True)
+    return rows[:count]
+
+
+def sample_comments(video, rules, max_threads, stop):
+    """Fetch and classify one video's top comments. Runs on a worker thread."""
+    if stop.is_set():
+        return []
+    video_id = video['video_id']
+    rows = []
+    for comment in fetch_comment_threads(get_thread_client(), video_id, max_threads):
+        text = ' '.join(comment['text'].split())[:TEXT_LIMIT]
+        category, keywords = categorize_video(text, '', rules)
+        if category is None:
+            continue
+        rows.append({
+            'comment_id': comment['id'],
+            'video_id': video_id,
+            'url': f"https://www.youtube.com/watch?v={video_id}&lc={comment['id']}",
+            'video_title': video.get('title', ''),
+            'text': text,
+            'published_date': comment['published_at'][:10],
+            'like_count': comment['like_count'],
+            'reply_count': comment['reply_count'],
+            'crisis_keywords': ', '.join(keywords[:5]),
+            'category': category,
+        })
+    return rows
+
+
+def write_csv(metric_slug, rows):
+    """Write a metric's comments. Returns the writer, which holds the category counts."""
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    filename = f'collected-data/{metric_slug}_youtube_comments_{timestamp}.csv'
+    with StreamingCsvWriter(filename, FIELDNAMES, id_field='comment_id') as writer:
+        writer.writerows(rows)
+    if writer.saved:
+        safe_ingest_file(filename)
+    return writer
+
+
+def main():
+    print("=" * 70)
+    print("YOUTUBE COMMENT SAMPLER - ALL ABSURDITY INDEX METRICS")
+    print("=" * 70)
+
+    if get_client() is None:
+        print("\nFATAL: YOUTUBE_API_KEY not set. Exiting.")
+        print("  Add it to .env: YOUTUBE_API_KEY=your_key_here")
+        sys.exit(1)
+
+    videos = {slug: top_videos(slug, COMMENT_CONFIG['videos_per_metric']) for slug in METRICS}
+    # Round-robin across metrics, so the quota cap trims every metric evenly
+    rounds = itertools.zip_longest(*([(slug, video) for video in metric_videos]
+                                     for slug, metric_videos in videos.items()))
+    jobs = [job for jobs in rounds for job in jobs if job]
+
+    calls = min(len(jobs), COMMENT_CONFIG['max_units'])
+    quota = youtube_quota.plan_units(COLLECTOR, calls)
+    jobs = jobs[:quota.units // youtube_quota.UNIT_COSTS['youtube.commentThreads']]
+    print(f"Sampling comments of {len(jobs)} videos with {COMMENT_CONFIG['workers']} workers")
+
+    rules = {slug: dict(metric_rules(slug), required_keywords=[]) for slug in METRICS}
+    results = {}
+    stop = threading.Event()
+    with ThreadPoolExecutor(max_workers=COMMENT_CONFIG['workers']) as pool:
+        futures = {
+            pool.submit(sample_comments, video, rules[slug],
+                        COMMENT_CONFIG['threads_per_video'], stop): (index, slug, video)
+            for index, (slug, video) in enumerate(jobs)
+        }
+        for future in as_completed(futures):
+            index, slug, video = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                if youtube_quota.is_quota_error(e):
+                    if not stop.is_set():
+                        stop.set()
+                        youtube_quota.mark_exhausted()
+                        print("  Daily YouTube quota exhausted; stopping.")
+                    continue
+                # Most often comments are disabled on the video
+                print(f"  ✗ No comments for {video['video_id']} ({slug}): {e}")
+
+    # Rows in job order, so files do not depend on thread timing
+    rows_by_metric = {slug: [] for slug in METRICS}
+    for index, (slug, _) in enumerate(jobs):
+        rows_by_metric[slug].extend(results.get(index, []))
+
+    print(f"\n{'=' * 70}")
+    print("COLLECTION SUMMARY")
+    print(f"{'=' * 70}")
+    grand_total = 0
+    for slug, rows in rows_by_metric.items():
+        if not rows:
+            print(f"  {slug:<25}     0 comments  (no data)")
+            continue
+        writer = write_csv(slug, rows)
+        total = writer.written
+        grand_total += total
+        level_3 = writer.counts.get('LEVEL_3_CRISIS', 0)
+        level_2 = sum(count for category, count in writer.counts.items()
+                      if category.startswith('LEVEL_2'))
+        print(f"  {slug:<25} {total:>5} comments  (L3 {level_3/total*100:.1f}%, "
+              f"L2 {level_2/total*100:.1f}%)")
+
+    print(f"\n  Grand total: {grand_total} comments for {quota.spent} quota units")
+    print(f"{'=' * 70}")
+
+
+if __name__ == "__main__":
+    with track_run(COLLECTOR, 'youtube_comments'):
+        main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+On-disk caches of YouTube API responses shared by every YouTube-based collector.
+
+Videos: the same videos turn up under several metrics and in the TikTok
+compilation collector. youtube_client.fetch_videos looks each ID up first and
+only sends the misses to videos.list, so a video fetched once costs no quota
+again until its entry expires:
+
+    .cache/youtube_videos.json
+    {"<video id>": {"fetched_at": 1767000000, "used_at": 1767003600,
+                    "parts": ["snippet", "statistics"], "item": {...}}, ...}
+
+A video entry answers a request if it holds every requested part and is
+younger than youtube_cache.video_ttl_hours (config.json).
+
+Searches: search terms are fixed, so rerunning a collector the same day (after
+a crash, or while tuning keywords) would repeat every 100-unit search.list.
+youtube_client.search_videos replays a cached result page instead:
+
+    .cache/youtube_searches.json
+    {"<key>": {"fetched_at": ..., "used_at": ..., "items": [...]}, ...}
+
+The key is the query plus every search option (region, language, order,
+page size), with publishedAfter cut to its date, so a rolling "last 90 days"
+window still matches all day. Entries expire after
+youtube_cache.search_ttl_hours.
+
+Each file keeps at most max_videos / max_searches entries, dropping the least
+recently used. CI restores and saves the .cache directory between runs
+(actions/cache), so reruns and nearby runs share it.
+
+Usage:
+    python youtube_cache.py          # entries, fresh entries, file sizes
+    python youtube_cache.py --clear
+"""
+
+import argparse
+import json
+import os
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(SCRIPT_DIR, '.cache')
+VIDEO_CACHE_FILE = os.path.join(CACHE_DIR, 'youtube_videos.json')
+SEARCH_CACHE_FILE = os.path.join(CACHE_DIR, 'youtube_searches.json')
+
+with open(os.path.join(SCRIPT_DIR, 'config.json'), 'r') as f:
+    CACHE_CONFIG = json.load(f)['youtube_cache']
+
+
+class _CacheFile:
+    """Key -> entry JSON file with expiry by fetched_at and an LRU size bound."""
+
+    def __init__(self, path, ttl_hours, max_entries):
+        self.path = path
+        self.ttl = ttl_hours * 3600
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _lookup(self, key, max_age=None):
+        """The entry for key if younger than max_age (default: the TTL), else None."""
+        entry = self._entries.get(key)
+        max_age = self.ttl if max_age is None else max_age
+        now = time.time()
+        if entry is None or now - entry['fetched_at'] > max_age:
+            return None
+        entry['used_at'] = int(now)
+        self._dirty = True
+        return entry
+
+    def _store(self, key, entry):
+        now = int(time.time())
+        entry['fetched_at'] = now
+        entry['used_at'] = now
+        self._entries[key] = entry
+        self._dirty = True
+
+    def save(self):
+        """Write the cache if it changed, evicting the least recently used beyond max_entries."""
+        if not self._dirty:
+            return
+        if len(self._entries) > self.max_entries:
+            keep = sorted(self._entries, key=lambda key: self._entries[key]['used_at'],
+                          reverse=True)[:self.max_entries]
+            self._entries = {key: self._entries[key] for key in keep}
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._entries, f, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def fresh_count(self):
+        now = time.time()
+        return sum(1 for entry in self._entries.values() if now - entry['fetched_at'] <= self.ttl)
+
+
+class VideoCache(_CacheFile):
+    """Video ID -> cached videos.list resource."""
+
+    def __init__(self, path=VIDEO_CACHE_FILE, ttl_hours=None, max_entries=None):
+        super().__init__(path, ttl_hours or CACHE_CONFIG['video_ttl_hours'],
+                         max_entries or CACHE_CONFIG['max_videos'])
+
+    def get(self, video_id, parts, max_age=None):
+        """The cached resource if it has all `parts` and is fresh, else None."""
+        entry = self._lookup(video_id, max_age)
+        if entry is None or not set(parts) <= set(entry['parts']):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry['item']
+
+    def put(self, item, parts):
+        """Store a freshly fetched resource, merged over any parts already cached."""
+        entry = self._entries.get(item['id']) or {'parts': [], 'item': {}}
+        entry['item'].update(item)
+        entry['parts'] = sorted(set(entry['parts']) | set(parts))
+        self._store(item['id'], entry)
+
+
+def search_key(params):
+    """Cache key of a search.list request: every option, publishedAfter cut to its date."""
+    key = dict(params)
+    if key.get('publishedAfter'):
+        key['publishedAfter'] = key['publishedAfter'][:10]
+    return json.dumps(key, sort_keys=True)
+
+
+class SearchCache(_CacheFile):
+    """search.list request -> cached result items."""
+
+    def __init__(self, path=SEARCH_CACHE_FILE, ttl_hours=None, max_entries=None):
+        super().__init__(path, ttl_hours or CACHE_CONFIG['search_ttl_hours'],
+                         max_entries or CACHE_CONFIG['max_searches'])
+
+    def get(self, params):
+        """Cached result items for a search request, or None."""
+        entry = self._lookup(search_key(params))
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry['items']
+
+    def put(self, params, items):
+        self._store(search_key(params), {'items': items})
+
+    def has(self, params):
+        """Whether a fresh result for this request is cached (not counted as a hit)."""
+        entry = self._entries.get(search_key(params))
+        return entry is not None and time.time() - entry['fetched_at'] <= self.ttl
+
+
+# The process-wide caches, loaded on first use
+_video_cache = None
+_search_cache = None
+
+
+def get_video_cache():
+    """The shared video cache for this process."""
+    global _video_cache
+    if _video_cache is None:
+        _video_cache = VideoCache()
+    return _video_cache
+
+
+def get_search_cache():
+    """The shared search cache for this process."""
+    global _search_cache
+    if _search_cache is None:
+        _search_cache = SearchCache()
+    return _search_cache
+
+
+def main():
+    parser = argparse.ArgumentParser(description='YouTube API response caches')
+    parser.add_argument('--clear', action='store_true', help='delete the cache files')
+    args = parser.parse_args()
+
+    for name, cache in (('videos', get_video_cache()), ('searches', get_search_cache())):
+        if args.clear:
+            if os.path.exists(cache.path):
+                os.remove(cache.path)
+            print(f"Cleared {cache.path}")
+            continue
+        size = os.path.getsize(cache.path) if os.path.exists(cache.path) else 0
+        print(f"{name:9} {len(cache):6} cached ({cache.fresh_count()} fresh, "
+              f"TTL {cache.ttl // 3600}h, max {cache.max_entries}), {size / 1024:.0f} KB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Shared YouTube Data API helpers for the collectors.
+
+get_client() builds the API client once per process; every collector in the
+process shares it. Clients are built from the discovery document bundled with
+google-api-python-client, parsed once per process (_discovery_document), so
+building never fetches or re-parses it: the worker-thread clients of
+get_thread_client() cost well under a millisecond each.
+
+videos.list accepts up to 50 comma-separated IDs and costs one quota unit per
+call however many IDs it carries, so statistics for a whole search page are
+fetched in one request instead of one request per hit. Videos already in the
+on-disk cache (youtube_cache.py) are not requested at all, and a search
+already made today is replayed from the cache.
+
+Every request carries a `fields` projection (partial response) naming just
+what the collectors read, so thumbnails, localizations, tags and unused
+statistics are neither sent nor decoded. The projections are defined here
+only; a collector that needs another field adds it below (cached videos keep
+the projection they were fetched with, so clear the cache after adding one:
+python youtube_cache.py --clear).
+"""
+
+import json
+import os
+import threading
+
+from dotenv import load_dotenv
+
+from youtube_cache import get_search_cache, get_video_cache
+from youtube_quota import charge
+
+load_dotenv()
+
+# Most IDs videos.list accepts in one call
+MAX_IDS_PER_CALL = 50
+
+# Partial-response projections: the fields the collectors read, and no others
+SEARCH_FIELDS = 'items(id/videoId,snippet(title,description,publishedAt))'
+VIDEO_PART_FIELDS = {
+    'snippet': 'snippet(title,description,channelTitle,publishedAt)',
+    'statistics': 'statistics(viewCount,likeCount,commentCount)',
+}
+COMMENT_THREAD_FIELDS = ('items(id,snippet(totalReplyCount,'
+                         'topLevelComment/snippet(textDisplay,likeCount,publishedAt)))')
+
+# Most threads commentThreads.list returns in one call
+MAX_THREADS_PER_CALL = 100
+
+# The process-wide client, built on first use
+_client = None
+
+# Clients for worker threads: API clients are not thread-safe
+_thread_local = threading.local()
+
+# The parsed static discovery document, loaded on first build
+_discovery = None
+_discovery_lock = threading.Lock()
+
+
+def _discovery_document():
+    """The YouTube Data API v3 discovery document bundled with the client library, parsed once."""
+    global _discovery
+    with _discovery_lock:
+        if _discovery is None:
+            from googleapiclient.discovery_cache import get_static_doc
+            _discovery = json.loads(get_static_doc('youtube', 'v3'))
+    return _discovery
+
+
+def _build_client():
+    api_key = os.getenv('YOUTUBE_API_KEY')
+    if not api_key:
+        return None
+    from googleapiclient.discovery import build_from_document
+    return build_from_document(_discovery_document(), developerKey=api_key)
+
+
+def get_client():
+    """The shared YouTube API client, or None if YOUTUBE_API_KEY is not set."""
+    global _client
+    if _client is None:
+        _client = _build_client()
+    return _client
+
+
+def get_thread_client():
+    """A YouTube API client of the calling thread's own, for concurrent requests."""
+    if getattr(_thread_local, 'client', None) is None:
+        _thread_local.client = _build_client()
+    return _thread_local.client
+
+
+def video_fields(parts):
+    """videos.list `fields` projection for a list of parts."""
+    return 'items(id,' + ','.join(VIDEO_PART_FIELDS[p] for p in parts) + ')'
+
+
+def _search_request(params):
+    # The projection is part of the cache key, so changing it refetches
+    return dict(params, fields=SEARCH_FIELDS)
+
+
+def search_cached(**params):
+    """Whether search_videos would replay this request from the cache."""
+    return get_search_cache().has(_search_request(params))
+
+
+def search_videos(youtube, **params):
+    """search.list result items for one request, replayed from the search cache when fresh."""
+    params = _search_request(params)
+    cache = get_search_cache()
+    items = cache.get(params)
+    if items is None:
+        charge('youtube.search')
+        items = youtube.search().list(**params).execute().get('items', [])
+        cache.put(params, items)
+        cache.save()
+    return items
+
+
+def fetch_videos(youtube, video_ids, part='statistics', max_age=None):
+    """videos.list for any number of IDs, 50 per call: {video_id: resource}.
+
+    IDs with a cached resource younger than max_age seconds (default: the
+    cache TTL) are answered from the cache; only the rest are requested.
+    Duplicate IDs are fetched once; IDs the API does not return (deleted or
+    private videos) are missing from the result.
+    """
+    cache = get_video_cache()
+    parts = part.split(',')
+    videos = {}
+    missing = []
+    for video_id in dict.fromkeys(video_ids):
+        item = cache.get(video_id, parts, max_age)
+        if item is None:
+            missing.append(video_id)
+        else:
+            videos[video_id] = item
+
+    try:
+        for start in range(0, len(missing), MAX_IDS_PER_CALL):
+            batch = missing[start:start + MAX_IDS_PER_CALL]
+            charge('youtube.videos')
+            response = youtube.videos().list(
+                part=part,
+                id=','.join(batch),
+                fields=video_fields(parts)
+            ).execute()
+            for item in response.get('items', []):
+                cache.put(item, parts)
+                videos[item['id']] = item
+    finally:
+        cache.save()
+    return videos
+
+
+def fetch_comment_threads(youtube, video_id, max_results=20):
+    """Top-level comments of a video's most relevant threads: [comment dict, ...].
+
+    Each dict has id, text, like_count, reply_count and published_at.
+    """
+    charge('youtube.commentThreads')
+    response = youtube.commentThreads().list(
+        part='snippet',
+        videoId=video_id,
+        maxResults=min(max_results, MAX_THREADS_PER_CALL),
+        order='relevance',
+        textFormat='plainText',
+        fields=COMMENT_THREAD_FIELDS
+    ).execute()
+    comments = []
+    for thread in response.get('items', []):
+        snippet = thread['snippet']['topLevelComment']['snippet']
+        comments.append({
+            'id': thread['id'],
+            'text': snippet.get('textDisplay', ''),
+            'like_count': int(snippet.get('likeCount', 0)),
+            'reply_count': int(thread['snippet'].get('totalReplyCount', 0)),
+            'published_at': snippet.get('publishedAt', ''),
+        })
+    return comments
+
+
+def fetch_video_statistics(youtube, video_ids, max_age=None):
+    """Statistics for many videos in batched calls: {video_id: statistics dict}."""
+    return {video_id: item.get('statistics', {})
+            for video_id, item in fetch_videos(youtube, video_ids, max_age=max_age).items()}
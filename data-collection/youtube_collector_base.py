@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Shared collection logic for YouTube metric collectors.
+
+Each per-metric collector defines its own constants (search terms and
+classification rules) and calls run_collection() from this module, which
+searches every term with the shared client (youtube_client.get_client),
+classifies each hit, fetches statistics for a page's new videos in one
+batched call, and streams unique rows straight to the output CSV
+(streaming_csv.StreamingCsvWriter, which also keeps the summary's level
+counts and most-viewed videos, so rows are never held in memory). Searches
+run within the collector's share of the day's API quota (youtube_quota.plan),
+which may drop its lowest-yield terms.
+
+Classification rules are a dict; anything left out takes DEFAULT_RULES:
+
+    required_keywords   at least one must appear, else the video is off-topic
+    level_3_keywords    LEVEL_3 if level_3_threshold or more of these appear...
+    level_3_phrases     ...or any one of these
+    level_2_keywords    likewise for level 2
+    level_2_phrases
+    level_2_category    category name for level 2 (LEVEL_2_STRUGGLING, ...)
+    level_1_category    category name for level 1 (LEVEL_1_AWARE, ...)
+"""
+
+import os
+import runpy
+import sys
+from datetime import datetime, timedelta
+
+import youtube_quota
+from aggregates import safe_ingest_file
+from content_filters import filter_content
+from pipeline_status import track_run
+from streaming_csv import StreamingCsvWriter
+from youtube_cache import get_search_cache, get_video_cache
+from youtube_client import fetch_video_statistics, get_client, search_cached, search_videos
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_RULES = {
+    'required_keywords': [],
+    'level_3_keywords': [],
+    'level_3_phrases': [],
+    'level_3_threshold': 2,
+    'level_2_keywords': [],
+    'level_2_phrases': [],
+    'level_2_threshold': 2,
+    'level_2_category': 'LEVEL_2_STRUGGLING',
+    'level_1_category': 'LEVEL_1_AWARE',
+}
+
+# Region/language options for search.list; a metric can pass its own
+DEFAULT_SEARCH_OPTIONS = {'order': 'relevance', 'regionCode': 'US'}
+
+FIELDNAMES = [
+    'search_term', 'video_id', 'url', 'title', 'description_snippet',
+    'published_date', 'view_count', 'comment_count', 'crisis_keywords',
+    'category', 'notes',
+]
+
+# Most-viewed videos listed in the run summary
+TOP_VIDEOS = 5
+
+
+def metric_rules(metric_slug):
+    """A metric collector's RULES, with DEFAULT_RULES filled in."""
+    script = os.path.join(SCRIPT_DIR, f"{metric_slug.replace('_', '-')}-youtube-collector.py")
+    return dict(DEFAULT_RULES, **runpy.run_path(script)['RULES'])
+
+
+def categorize_video(title, description, rules):
+    """Categorize a video into Level 1/2/3, or None if off-topic or filtered.
+
+    Returns (category, matched keywords).
+    """
+    text = (title + " " + description).lower()
+
+    if rules['required_keywords'] and not any(kw in text for kw in rules['required_keywords']):
+        return None, []
+
+    # Filter out clickbait/promotional content
+    if not filter_content(title, description):
+        return None, []
+
+    terms = dict.fromkeys(rules['level_3_keywords'] + rules['level_3_phrases']
+                          + rules['level_2_keywords'] + rules['level_2_phrases'])
+    found = [kw for kw in terms if kw in text]
+
+    level_3_count = sum(1 for kw in rules['level_3_keywords'] if kw in text)
+    if level_3_count >= rules['level_3_threshold'] or any(p in text for p in rules['level_3_phrases']):
+        return 'LEVEL_3_CRISIS', found
+
+    level_2_count = sum(1 for kw in rules['level_2_keywords'] if kw in text)
+    if level_2_count >= rules['level_2_threshold'] or any(p in text for p in rules['level_2_phrases']):
+        return rules['level_2_category'], found
+
+    return rules['level_1_category'], found
+
+
+def search_params(query, max_results, published_after, search_options):
+    """search.list parameters for one term."""
+    params = {
+        'q': query,
+        'type': 'video',
+        'part': 'id,snippet',
+        'maxResults': max_results,
+    }
+    if published_after:
+        params['publishedAfter'] = published_after
+    params.update(search_options)
+    return params
+
+
+def search_youtube(youtube, query, max_results, published_after, search_options):
+    """One search.list page for a query: [search result item, ...]."""
+    return search_videos(youtube, **search_params(query, max_results, published_after, search_options))
+
+
+def collect_term(youtube, query, rules, written, max_results, published_after, search_options):
+    """Search one term and return rows for new, on-topic videos, with statistics.
+
+    `written` holds the video IDs already written this run (a
+    StreamingCsvWriter); their statistics are not fetched again.
+    Returns (rows, on-topic hits including videos already seen this run).
+    """
+    items = search_youtube(youtube, query, max_results, published_after, search_options)
+
+    candidates = []
+    page_ids = set()
+    hits = 0
+    for item in items:
+        video_id = item['id']['videoId']
+        snippet = item['snippet']
+        title = snippet.get('title', '')
+        description = snippet.get('description', '')
+
+        category, keywords = categorize_video(title, description, rules)
+        if category is None:
+            continue
+        hits += 1
+        # Same video from an earlier search term
+        if video_id in written or video_id in page_ids:
+            continue
+        page_ids.add(video_id)
+
+        candidates.append({
+            'search_term': query,
+            'video_id': video_id,
+            'url': f'https://www.youtube.com/watch?v={video_id}',
+            'title': title,
+            'description_snippet': description[:200],
+            'published_date': snippet.get('publishedAt', '')[:10],
+            'view_count': 0,
+            'comment_count': 0,
+            'crisis_keywords': ', '.join(keywords[:5]),
+            'category': category,
+            'notes': '',
+        })
+
+    # One batched statistics call for the page's new videos
+    statistics = fetch_video_statistics(youtube, [row['video_id'] for row in candidates])
+    for row in candidates:
+        stats = statistics.get(row['video_id'], {})
+        row['view_count'] = int(stats.get('viewCount', 0))
+        row['comment_count'] = int(stats.get('commentCount', 0))
+
+    return candidates, hits
+
+
+def run_collection(metric_slug, banner, search_terms, rules, max_results=10,
+                   published_within_days=90, search_options=None):
+    """Run the full collection pipeline for a single metric."""
+    collector = f"{metric_slug.replace('_', '-')}-youtube-collector"
+    with track_run(collector, 'youtube'):
+        _run_collection(collector, metric_slug, banner, search_terms, dict(DEFAULT_RULES, **rules),
+                        max_results, published_within_days,
+                        DEFAULT_SEARCH_OPTIONS if search_options is None else search_options)
+
+
+def _run_collection(collector, metric_slug, banner, search_terms, rules, max_results,
+                    published_within_days, search_options):
+    print("=" * 70)
+    print(f"{banner} YOUTUBE VIDEO COLLECTOR")
+    print("=" * 70)
+
+    youtube = get_client()
+    if youtube is None:
+        print("\nFATAL: YOUTUBE_API_KEY not set. Exiting.")
+        print("  Add it to .env: YOUTUBE_API_KEY=your_key_here")
+        sys.exit(1)
+
+    published_after = None
+    if published_within_days:
+        published_after = (datetime.now() - timedelta(days=published_within_days)).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    cached_terms = [term for term in search_terms
+                    if search_cached(**search_params(term, max_results, published_after, search_options))]
+    quota = youtube_quota.plan(collector, search_terms, cached_terms=cached_terms)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    os.makedirs('collected-data', exist_ok=True)
+    output_file = f"collected-data/{metric_slug}_youtube_{timestamp}.csv"
+    total_hits = 0
+
+    # Rows go to disk as each term finishes; the file only appears if any were written
+    with StreamingCsvWriter(output_file, FIELDNAMES, rank_field='view_count',
+                            top_k=TOP_VIDEOS) as writer:
+        for term in quota.terms:
+            if not quota.can_afford(term):
+                print(f"\nQuota allowance used up; skipping remaining terms from '{term}'")
+                break
+            print(f"\nSearching: {term}")
+            try:
+                rows, hits = collect_term(youtube, term, rules, writer, max_results,
+                                          published_after, search_options)
+            except Exception as e:
+                print(f"  ✗ Error searching for '{term}': {e}")
+                if youtube_quota.is_quota_error(e):
+                    quota.mark_exhausted()
+                    print("  Daily YouTube quota exhausted; stopping.")
+                    break
+                continue
+            quota.record_yield(term, len(rows))
+            total_hits += hits
+            print(f"  ✓ Found {hits} videos for '{term}' ({len(rows)} new)")
+            writer.writerows(rows)
+
+    total = writer.written
+    if total == 0:
+        print("\nWARNING: No videos collected. Skipping file write to preserve previous data.")
+        print("Check your YOUTUBE_API_KEY - it may be expired or invalid.")
+        return
+    safe_ingest_file(output_file)
+
+    level_counts = writer.counts
+    level_3 = level_counts.get('LEVEL_3_CRISIS', 0)
+    level_2 = level_counts.get(rules['level_2_category'], 0)
+    level_1 = level_counts.get(rules['level_1_category'], 0)
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS SAVED: {output_file}")
+    print("=" * 70)
+    print(f"\nTotal videos collected: {total_hits}")
+    print(f"Unique videos (after deduplication): {total}")
+    print(f"  Level 3 (Crisis):  {level_3} ({level_3/total*100:.1f}%)")
+    print(f"  Level 2:           {level_2} ({level_2/total*100:.1f}%)")
+    print(f"  Level 1:           {level_1} ({level_1/total*100:.1f}%)")
+    print(f"  Crisis ratio (L3): {level_3/total*100:.1f}%")
+
+    print(f"\nQuota spent: {quota.spent} units (cache hits: "
+          f"{get_search_cache().hits} searches, {get_video_cache().hits} videos)")
+
+    print(f"\nTOP {TOP_VIDEOS} MOST-VIEWED VIDEOS:")
+    print("-" * 70)
+    for row in writer.top():
+        print(f"\n{row['title']}")
+        print(f"  Views: {row['view_count']:,} | Category: {row['category']}")
+        print(f"  {row['url']}")
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+YouTube Data API quota planner shared by every YouTube-based collector.
+
+All collectors spend one YOUTUBE_API_KEY's daily quota (youtube_quota in
+config.json), which resets at midnight Pacific time. A search.list call costs
+100 units and a videos.list call 1, so a collector's cost is almost entirely
+its number of search terms.
+
+Spend is tracked live in collected-data/youtube_quota.json, a ledger shared by
+the collector processes of a day:
+
+    {"day": "2026-05-04",
+     "exhausted": false,
+     "spent": {"healthcare-youtube-collector": 1012, ...},
+     "demand": {"healthcare-youtube-collector": 1010, ...},
+     "term_yield": {"healthcare-youtube-collector": {"medical bankruptcy": 6.5, ...}}}
+
+Before searching, a collector asks plan() for its allowance: the budget left
+today, shared among the collectors that have not run yet in proportion to
+priority x demand (what each asked for last time). A collector that fits in
+its allowance runs every term. One that does not keeps the terms with the
+best past yield (new videos per search, averaged over runs) and drops the
+rest. So that every metric still collects something, a collector always keeps
+at least one term while any units are left today, even if its share is
+smaller than one search (the reserve absorbs the difference). Terms never
+tried before are kept first. Terms whose search is already in today's search cache
+(youtube_cache.py) cost nothing to replay, so they are always kept and the
+allowance goes to the rest. When the API reports the quota exhausted, the ledger is marked and
+later collectors skip their searches instead of failing one call at a time.
+
+Usage:
+    python youtube_quota.py        # today's spend and per-collector demand
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from data_utils import read_json, write_json
+from pipeline_status import count_api_call
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+LEDGER_FILE = os.path.join(SCRIPT_DIR, 'collected-data', 'youtube_quota.json')
+
+with open(os.path.join(SCRIPT_DIR, 'config.json'), 'r') as f:
+    QUOTA_CONFIG = json.load(f)['youtube_quota']
+
+# Quota units per call (YouTube Data API v3 cost table)
+UNIT_COSTS = {
+    'youtube.search': 100,
+    'youtube.videos': 1,
+    'youtube.commentThreads': 1,
+}
+
+# One search page plus the batched statistics call for its results
+TERM_COST = UNIT_COSTS['youtube.search'] + UNIT_COSTS['youtube.videos']
+
+# Weight of the latest run in a term's averaged yield
+YIELD_SMOOTHING = 0.5
+
+QUOTA_TIMEZONE = ZoneInfo('America/Los_Angeles')
+
+# The plan of the collector running in this process, if any
+_active_plan = None
+
+# Serializes charges from concurrent request threads (one ledger write at a time)
+_charge_lock = threading.Lock()
+
+
+def quota_day():
+    """The current quota day (quota resets at midnight Pacific time)."""
+    return datetime.now(QUOTA_TIMEZONE).date().isoformat()
+
+
+def load_ledger():
+    """Load the ledger, starting a fresh day's spend if the quota has reset."""
+    ledger = read_json(LEDGER_FILE, {})
+    ledger.setdefault('demand', {})
+    ledger.setdefault('term_yield', {})
+    if ledger.get('day') != quota_day():
+        ledger['day'] = quota_day()
+        ledger['spent'] = {}
+        ledger['exhausted'] = False
+    return ledger
+
+
+def _priority(collector):
+    return QUOTA_CONFIG['priority'].get(collector, 1.0)
+
+
+def remaining_units(ledger):
+    """Units left today for collectors, after the reserve."""
+    if ledger['exhausted']:
+        return 0
+    budget = QUOTA_CONFIG['daily_units'] - QUOTA_CONFIG['reserve_units']
+    return max(0, budget - sum(ledger['spent'].values()))
+
+
+def allowance(ledger, collector, demand):
+    """A collector's share of what is left today, never more than it asked for.
+
+    Shared by priority x demand among this collector and those known from
+    earlier runs that have not planned today. Planning records a collector in
+    today's spend (at 0), so one that runs on cached searches alone no longer
+    claims a share.
+    """
+    pending = {name: units for name, units in ledger['demand'].items()
+               if name != collector and name not in ledger['spent']}
+    pending[collector] = demand
+    claims = {name: _priority(name) * units for name, units in pending.items()}
+    total = sum(claims.values())
+    if total <= 0:
+        return 0
+    return min(demand, int(remaining_units(ledger) * claims[collector] / total))
+
+
+class QuotaPlan:
+    """The terms a collector may search today, and its live spend against its allowance."""
+
+    def __init__(self, collector, terms, units, ledger, cached_terms=()):
+        self.collector = collector
+        self.terms = terms
+        self.cached_terms = set(cached_terms)
+        self.units = units
+        self.spent = 0
+        self._ledger = ledger
+
+    def charge(self, endpoint, calls=1):
+        """Record calls made under this plan in the shared ledger."""
+        units = UNIT_COSTS.get(endpoint, 1) * calls
+        self.spent += units
+        spent = self._ledger['spent']
+        spent[self.collector] = spent.get(self.collector, 0) + units
+        write_json(LEDGER_FILE, self._ledger)
+
+    def can_afford(self, term=None, units=TERM_COST):
+        """Whether another `units` fit in the allowance and the day's quota.
+
+        A term with a cached search is always affordable.
+        """
+        if term in self.cached_terms:
+            return True
+        if self._ledger['exhausted']:
+            return False
+        return self.spent + units <= self.units
+
+    def record_yield(self, term, new_rows):
+        """Fold a term's new rows into its averaged yield."""
+        # A search cut short by the quota says nothing about the term
+        if self._ledger['exhausted']:
+            return
+        yields = self._ledger['term_yield'].setdefault(self.collector, {})
+        previous = yields.get(term)
+        if previous is None:
+            yields[term] = float(new_rows)
+        else:
+            yields[term] = round(YIELD_SMOOTHING * new_rows + (1 - YIELD_SMOOTHING) * previous, 2)
+        write_json(LEDGER_FILE, self._ledger)
+
+    def mark_exhausted(self):
+        """The API reported the daily quota used up: later collectors skip their searches."""
+        self._ledger['exhausted'] = True
+        write_json(LEDGER_FILE, self._ledger)
+
+
+def plan(collector, terms, term_cost=TERM_COST, cached_terms=()):
+    """Plan a collector's searches for today and make it the active plan.
+
+    Returns a QuotaPlan whose .terms are the affordable subset of `terms`, in
+    their original order, chosen by past yield. `cached_terms` (searches the
+    search cache can replay) are kept without counting against the allowance.
+    """
+    global _active_plan
+    ledger = load_ledger()
+    cached_terms = set(cached_terms)
+    paid = [i for i, term in enumerate(terms) if term not in cached_terms]
+    # Demand stays the full cost so other days' allowances see the real need
+    ledger['demand'][collector] = len(terms) * term_cost
+    units = allowance(ledger, collector, len(paid) * term_cost)
+
+    affordable = units // term_cost
+    if paid and affordable == 0 and remaining_units(ledger) > 0:
+        # Every metric collects something: one search even on a thin share
+        affordable = 1
+        units = term_cost
+    if affordable >= len(paid):
+        kept = list(terms)
+    else:
+        yields = ledger['term_yield'].get(collector, {})
+        # Untried terms first, then by past yield; ties keep the configured order
+        ranked = sorted(paid, key=lambda i: (terms[i] in yields, -yields.get(terms[i], 0), i))
+        keep = set(ranked[:affordable])
+        kept = [term for i, term in enumerate(terms) if i in keep or term in cached_terms]
+    # Ran today, even if every search comes from the cache
+    ledger['spent'].setdefault(collector, 0)
+    write_json(LEDGER_FILE, ledger)
+
+    print(f"Quota: {units} of {remaining_units(ledger)} units left today "
+          f"({len(kept)} of {len(terms)} search terms, {len(cached_terms)} cached)")
+    dropped = [term for term in terms if term not in kept]
+    if dropped:
+        print(f"  Dropped for quota (lowest yield): {', '.join(dropped)}")
+
+    _active_plan = QuotaPlan(collector, kept, units, ledger, cached_terms)
+    return _active_plan
+
+
+def plan_units(collector, units):
+    """Plan a fixed spend with no search terms (batch jobs) and make it the active plan.
+
+    Returns a QuotaPlan whose .units is the allowance granted out of `units`.
+    """
+    global _active_plan
+    ledger = load_ledger()
+    ledger['demand'][collector] = units
+    allowed = allowance(ledger, collector, units)
+    ledger['spent'].setdefault(collector, 0)
+    write_json(LEDGER_FILE, ledger)
+
+    print(f"Quota: {allowed} of {remaining_units(ledger)} units left today ({units} wanted)")
+    _active_plan = QuotaPlan(collector, [], allowed, ledger)
+    return _active_plan
+
+
+def charge(endpoint, calls=1):
+    """Count API calls for the run catalog and against the active quota plan."""
+    with _charge_lock:
+        count_api_call(endpoint, calls)
+        if _active_plan is not None:
+            _active_plan.charge(endpoint, calls)
+
+
+def mark_exhausted():
+    """Mark the day's quota used up (no-op without an active plan)."""
+    with _charge_lock:
+        if _active_plan is not None:
+            _active_plan.mark_exhausted()
+
+
+def is_quota_error(error):
+    """Whether an API error means the daily quota is used up."""
+    status = getattr(getattr(error, 'resp', None), 'status', None)
+    return status == 403 and 'quota' in str(error).lower()
+
+
+def print_summary():
+    ledger = load_ledger()
+    print("=" * 70)
+    print(f"YOUTUBE QUOTA ({ledger['day']}, {QUOTA_CONFIG['daily_units']} units/day, "
+          f"{QUOTA_CONFIG['reserve_units']} reserved)")
+    print("=" * 70)
+    for collector, demand in sorted(ledger['demand'].items()):
+        spent = ledger['spent'].get(collector)
+        status = f"spent {spent:5}" if spent is not None else "not run    "
+        print(f"  {collector:42} {status}  demand {demand:5}  priority {_priority(collector)}")
+    print(f"\n  Remaining today: {remaining_units(ledger)}"
+          + (" (quota exhausted)" if ledger['exhausted'] else ""))
+
+
+if __name__ == '__main__':
+    print_summary()
@@ -0,0 +1,102 @@
+import { getMetricLabel } from './metricLabels';
+import summaryData from './metricSummary.generated.json';
+import type { MetricDetailData } from './metricDetailData';
+
+/**
+ * Client-side metric data, split so the landing page stays small:
+ * - the summary bundle (scores, trends, card text) is imported statically
+ * - each metric's full detail bundle is fetched only when it is opened
+ * Both are generated by data-collection/metric_data.py.
+ */
+
+export interface MetricSummary {
+  title: string;
+  slug: string;
+  score: number;
+  trend: 'improving' | 'neutral' | 'worsening';
+  dataSources: string[];
+  entryCount: number;
+  lastUpdated: string;
+}
+
+export interface MetricSummaryWithLabel extends MetricSummary {
+  label: string;
+}
+
+export const metricSummaries = summaryData as Record<string, MetricSummary>;
+
+/**
+ * Get all metric summaries with their dynamically calculated labels
+ */
+export function getAllMetricSummariesWithLabels(): Record<string, MetricSummaryWithLabel> {
+  const summariesWithLabels: Record<string, MetricSummaryWithLabel> = {};
+
+  for (const [name, metric] of Object.entries(metricSummaries)) {
+    summariesWithLabels[name] = {
+      ...metric,
+      label: getMetricLabel(name, metric.score)
+    };
+  }
+
+  return summariesWithLabels;
+}
+
+/**
+ * Fetch one metric's full detail bundle (samples, progress, sources)
+ */
+export async function loadMetricDetail(slug: string): Promise<MetricDetailData> {
+  const response = await fetch(`/data/metrics/${slug}.json`);
+  if (!response.ok) {
+    throw new Error(`Failed to load metric details for ${slug}: ${response.status}`);
+  }
+  const data: MetricDetailData = await response.json();
+  return { ...data, label: getMetricLabel(data.title, data.score) };
+}
+
+/**
+ * Calculate the Overall Absurdity Score
+ * Equal-weight average of all metric final scores
+ */
+export function calculateOverallScore(): number {
+  const metrics = Object.values(metricSummaries);
+  const scores = metrics.map(m => m.score);
+  const sum = scores.reduce((a, b) => a + b, 0);
+  return sum / scores.length;
+}
+
+/**
+ * Get the dynamic label for the overall absurdity score
+ */
+export function getOverallLabel(score: number): string {
+  if (score < 20) return "SURPRISINGLY FUNCTIONAL";
+  if (score < 30) return "MINOR TURBULENCE";
+  if (score < 40) return "FLYING TOO CLOSE TO THE SUN";
+  if (score < 50) return "ICARUS HAS ENTERED THE CHAT";
+  if (score < 60) return "THE WHEELS ARE COMING OFF";
+  if (score < 70) return "ACTIVELY ON FIRE";
+  if (score < 80) return "WE'VE REACHED PEAK CIVILIZATION";
+  if (score < 90) return "REALITY.EXE HAS STOPPED WORKING";
+  return "THE GODS ARE LAUGHING AT US";
+}
+
+/**
+ * Get the most recent lastUpdated date from all metrics
+ * Returns formatted string like "JAN 2026"
+ */
+export function getLatestUpdateDate(): string {
+  const metrics = Object.values(metricSummaries);
+
+  // Parse dates and find the most recent
+  const dates = metrics.map(m => {
+    const parsed = new Date(m.lastUpdated);
+    return isNaN(parsed.getTime()) ? new Date(0) : parsed;
+  });
+
+  const latestDate = new Date(Math.max(...dates.map(d => d.getTime())));
+
+  // Format as "JAN 2026"
+  const month = latestDate.toLocaleString('en-US', { month: 'short' }).toUpperCase();
+  const year = latestDate.getFullYear();
+
+  return `${month} ${year}`;
+}
@@ -0,0 +1,41 @@
+import statusData from './pipeline_status.json';
+
+/**
+ * Collector run status, written by data-collection/pipeline_status.py after
+ * every collector run: the latest run per collector plus per-platform rollups.
+ */
+
+export interface CollectorRun {
+  collector: string;
+  platform: string;
+  status: 'ok' | 'empty' | 'failed';
+  error: string | null;
+  started: string;
+  finished: string;
+  duration_s: number;
+  files: number;
+  rows: number;
+  api_calls: Record<string, number>;
+  last_success: string | null;
+  consecutive_failures: number;
+  catalog_offset: number;
+}
+
+export interface PlatformStatus {
+  collectors: number;
+  failures: number;
+  files: number;
+  rows: number;
+  api_calls: number;
+  duration_s: number;
+  last_run: string | null;
+  last_success: string | null;
+}
+
+export interface PipelineStatus {
+  updated: string | null;
+  collectors: Record<string, CollectorRun>;
+  platforms: Record<string, PlatformStatus>;
+}
+
+export const pipelineStatus = statusData as PipelineStatus;